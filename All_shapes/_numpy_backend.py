@@ -0,0 +1,53 @@
+import numpy as np
+
+from All_shapes.backends import PythonBackend
+
+
+def _arrays(xs, ys) -> "tuple":
+    return np.array(xs, dtype=np.float64), np.array(ys, dtype=np.float64)
+
+
+def _edges(x: "np.ndarray", y: "np.ndarray") -> "tuple":
+    """Componentes de la arista que llega a cada vértice desde el anterior."""
+    dx, dy = np.empty_like(x), np.empty_like(y)
+    np.subtract(x[1:], x[:-1], out=dx[1:])
+    np.subtract(y[1:], y[:-1], out=dy[1:])
+    dx[0], dy[0] = x[0] - x[-1], y[0] - y[-1]
+    return dx, dy
+
+
+class NumpyBackend(PythonBackend):
+    """Motor de cálculo vectorizado con NumPy.
+
+    Convertir las listas a arreglos tiene un costo fijo, por lo que los polígonos con
+    menos de min_vertices vértices se siguen calculando en Python puro.
+    """
+
+    name = "numpy"
+    min_vertices = 128
+
+    def perimeter(self, xs, ys):
+        if len(xs) < self.min_vertices:
+            return super().perimeter(xs, ys)
+        return float(np.hypot(*_edges(*_arrays(xs, ys))).sum())
+
+    def signed_area(self, xs, ys):
+        if len(xs) < self.min_vertices:
+            return super().signed_area(xs, ys)
+        x, y = _arrays(xs, ys)
+        return self._signed_area(x, y)
+
+    @staticmethod
+    def _signed_area(x: "np.ndarray", y: "np.ndarray") -> float:
+        doubled_area = np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1])
+        return float(doubled_area + x[-1] * y[0] - x[0] * y[-1]) / 2
+
+    def inner_angles(self, xs, ys):
+        if len(xs) < self.min_vertices:
+            return super().inner_angles(xs, ys)
+        x, y = _arrays(xs, ys)
+        in_x, in_y = _edges(x, y)
+        out_x, out_y = np.roll(in_x, -1), np.roll(in_y, -1)
+        turn = np.degrees(np.arctan2(in_x * out_y - in_y * out_x, in_x * out_x + in_y * out_y))
+        orientation = -1 if self._signed_area(x, y) < 0 else 1
+        return (180 - orientation * turn).tolist()
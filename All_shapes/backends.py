@@ -0,0 +1,94 @@
+from math import atan2, degrees, hypot
+import os
+
+
+class PythonBackend:
+    """Motor de cálculo en Python puro; es el predeterminado porque no necesita
+    importar nada adicional."""
+
+    name = "python"
+
+    def perimeter(self, xs: "list[float]", ys: "list[float]") -> float:
+        """Suma las longitudes de las aristas del polígono cerrado."""
+        total = 0
+        previous_x, previous_y = xs[-1], ys[-1]
+        for x, y in zip(xs, ys):
+            total += hypot(x - previous_x, y - previous_y)
+            previous_x, previous_y = x, y
+        return total
+
+    def signed_area(self, xs: "list[float]", ys: "list[float]") -> float:
+        """Área con signo por la fórmula del cordón de zapato."""
+        doubled_area = 0
+        previous_x, previous_y = xs[-1], ys[-1]
+        for x, y in zip(xs, ys):
+            doubled_area += previous_x * y - x * previous_y
+            previous_x, previous_y = x, y
+        return doubled_area / 2
+
+    def inner_angles(self, xs: "list[float]", ys: "list[float]") -> "list[float]":
+        """Ángulo interno en grados en cada vértice."""
+        orientation = -1 if self.signed_area(xs, ys) < 0 else 1
+        count = len(xs)
+        angles = []
+        for index in range(count):
+            following = (index + 1) % count
+            in_x, in_y = xs[index] - xs[index - 1], ys[index] - ys[index - 1]
+            out_x, out_y = xs[following] - xs[index], ys[following] - ys[index]
+            turn = degrees(atan2(in_x * out_y - in_y * out_x, in_x * out_x + in_y * out_y))
+            angles.append(180 - orientation * turn)
+        return angles
+
+
+# Nombre del motor: (módulo, clase). Los módulos se importan solo al usarlos por
+# primera vez, para que importar geometry siga sin cargar NumPy.
+BACKENDS = {
+    "python": (__name__, "PythonBackend"),
+    "numpy": ("All_shapes._numpy_backend", "NumpyBackend"),
+}
+_instances = {}
+_current = os.environ.get("ALL_SHAPES_BACKEND", "python")
+
+
+def register_backend(name: str, module: str, class_name: str):
+    """Registra un motor adicional que se importará de forma perezosa."""
+    BACKENDS[name] = (module, class_name)
+
+
+def get_backend(name: str = None):
+    """Devuelve la instancia del motor indicado (o del activo), importándolo la
+    primera vez."""
+    name = name or _current
+    backend = _instances.get(name)
+    if backend is None:
+        if name not in BACKENDS:
+            raise ValueError(f"Motor de cálculo desconocido: {name}.")
+        module, class_name = BACKENDS[name]
+        loaded = __import__(module, fromlist=[class_name])
+        backend = _instances[name] = getattr(loaded, class_name)()
+    return backend
+
+
+def set_backend(name: str):
+    """Activa un motor de cálculo; se importa la primera vez que se usa."""
+    global _current
+    if name not in BACKENDS:
+        raise ValueError(f"Motor de cálculo desconocido: {name}.")
+    _current = name
+
+
+class use_backend:
+    """Administrador de contexto que activa un motor de cálculo solo dentro de un
+    bloque with. Es una clase y no usa contextlib para no encarecer la importación."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = _current
+        set_backend(self._name)
+        return get_backend(self._name)
+
+    def __exit__(self, *exc_info):
+        set_backend(self._previous)
@@ -0,0 +1,122 @@
+from collections import OrderedDict, namedtuple
+
+from All_shapes.geometry import Shape
+
+Metrics = namedtuple("Metrics", ["perimeter", "area", "inner_angles", "classification"])
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+def canonical_form(shape: "Shape", ndigits: int = 9) -> "tuple":
+    """Devuelve la forma canónica de la figura y la rotación usada.
+
+    Los vértices se trasladan para que el menor de ellos (por x y luego por y) quede
+    en el origen y el recorrido empieza en ese vértice, por lo que dos figuras
+    idénticas en distintas posiciones, o con el recorrido iniciado en otro vértice,
+    tienen la misma forma canónica. Las coordenadas se redondean a ndigits decimales
+    para absorber el error de la traslación.
+
+    - param shape: instancia de Shape o de alguna de sus subclases.
+    - param ndigits: número de decimales con que se comparan las coordenadas.
+
+    Devuelve la pareja (llave, rotación), donde rotación es el índice del vértice con
+    el que empieza la forma canónica.
+    """
+    coords = [point.point_getter() for point in shape.vertices]
+    origin_x, origin_y = origin = min(coords)
+    rotation = coords.index(origin)
+    if coords.count(origin) > 1:
+        # Con vértices repetidos se elige el recorrido menor entre los candidatos
+        rotation = min((index for index, vertex in enumerate(coords) if vertex == origin),
+                       key=lambda start: coords[start:] + coords[:start])
+    key = tuple([(round(x - origin_x, ndigits), round(y - origin_y, ndigits))
+                 for x, y in coords[rotation:] + coords[:rotation]])
+    return (type(shape), shape.is_regular, key), rotation
+
+
+def _classification(shape: "Shape"):
+    """Código de classify_triangles para triángulos; None para otras figuras."""
+    if len(shape.vertices) != 3:
+        return None
+    from All_shapes.classify import classify_triangles
+
+    return int(classify_triangles([[p.point_getter() for p in shape.vertices]])[0])
+
+
+class MetricCache:
+    """Clase Caché de Métricas que guarda perímetro, área, ángulos internos y
+    clasificación de figuras repetidas o trasladadas.
+
+    Las llaves son la forma canónica de cada figura (ver canonical_form), de modo que
+    un mismo cuadrado unitario en mil posiciones distintas se calcula una sola vez.
+    Cuando se llena se descarta la figura usada hace más tiempo (LRU).
+
+        - param maxsize: número máximo de formas guardadas.
+        - param ndigits: decimales con que se comparan las coordenadas.
+    """
+
+    def __init__(self, maxsize: int = 4096, ndigits: int = 9):
+        self.maxsize = maxsize
+        self.ndigits = ndigits
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def metrics(self, shape: "Shape", seed: bool = True) -> "Metrics":
+        """Devuelve las métricas de la figura, calculándolas solo si su forma canónica
+        no está guardada.
+
+        - param shape: instancia de Shape o de alguna de sus subclases.
+        - param seed: si es True también se guardan los valores en la propia figura,
+        para que shape.perimeter, shape.area y shape.inner_angles no se recalculen.
+        """
+        key, rotation = canonical_form(shape, self.ndigits)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            perimeter, area, canonical_angles, classification = entry
+            # Los ángulos guardados empiezan en el vértice canónico
+            shift = -rotation % len(canonical_angles) if canonical_angles else 0
+            angles = canonical_angles[shift:] + canonical_angles[:shift]
+            if seed:
+                shape._watch_vertices()
+                shape._perimeter, shape._area, shape._inner_angles = perimeter, area, angles
+            return Metrics(perimeter, area, list(angles), classification)
+
+        self.misses += 1
+        angles = list(shape.inner_angles)
+        metrics = Metrics(shape.perimeter, shape.area, angles, _classification(shape))
+        self._entries[key] = (metrics.perimeter, metrics.area,
+                              angles[rotation:] + angles[:rotation], metrics.classification)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return Metrics(metrics.perimeter, metrics.area, list(angles),
+                       metrics.classification)
+
+    def cache_info(self) -> "CacheInfo":
+        """Devuelve aciertos, fallos, descartes, tamaño máximo y tamaño actual."""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize,
+                         len(self._entries))
+
+    def cache_clear(self):
+        """Vacía la caché y reinicia las estadísticas."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_default_cache = MetricCache()
+
+
+def cached_metrics(shape: "Shape") -> "Metrics":
+    """Devuelve las métricas de la figura usando la caché compartida del módulo."""
+    return _default_cache.metrics(shape)
+
+
+def cache_info() -> "CacheInfo":
+    """Devuelve las estadísticas de la caché compartida del módulo."""
+    return _default_cache.cache_info()
@@ -0,0 +1,123 @@
+import numpy as np
+
+from All_shapes import predicates
+from All_shapes.geometry import (Point, Triangle, Equilateral, Isosceles, Scalene,
+                                 Trirectangle)
+
+# Códigos de categoría; son banderas de bits porque un triángulo puede ser, por
+# ejemplo, isósceles y rectángulo a la vez.
+TRIANGLE = 0
+EQUILATERAL = 1
+ISOSCELES = 2
+SCALENE = 4
+RIGHT = 8
+
+# Mismas tolerancias que usan las clases de geometry: math.isclose por defecto y la
+# ventana fija de Trirectangle.
+REL_TOL = 1e-09
+RIGHT_ANGLE_TOL = 10**-9
+# Un producto punto exactamente nulo queda muy por debajo de esta fracción de la suma
+# de sus términos, así que solo las filas que la cumplen se revisan de forma exacta
+_DOT_CANDIDATE_TOL = 1e-12
+
+
+def _isclose(a, b):
+    """Versión vectorizada de math.isclose con sus tolerancias por defecto."""
+    return (a == b) | (np.abs(a - b) <= REL_TOL * np.maximum(np.abs(a), np.abs(b)))
+
+
+def side_lengths(coords) -> "np.ndarray":
+    """Calcula las longitudes de las aristas a, b y c de cada triángulo en el mismo
+    orden que Shape.calculate_edges.
+
+    - param coords: arreglo de forma (N, 3, 2) con los vértices de cada triángulo.
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3, 2)
+    delta = np.roll(coords, -1, axis=1) - coords
+    return np.sqrt(delta[..., 0]**2 + delta[..., 1]**2)
+
+
+def _exact_equal_sides(coords: "np.ndarray", rows: "np.ndarray") -> "np.ndarray":
+    """Para las filas indicadas, si los tres lados miden exactamente lo mismo (como
+    Shape._has_equal_sides)."""
+    equal = np.zeros(coords.shape[0], dtype=bool)
+    for row in rows.tolist():
+        (x0, y0), (x1, y1), (x2, y2) = coords[row].tolist()
+        equal[row] = (predicates.compare_lengths(x0, y0, x1, y1, x1, y1, x2, y2) == 0 and
+                      predicates.compare_lengths(x0, y0, x1, y1, x2, y2, x0, y0) == 0)
+    return equal
+
+
+def _exact_right_angle(coords: "np.ndarray") -> "np.ndarray":
+    """Indica qué triángulos tienen un ángulo exactamente recto (como
+    Shape._has_right_angle). El producto punto en cada vértice se calcula de forma
+    vectorizada y solo las filas donde alguno es casi nulo pasan por
+    predicates.dot_sign."""
+    before, after = np.roll(coords, 1, axis=1) - coords, np.roll(coords, -1, axis=1) - coords
+    first, second = before[..., 0] * after[..., 0], before[..., 1] * after[..., 1]
+    near = np.abs(first + second) <= _DOT_CANDIDATE_TOL * (np.abs(first) + np.abs(second))
+    right = np.zeros(coords.shape[0], dtype=bool)
+    for row in np.flatnonzero(near.any(axis=1)).tolist():
+        vertices = coords[row].tolist()
+        right[row] = any(
+            predicates.dot_sign(*vertices[index - 1], *vertices[index],
+                                *vertices[(index + 1) % 3]) == 0
+            for index in range(3))
+    return right
+
+
+def classify_triangles(coords, materialize=None):
+    """Clasifica muchos triángulos en una sola pasada vectorizada.
+
+    Devuelve un arreglo con un código por triángulo, combinación de EQUILATERAL,
+    ISOSCELES, SCALENE y RIGHT (TRIANGLE si no aplica ninguno). Las condiciones son
+    las mismas que validan los constructores de Equilateral, Isosceles, Scalene y
+    Trirectangle, por lo que no hace falta construir cada subclase para saberlo.
+
+    - param coords: arreglo de forma (N, 3, 2) con los vértices de cada triángulo.
+    - param materialize: índices de las filas para las que se desea construir la
+    instancia de la subclase correspondiente; si se indica, se devuelve la pareja
+    (códigos, lista de instancias).
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3, 2)
+    sides = side_lengths(coords)
+    a, b, c = sides[:, 0], sides[:, 1], sides[:, 2]
+
+    ab, bc, ac = _isclose(a, b), _isclose(b, c), _isclose(a, c)
+    # Equilateral compara las longitudes redondeadas y, si difieren, las compara de
+    # forma exacta; solo pueden ser iguales las que ya son casi iguales
+    equilateral = (a == b) & (b == c)
+    equilateral |= _exact_equal_sides(coords, np.flatnonzero(ab & bc & ~equilateral))
+    isosceles = (ab & ~bc) | (bc & ~ac) | (ac & ~ab)
+    scalene = ~ab & ~bc & ~ac
+
+    short, middle, longest = np.sort(sides, axis=1).T
+    legs = short**2 + middle**2
+    right = ((longest**2 - RIGHT_ANGLE_TOL) < legs) & (legs <= longest**2)
+    # Como Trirectangle, se acepta también un ángulo exactamente recto
+    rejected = np.flatnonzero(~right)
+    right[rejected] = _exact_right_angle(coords[rejected])
+
+    codes = (equilateral * EQUILATERAL | isosceles * ISOSCELES |
+             scalene * SCALENE | right * RIGHT).astype(np.int8)
+    if materialize is None:
+        return codes
+    return codes, [build_triangle(coords[row], codes[row]) for row in materialize]
+
+
+def build_triangle(vertices, code: int) -> "Triangle":
+    """Construye la instancia más específica que corresponde al código dado.
+
+    - param vertices: arreglo de forma (3, 2) con los vértices del triángulo.
+    - param code: código devuelto por classify_triangles para esos vértices.
+    """
+    points = [Point(x, y) for x, y in np.asarray(vertices).tolist()]
+    if code & EQUILATERAL:
+        return Equilateral(True, points)
+    if code & RIGHT:
+        return Trirectangle(False, points)
+    if code & ISOSCELES:
+        return Isosceles(False, points)
+    if code & SCALENE:
+        return Scalene(False, points)
+    return Triangle(False, points)
@@ -0,0 +1,269 @@
+import numpy as np
+
+from All_shapes.geometry import Point, Shape
+
+
+def _coords(polygon) -> "list[tuple]":
+    """Devuelve la lista de vértices (x, y) de un Shape, una lista de Point o una
+    secuencia de pares."""
+    if isinstance(polygon, Shape):
+        polygon = polygon.vertices
+    return [vertex.point_getter() if isinstance(vertex, Point) else
+            (float(vertex[0]), float(vertex[1])) for vertex in polygon]
+
+
+def _signed_area(coords: "list[tuple]") -> float:
+    return sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1)
+               in zip(coords, coords[1:] + coords[:1])) / 2
+
+
+def _counter_clockwise(coords: "list[tuple]") -> "list[tuple]":
+    return coords if _signed_area(coords) >= 0 else coords[::-1]
+
+
+def window_polygon(min_x: float, min_y: float, max_x: float, max_y: float) -> "list":
+    """Devuelve los vértices en sentido antihorario de una ventana rectangular."""
+    return [(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)]
+
+
+def _to_shape(coords: "list[tuple]") -> "Shape":
+    return Shape(False, [Point(x, y) for x, y in coords])
+
+
+def clip_convex(subject, clip) -> "Shape":
+    """Recorta una figura contra un polígono convexo con el algoritmo de
+    Sutherland-Hodgman.
+
+    - param subject: Shape, lista de Point o secuencia de pares (x, y) a recortar.
+    - param clip: polígono convexo (por ejemplo un Rectangle) en el mismo formato.
+
+    Devuelve la parte de subject dentro de clip como un Shape, o None si no queda
+    nada. Si subject es cóncavo y queda dividido, las partes se unen con aristas de
+    ancho cero sobre el borde de clip.
+    """
+    output = _coords(subject)
+    clip = _counter_clockwise(_coords(clip))
+    for (ax, ay), (bx, by) in zip(clip, clip[1:] + clip[:1]):
+        if not output:
+            break
+        vertices, output = output, []
+        distances = [(bx - ax) * (y - ay) - (by - ay) * (x - ax) for x, y in vertices]
+        previous, previous_distance = vertices[-1], distances[-1]
+        for current, distance in zip(vertices, distances):
+            if (distance >= 0) != (previous_distance >= 0):
+                t = previous_distance / (previous_distance - distance)
+                output.append((previous[0] + t * (current[0] - previous[0]),
+                               previous[1] + t * (current[1] - previous[1])))
+            if distance >= 0:
+                output.append(current)
+            previous, previous_distance = current, distance
+    return _to_shape(output) if len(output) >= 3 else None
+
+
+class _Node:
+    """Vértice de la lista doblemente enlazada del algoritmo de Greiner-Hormann."""
+
+    __slots__ = ("x", "y", "next", "prev", "intersect", "entry", "neighbour",
+                 "alpha", "visited")
+
+    def __init__(self, x: float, y: float, alpha: float = 0.0, intersect: bool = False):
+        self.x, self.y = x, y
+        self.next = self.prev = self.neighbour = None
+        self.intersect = intersect
+        self.entry = False
+        self.alpha = alpha
+        self.visited = False
+
+
+def _linked(coords: "list[tuple]") -> "list[_Node]":
+    nodes = [_Node(x, y) for x, y in coords]
+    for index, node in enumerate(nodes):
+        node.next = nodes[(index + 1) % len(nodes)]
+        node.prev = nodes[index - 1]
+    return nodes
+
+
+def _inside(x: float, y: float, coords: "list[tuple]") -> bool:
+    """Prueba de número de cruces para un punto y un polígono."""
+    inside = False
+    (px, py) = coords[-1]
+    for qx, qy in coords:
+        if (qy > y) != (py > y) and x < px + (y - py) * (qx - px) / (qy - py):
+            inside = not inside
+        px, py = qx, qy
+    return inside
+
+
+def _insert(start: "_Node", node: "_Node"):
+    """Inserta un nodo de intersección después de start, ordenado por alpha."""
+    current = start
+    while current.next.intersect and current.next.alpha < node.alpha:
+        current = current.next
+    node.prev, node.next = current, current.next
+    current.next.prev = node
+    current.next = node
+
+
+def _greiner_hormann(subject: "list[tuple]", clip: "list[tuple]"):
+    """Devuelve la lista de polígonos de la intersección, o None si hay un caso
+    degenerado (un vértice sobre una arista del otro polígono)."""
+    subject_nodes, clip_nodes = _linked(subject), _linked(clip)
+    found = False
+    for s_index, s_node in enumerate(subject_nodes):
+        s_next = subject_nodes[(s_index + 1) % len(subject_nodes)]
+        for c_index, c_node in enumerate(clip_nodes):
+            c_next = clip_nodes[(c_index + 1) % len(clip_nodes)]
+            r_x, r_y = s_next.x - s_node.x, s_next.y - s_node.y
+            q_x, q_y = c_next.x - c_node.x, c_next.y - c_node.y
+            denominator = r_x * q_y - r_y * q_x
+            w_x, w_y = c_node.x - s_node.x, c_node.y - s_node.y
+            if denominator == 0:
+                if w_x * r_y - w_y * r_x == 0 and (r_x or r_y):
+                    # Aristas colineales
+                    projection = [((px - s_node.x) * r_x + (py - s_node.y) * r_y) /
+                                  (r_x * r_x + r_y * r_y)
+                                  for px, py in ((c_node.x, c_node.y), (c_next.x, c_next.y))]
+                    if max(projection) >= 0 and min(projection) <= 1:
+                        return None
+                continue
+            alpha_s = (w_x * q_y - w_y * q_x) / denominator
+            alpha_c = (w_x * r_y - w_y * r_x) / denominator
+            if 0 < alpha_s < 1 and 0 < alpha_c < 1:
+                x, y = s_node.x + alpha_s * r_x, s_node.y + alpha_s * r_y
+                first = _Node(x, y, alpha_s, True)
+                second = _Node(x, y, alpha_c, True)
+                first.neighbour, second.neighbour = second, first
+                _insert(s_node, first)
+                _insert(c_node, second)
+                found = True
+            elif 0 <= alpha_s <= 1 and 0 <= alpha_c <= 1:
+                return None
+    if not found:
+        if all(_inside(x, y, clip) for x, y in subject):
+            return [subject]
+        if all(_inside(x, y, subject) for x, y in clip):
+            return [clip]
+        return []
+
+    for start, other in ((subject_nodes[0], clip), (clip_nodes[0], subject)):
+        entry = not _inside(start.x, start.y, other)
+        node = start
+        while True:
+            if node.intersect:
+                node.entry = entry
+                entry = not entry
+            node = node.next
+            if node is start:
+                break
+
+    polygons = []
+    current = subject_nodes[0]
+    while True:
+        while current.intersect is False or current.visited:
+            current = current.next
+            if current is subject_nodes[0]:
+                return polygons
+        polygon = [(current.x, current.y)]
+        while not current.visited:
+            current.visited = current.neighbour.visited = True
+            forward = current.entry
+            while True:
+                current = current.next if forward else current.prev
+                polygon.append((current.x, current.y))
+                if current.intersect:
+                    break
+            current = current.neighbour
+        polygons.append(polygon[:-1])
+
+
+def intersect(subject, clip) -> "list[Shape]":
+    """Calcula la intersección de dos polígonos simples cualesquiera (convexos o no)
+    con el algoritmo de Greiner-Hormann.
+
+    - param subject: Shape, lista de Point o secuencia de pares (x, y).
+    - param clip: segundo polígono en el mismo formato.
+
+    Devuelve una lista de Shape, vacía si los polígonos no se tocan. Los casos
+    degenerados (vértices sobre aristas del otro polígono) se resuelven desplazando
+    clip una distancia insignificante.
+    """
+    subject, clip = _coords(subject), _coords(clip)
+    scale = max(max(abs(value) for vertex in subject + clip for value in vertex), 1.0)
+    rng = np.random.default_rng(0)
+    shifted = clip
+    for _ in range(10):
+        polygons = _greiner_hormann(subject, shifted)
+        if polygons is not None:
+            return [_to_shape(polygon) for polygon in polygons if len(polygon) >= 3]
+        offsets = rng.uniform(-1, 1, (len(clip), 2)) * scale * 1e-12
+        shifted = [(x + dx, y + dy) for (x, y), (dx, dy) in zip(clip, offsets.tolist())]
+    raise ValueError("No se pudo resolver la intersección degenerada de los polígonos.")
+
+
+def clip_batch(batch, window, as_shapes: bool = False):
+    """Recorta todos los polígonos de un ShapeBatch contra una misma ventana convexa
+    con Sutherland-Hodgman, procesando todas las aristas del lote a la vez por cada
+    arista de la ventana.
+
+    - param batch: instancia de ShapeBatch.
+    - param window: secuencia plana (x mínima, y mínima, x máxima, y máxima) o
+    polígono convexo (Shape, como un Rectangle, lista de Point, secuencia de pares o
+    arreglo (N, 2)).
+    - param as_shapes: si es True devuelve una lista con un Shape (o None si el
+    polígono quedó fuera) por polígono.
+
+    Por defecto devuelve (coords, offsets) con el mismo formato plano de ShapeBatch;
+    los polígonos que quedan fuera de la ventana tienen cero vértices.
+    """
+    if isinstance(window, np.ndarray):
+        clip = _counter_clockwise(_coords(window.reshape(-1, 2)))
+    elif isinstance(window, Shape):
+        clip = _counter_clockwise(_coords(window))
+    else:
+        window = list(window)
+        # Solo una secuencia plana de cuatro números es una caja
+        if len(window) == 4 and all(isinstance(value, (int, float, np.number))
+                                    for value in window):
+            clip = window_polygon(*window)
+        else:
+            clip = _counter_clockwise(_coords(window))
+
+    coords = batch.coords
+    counts = batch.counts
+    polygon_ids = np.repeat(np.arange(len(batch)), counts)
+    for (ax, ay), (bx, by) in zip(clip, clip[1:] + clip[:1]):
+        if coords.shape[0] == 0:
+            break
+        starts = np.zeros(len(batch) + 1, dtype=np.int64)
+        np.cumsum(counts, out=starts[1:])
+        # Vértice anterior de cada vértice dentro de su polígono
+        previous = np.arange(-1, coords.shape[0] - 1)
+        nonempty = counts > 0
+        previous[starts[:-1][nonempty]] = starts[1:][nonempty] - 1
+
+        distance = (bx - ax) * (coords[:, 1] - ay) - (by - ay) * (coords[:, 0] - ax)
+        inside = distance >= 0
+        crossing = inside != inside[previous]
+        emitted = crossing.astype(np.int64) + inside
+
+        t = distance[previous] / np.where(crossing, distance[previous] - distance, 1)
+        cut = coords[previous] + t[:, None] * (coords - coords[previous])
+
+        positions = np.cumsum(emitted) - emitted
+        output = np.empty((int(emitted.sum()), 2))
+        output[positions[crossing]] = cut[crossing]
+        output[positions[inside] + crossing[inside]] = coords[inside]
+        coords = output
+        polygon_ids = np.repeat(polygon_ids, emitted)
+        counts = np.bincount(polygon_ids, minlength=len(batch))
+
+    # Los polígonos que quedaron con menos de tres vértices se consideran vacíos
+    keep = np.repeat(counts >= 3, counts)
+    coords = coords[keep]
+    counts = np.where(counts >= 3, counts, 0)
+    offsets = np.zeros(len(batch) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    if not as_shapes:
+        return coords, offsets
+    return [_to_shape(coords[offsets[index]:offsets[index + 1]].tolist())
+            if counts[index] else None for index in range(len(batch))]
@@ -0,0 +1,125 @@
+import numpy as np
+
+from All_shapes.geometry import Point
+from All_shapes.point_array import PointArray
+
+# Número máximo de celdas punto × arista evaluadas a la vez
+_BLOCK = 1 << 21
+
+
+class EdgeTable:
+    """Clase Tabla de Aristas con los datos de una figura que necesita la prueba de
+    número de cruces, en arreglos contiguos.
+
+    Las aristas horizontales se descartan porque nunca cruzan el rayo horizontal de
+    la prueba. Para cada arista restante se guardan las y de sus extremos, la x del
+    primero y la inversa de la pendiente, de modo que la x del cruce con la altura y
+    es x0 + (y - y0) * slope.
+
+        - param xs: coordenadas x de los vértices de la figura.
+        - param ys: coordenadas y de los vértices de la figura.
+    """
+
+    __slots__ = ("y0", "y1", "x0", "slope", "bounding_box")
+
+    def __init__(self, xs, ys):
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        next_xs, next_ys = np.roll(xs, -1), np.roll(ys, -1)
+        keep = ys != next_ys
+        self.y0, self.y1, self.x0 = ys[keep], next_ys[keep], xs[keep]
+        self.slope = (next_xs[keep] - self.x0) / (self.y1 - self.y0)
+        self.bounding_box = (float(xs.min()), float(ys.min()),
+                             float(xs.max()), float(ys.max()))
+
+    def __len__(self):
+        return self.y0.shape[0]
+
+    def contains(self, x: "np.ndarray", y: "np.ndarray") -> "np.ndarray":
+        """Devuelve un arreglo booleano que indica qué puntos están dentro.
+
+        Los puntos se procesan en bloques para que la matriz punto × arista no supere
+        _BLOCK celdas. Se usa la regla semiabierta habitual, por lo que un punto sobre
+        el borde puede quedar dentro o fuera, pero dos figuras que comparten una arista
+        nunca lo cuentan en ambas.
+        """
+        inside = np.zeros(x.shape[0], dtype=bool)
+        if not len(self):
+            return inside
+        step = max(1, _BLOCK // len(self))
+        y0, y1, x0, slope = self.y0, self.y1, self.x0, self.slope
+        for start in range(0, x.shape[0], step):
+            px = x[start:start + step, None]
+            py = y[start:start + step, None]
+            crossing = (y0 > py) != (y1 > py)
+            crossing &= px < x0 + (py - y0) * slope
+            inside[start:start + step] = np.logical_xor.reduce(crossing, axis=1)
+        return inside
+
+
+def _as_columns(points) -> "tuple":
+    """Devuelve las columnas x e y de un PointArray, un arreglo (N, 2) o una lista de
+    instancias de Point."""
+    if isinstance(points, PointArray):
+        return points.x, points.y
+    if not isinstance(points, np.ndarray):
+        points = [point.point_getter() for point in points]
+    coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    return coords[:, 0], coords[:, 1]
+
+
+def contains_points(shape, points):
+    """Indica qué puntos están dentro de la figura con la prueba de número de cruces.
+
+    - param shape: instancia de Shape o de alguna de sus subclases; su tabla de aristas
+    se calcula una vez y se guarda en la figura (ver Shape.edge_table).
+    - param points: un Point, un PointArray, un arreglo (N, 2) o una lista de Point.
+
+    Devuelve un booleano para un Point, o un arreglo booleano de longitud N.
+    """
+    table = shape.edge_table
+    if isinstance(points, Point):
+        x, y = points.point_getter()
+        return bool(table.contains(np.array([x], dtype=np.float64),
+                                   np.array([y], dtype=np.float64))[0])
+    x, y = _as_columns(points)
+    min_x, min_y, max_x, max_y = table.bounding_box
+    candidates = np.flatnonzero((x >= min_x) & (x <= max_x) & (y >= min_y) & (y <= max_y))
+    inside = np.zeros(x.shape[0], dtype=bool)
+    inside[candidates] = table.contains(x[candidates], y[candidates])
+    return inside
+
+
+def contains_many(shapes: "list", points) -> "tuple":
+    """Prueba muchas figuras contra muchos puntos.
+
+    Los puntos se ordenan una vez por x; para cada figura solo se prueban los que caen
+    en su caja envolvente, ubicados con una búsqueda binaria sobre x y un filtro en y.
+
+    - param shapes: lista de instancias de Shape.
+    - param points: un PointArray, un arreglo (N, 2) o una lista de Point.
+
+    Devuelve dos arreglos de enteros (índices de figura, índices de punto) con una
+    entrada por cada punto que está dentro de una figura.
+    """
+    x, y = _as_columns(points)
+    order = np.argsort(x, kind="stable")
+    sorted_x, sorted_y = x[order], y[order]
+    shape_indices, point_indices = [], []
+    for index, shape in enumerate(shapes):
+        table = shape.edge_table
+        min_x, min_y, max_x, max_y = table.bounding_box
+        lo = np.searchsorted(sorted_x, min_x, side="left")
+        hi = np.searchsorted(sorted_x, max_x, side="right")
+        if lo == hi:
+            continue
+        band_y = sorted_y[lo:hi]
+        candidates = np.flatnonzero((band_y >= min_y) & (band_y <= max_y)) + lo
+        if candidates.size == 0:
+            continue
+        found = candidates[table.contains(sorted_x[candidates], sorted_y[candidates])]
+        shape_indices.append(np.full(found.shape[0], index, dtype=np.int64))
+        point_indices.append(order[found])
+    if not shape_indices:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(shape_indices), np.concatenate(point_indices)
@@ -1,4 +1,17 @@
-from math import degrees, acos, isclose
+from math import degrees, acos, atan2, hypot, isclose
+
+# Los nombres usados solo en anotaciones se importan únicamente para los verificadores
+# de tipos: importar typing, weakref o transform aquí encarecería la importación
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import weakref
+
+    from All_shapes.transform import Affine
+
+# Número mínimo de vértices para que una figura actualice sus métricas de forma
+# incremental cuando se mueve un vértice; con menos, recalcular es más barato que
+# guardar la copia de las coordenadas.
+INCREMENTAL_MIN_VERTICES = 32
 
 class Point:
     """Clase Punto que se utiliza para crear puntos.
@@ -12,9 +25,14 @@ class Point:
     definition: str = """Entidad geométrica abstracta 
     que representa una ubicación en un espacio."""
 
+    # _shapes guarda las referencias débiles a las figuras que usan este punto como
+    # vértice; __slots__ evita el __dict__ por instancia.
+    __slots__ = ("_x", "_y", "_shapes")
+
     def __init__(self, x: float = 0, y: float = 0):     
         self._x = x
         self._y = y
+        self._shapes = None
 
     def point_setter(self, new_x: float, new_y: float):
         """Coloca el punto en una nueva coordenada x y y.
@@ -24,15 +42,59 @@ class Point:
         """
         self._x = new_x
         self._y = new_y
+        self._notify_shapes()
 
     def point_getter(self):
         """Devuelve las coordenadas x e y del punto."""
         return self._x, self._y
 
+    def transform(self, affine: "Affine"):
+        """Aplica una transformación afín al punto.
+
+        - param affine: instancia de transform.Affine.
+        """
+        self.point_setter(*affine.apply(self._x, self._y))
+
     def reset(self):
         """Coloca el punto en las coordenadas (0,0)."""
         self._x = 0
         self._y = 0
+        self._notify_shapes()
+
+    def _watch(self, shape_ref: "weakref.ref"):
+        """Registra una figura que debe ser avisada cuando el punto se mueva.
+
+        Con una sola figura se guarda la referencia directamente, que es el caso
+        más común, y solo se crea una lista cuando el punto es compartido.
+        """
+        if self._shapes is None:
+            self._shapes = shape_ref
+        elif type(self._shapes) is list:
+            self._shapes.append(shape_ref)
+            # Al duplicarse la lista se descartan las figuras que ya no existen
+            if len(self._shapes) & (len(self._shapes) - 1) == 0:
+                self._shapes = [item for item in self._shapes if item() is not None]
+        else:
+            self._shapes = [self._shapes, shape_ref]
+
+    def _notify_shapes(self):
+        """Avisa a las figuras registradas que el punto se movió y descarta las
+        referencias a figuras que ya no existen."""
+        if self._shapes is None:
+            return
+        shape_refs = self._shapes if type(self._shapes) is list else [self._shapes]
+        alive = []
+        for shape_ref in shape_refs:
+            shape = shape_ref()
+            if shape is not None:
+                shape._vertex_moved(self)
+                alive.append(shape_ref)
+        if not alive:
+            self._shapes = None
+        elif len(alive) == 1:
+            self._shapes = alive[0]
+        else:
+            self._shapes = alive
 
     def compute_distance(self, point: "Point") -> float:
         """Calcula la distancia entre dos puntos y la devuelve como un valor numérico.
@@ -58,6 +120,8 @@ class Line:
         pero no es necesario inicializarlo directamente.
     """
 
+    __slots__ = ("start", "end", "length")
+
     def __init__(self, start_point: "Point", end_point: "Point"):
         self.start = start_point
         self.end = end_point
@@ -67,6 +131,20 @@ class Line:
         """Calcula la distancia entre el punto inicial y el final, y la devuelve."""
         return self.start.compute_distance(self.end)
 
+    def transform(self, affine: "Affine"):
+        """Aplica una transformación afín a los dos extremos de la línea.
+
+        - param affine: instancia de transform.Affine.
+
+        Si la transformación es de semejanza la longitud se escala en lugar de
+        recalcularse.
+        """
+        self.start.transform(affine)
+        if self.end is not self.start:
+            self.end.transform(affine)
+        scale = affine.scale_factor
+        self.length = self.length * scale if scale is not None else self.compute_length()
+
     def compute_slope(self):
         """Calcula la pendiente de la línea y la devuelve."""
         return (self.start._y - self.end._y) / (self.start._x - self.end._x)
@@ -91,6 +169,39 @@ class Line:
                   self.end._y - self.start._y)) / (self.end._x - self.start._x)
         
         return Point(0, y_cross), True
+
+    def compute_cross(self, other: "Line"):
+        """Determina si la línea cruza a otra línea y devuelve el punto de intersección.
+
+        - param other: la segunda línea que se compara con la primera.
+
+        Las líneas paralelas o colineales no tienen un único punto de cruce y se
+        consideran como que no se cruzan.
+        """
+        # Se importa aquí para no encarecer la importación de geometry
+        from All_shapes import predicates
+
+        # Si se cruzan se decide con predicados exactos (ver predicates.orient2d); el
+        # punto de cruce se calcula después en punto flotante
+        a_x, a_y, b_x, b_y = self.start._x, self.start._y, self.end._x, self.end._y
+        c_x, c_y, d_x, d_y = other.start._x, other.start._y, other.end._x, other.end._y
+        if (predicates.orient2d(a_x, a_y, b_x, b_y, c_x, c_y) ==
+                predicates.orient2d(a_x, a_y, b_x, b_y, d_x, d_y)):
+            return False
+        if (predicates.orient2d(c_x, c_y, d_x, d_y, a_x, a_y) ==
+                predicates.orient2d(c_x, c_y, d_x, d_y, b_x, b_y)):
+            return False
+        r_x, r_y = b_x - a_x, b_y - a_y
+        s_x, s_y = d_x - c_x, d_y - c_y
+        denominator = r_x * s_y - r_y * s_x
+        q_x, q_y = c_x - a_x, c_y - a_y
+        if denominator == 0:
+            # Casi paralelas: el denominador se redondeó a cero
+            t = predicates.intersection_parameter(a_x, a_y, b_x, b_y, c_x, c_y, d_x, d_y)
+        else:
+            t = (q_x * s_y - q_y * s_x) / denominator
+        t = min(max(t, 0.0), 1.0)
+        return Point(a_x + t * r_x, a_y + t * r_y), True
     
     def __str__(self):
         """Método que devuelve una representación en cadena de la línea."""
@@ -106,20 +217,316 @@ class Shape:
         - param vertices: lista de instancias de puntos utilizados para crear las aristas
         (instancias de línea).
         
-        Tiene los atributos adicionales:
+        Tiene los atributos adicionales, calculados solo la primera vez que se leen y
+        guardados hasta que alguno de los vértices se mueva:
         - edges: calculados usando el método calculate_edges.
-        - inner_angles: calculados usando el método calculate_inner_angles.
+        - inner_angles: calculados usando el método compute_inner_angles.
+        - perimeter: calculado usando el método compute_perimeter.
+        - area: calculada usando el método compute_area.
+        - signed_area: calculada usando el método compute_signed_area.
+        - bounding_box: calculada usando el método compute_bounding_box.
+
+        Una figura declarada regular se valida al crearla (ver validate). Si después
+        se mueve uno de sus vértices, ninguna lectura falla por ello: is_valid indica
+        si sigue siendo regular.
     """
 
+    __slots__ = ("is_regular", "_vertices", "_watching", "_ref", "_edges",
+                 "_inner_angles", "_perimeter", "_area", "_signed_area",
+                 "_bounding_box", "_edge_table", "_xs", "_ys", "_positions",
+                 "_pending", "_valid", "__weakref__")
+
     def __init__(self, is_regular: "bool", vertices: "list[Point]"):
         self.is_regular = is_regular
+        self._ref = None
         self.vertices = vertices
-        self.edges = self.calculate_edges()
-        self.inner_angles = self.compute_inner_angles()
+        # Las figuras declaradas regulares se validan al crearlas
+        if is_regular:
+            self.validate()
+
+    @property
+    def vertices(self) -> "list[Point]":
+        """Lista de vértices de la figura; si hay una transformación pendiente (ver
+        transform) se aplica antes de devolverla."""
+        if self._pending is not None:
+            self._apply_pending()
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, new_vertices: "list[Point]"):
+        self._vertices = new_vertices
+        self._watching = False
+        self._positions = None
+        self._pending = None
+        self._valid = None
+        self._invalidate()
+
+    @property
+    def edges(self) -> "list[Line]":
+        """Aristas de la figura, calculadas y guardadas en la primera lectura."""
+        if self._pending is not None:
+            self._apply_pending()
+        if self._edges is None:
+            self._watch_vertices()
+            self._edges = self.calculate_edges()
+        return self._edges
+
+    @property
+    def inner_angles(self) -> "list":
+        """Ángulos internos de la figura, calculados y guardados en la primera lectura."""
+        if self._inner_angles is None:
+            self._inner_angles = self.compute_inner_angles()
+        return self._inner_angles
+
+    @property
+    def perimeter(self) -> "float":
+        """Perímetro de la figura, calculado y guardado en la primera lectura."""
+        if self._perimeter is None:
+            self._perimeter = self.compute_perimeter()
+        return self._perimeter
+
+    @property
+    def area(self) -> "float":
+        """Área de la figura, calculada y guardada en la primera lectura."""
+        if self._area is None:
+            self._area = self.compute_area()
+        return self._area
+
+    @property
+    def signed_area(self) -> "float":
+        """Área con signo de la figura, calculada y guardada en la primera lectura."""
+        if self._signed_area is None:
+            self._signed_area = self.compute_signed_area()
+        return self._signed_area
+
+    @property
+    def bounding_box(self) -> "tuple":
+        """Caja envolvente de la figura, calculada y guardada en la primera lectura."""
+        if self._bounding_box is None:
+            self._watch_vertices()
+            self._bounding_box = self.compute_bounding_box()
+        return self._bounding_box
+
+    @property
+    def edge_table(self):
+        """Tabla de aristas para la prueba de punto en polígono (ver
+        containment.EdgeTable), calculada y guardada en la primera lectura."""
+        if self._edge_table is None:
+            from All_shapes.containment import EdgeTable
+
+            self._watch_vertices()
+            self._edge_table = EdgeTable(*self._coordinates())
+        return self._edge_table
+
+    def _invalidate(self):
+        """Descarta todos los valores guardados de la figura."""
+        self._edges = None
+        self._inner_angles = None
+        self._perimeter = None
+        self._area = None
+        self._signed_area = None
+        self._bounding_box = None
+        self._edge_table = None
+        self._xs = self._ys = None
+
+    def _watch_vertices(self):
+        """Registra la figura en sus vértices para enterarse cuando alguno se mueva."""
+        if self._watching:
+            return
+        if self._ref is None:
+            # Se importa aquí para no encarecer la importación de geometry
+            from weakref import ref
+            self._ref = ref(self)
+        for point in self._vertices:
+            point._watch(self._ref)
+        self._watching = True
+
+    def _vertex_moved(self, point: "Point"):
+        """Se llama cuando uno de los vértices cambia de posición.
+
+        Si la figura guarda la copia de sus coordenadas (ver _coordinates) las
+        métricas se actualizan en O(1) por cada aparición del vértice; si no, se
+        descartan y se recalculan en la siguiente lectura.
+        """
+        self._valid = None
+        if self._xs is None or self._pending is not None:
+            self._invalidate()
+            return
+        if self._positions is None:
+            self._positions = {}
+            for index, vertex in enumerate(self._vertices):
+                self._positions.setdefault(vertex, []).append(index)
+        x, y = point._x, point._y
+        for index in self._positions.get(point, ()):
+            self._move_vertex(index, x, y)
+            if self._xs is None:
+                return
+
+    def _move_vertex(self, index: int, x: float, y: float):
+        """Actualiza las métricas guardadas cuando el vértice index pasa a (x, y).
+
+        Solo cambian las dos aristas que llegan al vértice, el área de los dos
+        triángulos que forman con el origen y los ángulos del vértice y de sus
+        vecinos. Se usan las coordenadas guardadas (no las de los puntos) para que
+        al mover varios vértices seguidos cada cambio se descuente una sola vez.
+        """
+        xs, ys = self._xs, self._ys
+        count = len(xs)
+        old_x, old_y = xs[index], ys[index]
+        if old_x == x and old_y == y:
+            return
+        previous, following = index - 1, (index + 1) % count
+        previous_x, previous_y = xs[previous], ys[previous]
+        next_x, next_y = xs[following], ys[following]
+        old_in = hypot(old_x - previous_x, old_y - previous_y)
+        old_out = hypot(next_x - old_x, next_y - old_y)
+        new_in = hypot(x - previous_x, y - previous_y)
+        new_out = hypot(next_x - x, next_y - y)
+
+        incremental_area = type(self).compute_area is Shape.compute_area
+        incremental_angles = type(self).compute_inner_angles is Shape.compute_inner_angles
+        if not incremental_area:
+            self._area = None
+        if not incremental_angles:
+            self._inner_angles = None
+        if self._signed_area is None and (self._area is not None
+                                          or self._inner_angles is not None):
+            self._signed_area = self.compute_signed_area()
+
+        xs[index], ys[index] = x, y
+        if self._perimeter is not None:
+            self._perimeter += new_in + new_out - old_in - old_out
+        if self._edges is not None:
+            self._edges[previous].length = new_in
+            self._edges[index].length = new_out
+        if self._signed_area is not None:
+            old_signed_area = self._signed_area
+            self._signed_area += (previous_x * (y - old_y) - previous_y * (x - old_x) +
+                                  next_y * (x - old_x) - next_x * (y - old_y)) / 2
+            if self._area is not None:
+                self._area = abs(self._signed_area)
+            if self._inner_angles is not None:
+                if (old_signed_area < 0) != (self._signed_area < 0):
+                    # Cambió la orientación: cambian todos los ángulos
+                    self._inner_angles = None
+                else:
+                    orientation = -1 if self._signed_area < 0 else 1
+                    for vertex in (previous % count, index, following):
+                        self._inner_angles[vertex] = self._angle_at(vertex, orientation)
+        if self._bounding_box is not None:
+            min_x, min_y, max_x, max_y = self._bounding_box
+            if (old_x == min_x < x or old_x == max_x > x or
+                    old_y == min_y < y or old_y == max_y > y):
+                self._bounding_box = None
+            else:
+                self._bounding_box = (min(min_x, x), min(min_y, y),
+                                      max(max_x, x), max(max_y, y))
+        self._edge_table = None
+
+    def _angle_at(self, index: int, orientation: int) -> "float":
+        """Ángulo interno en grados en un vértice, con la fórmula de
+        backends.PythonBackend.inner_angles sobre las coordenadas guardadas."""
+        xs, ys = self._xs, self._ys
+        following = (index + 1) % len(xs)
+        in_x, in_y = xs[index] - xs[index - 1], ys[index] - ys[index - 1]
+        out_x, out_y = xs[following] - xs[index], ys[following] - ys[index]
+        turn = degrees(atan2(in_x * out_y - in_y * out_x, in_x * out_x + in_y * out_y))
+        return 180 - orientation * turn
+
+    def transform(self, affine: "Affine") -> "Shape":
+        """Aplica una transformación afín a la figura de forma perezosa.
+
+        - param affine: instancia de transform.Affine.
+
+        La transformación se compone con las pendientes y se aplica a los vértices en
+        una sola pasada la próxima vez que se lean (vertices, aristas o cualquier
+        métrica que no esté guardada). Mientras tanto los puntos conservan sus
+        coordenadas anteriores. Las métricas guardadas se actualizan sin recorrer los
+        vértices: el área con signo se multiplica por el determinante y, si la
+        transformación es de semejanza, el perímetro y las aristas se escalan y los
+        ángulos internos no cambian. Devuelve la propia figura para encadenar.
+        """
+        self._pending = affine if self._pending is None else self._pending.then(affine)
+        self._xs = self._ys = None
+        self._edge_table = None
+        determinant = affine.determinant
+        scale = affine.scale_factor
+        if self._signed_area is not None:
+            self._signed_area *= determinant
+        if self._area is not None:
+            if scale is not None or type(self).compute_area is Shape.compute_area:
+                self._area *= abs(determinant)
+            else:
+                self._area = None
+        if scale is None:
+            # Solo una semejanza conserva la regularidad
+            self._edges = self._inner_angles = self._perimeter = self._valid = None
+        elif self._perimeter is not None:
+            self._perimeter *= scale
+        if self._bounding_box is not None:
+            if affine.is_axis_aligned:
+                min_x, min_y = affine.apply(*self._bounding_box[:2])
+                max_x, max_y = affine.apply(*self._bounding_box[2:])
+                self._bounding_box = (min(min_x, max_x), min(min_y, max_y),
+                                      max(min_x, max_x), max(min_y, max_y))
+            else:
+                self._bounding_box = None
+        return self
+
+    def _apply_pending(self):
+        """Aplica la transformación pendiente a los vértices en una sola pasada,
+        conservando las métricas ya actualizadas en transform."""
+        pending, self._pending = self._pending, None
+        saved = (self._edges, self._inner_angles, self._perimeter, self._area,
+                 self._signed_area, self._bounding_box)
+        seen = set()
+        arrays = {}
+        for point in self._vertices:
+            if point in seen:
+                continue
+            seen.add(point)
+            # Los vértices de un PointArray se transforman juntos, de forma vectorizada
+            array = getattr(point, "_array", None)
+            if array is not None:
+                arrays.setdefault(id(array), (array, []))[1].append(point._index)
+            else:
+                point.point_setter(*pending.apply(point._x, point._y))
+        for array, indices in arrays.values():
+            array.point_setter(*pending.apply_arrays(array.x[indices], array.y[indices]),
+                               indices)
+        (self._edges, self._inner_angles, self._perimeter, self._area,
+         self._signed_area, self._bounding_box) = saved
+        if self._edges is not None:
+            scale = pending.scale_factor
+            if scale is None:
+                self._edges = None
+            else:
+                for edge in self._edges:
+                    edge.length *= scale
+
+    @property
+    def is_valid(self) -> bool:
+        """Indica si la figura cumple lo que declara: las no regulares siempre, las
+        regulares si todas sus aristas miden lo mismo (math.isclose). Se guarda y se
+        vuelve a comprobar después de que se mueva algún vértice."""
+        if self._valid is None:
+            self._valid = not self.is_regular or self._edges_are_equal()
+        return self._valid
+
+    def validate(self):
+        """Lanza ValueError si la figura se declaró regular y sus aristas no miden lo
+        mismo."""
+        if not self.is_valid:
+            raise ValueError("La figura debe ser regular como se indicó.")
+
+    def _edges_are_equal(self) -> bool:
+        edges = self.edges
+        comparison_length = edges[0].length
+        return all(isclose(comparison_length, edge.length) for edge in edges)
 
     def calculate_edges(self) -> "list[Line]":
-        """Calcula las aristas de la figura y verifica si son regulares como se indicó,
-        devuelve una lista de instancias de la clase Line."""
+        """Calcula las aristas de la figura y devuelve una lista de instancias de la
+        clase Line. La regularidad se verifica aparte (ver validate)."""
 
         shape_edges = [] 
         
@@ -127,21 +534,78 @@ class Shape:
             start_point = self.vertices[index]
             end_point = self.vertices[(index + 1) % len(self.vertices)]
             shape_edges.append(Line(start_point, end_point))
-        
-        if self.is_regular:
-            comparison_length = shape_edges[0].length
-            for edge_length in shape_edges:
-                if not (isclose(comparison_length, edge_length.length)):
-                    raise ValueError("La figura debe ser regular como se indicó.")
-        
+
         return shape_edges
+
+    def _has_equal_sides(self) -> bool:
+        """Indica si todas las aristas miden exactamente lo mismo, comparando las
+        longitudes al cuadrado con predicates.compare_lengths."""
+        from All_shapes import predicates
+
+        vertices = self.vertices
+        x0, y0 = vertices[0]._x, vertices[0]._y
+        x1, y1 = vertices[1]._x, vertices[1]._y
+        for index in range(1, len(vertices)):
+            start, end = vertices[index], vertices[(index + 1) % len(vertices)]
+            if predicates.compare_lengths(x0, y0, x1, y1, start._x, start._y,
+                                          end._x, end._y):
+                return False
+        return True
+
+    def _has_right_angle(self) -> bool:
+        """Indica si algún ángulo interno es exactamente recto, según el signo exacto
+        del producto punto (predicates.dot_sign)."""
+        from All_shapes import predicates
+
+        vertices = self.vertices
+        for index, vertex in enumerate(vertices):
+            before, after = vertices[index - 1], vertices[(index + 1) % len(vertices)]
+            if predicates.dot_sign(before._x, before._y, vertex._x, vertex._y,
+                                   after._x, after._y) == 0:
+                return True
+        return False
+
+    def _coordinates(self) -> "tuple":
+        """Devuelve las listas de coordenadas x e y de los vértices.
+
+        Las figuras con al menos INCREMENTAL_MIN_VERTICES vértices guardan estas
+        listas para actualizar sus métricas de forma incremental; no deben
+        modificarse.
+        """
+        if self._xs is not None:
+            return self._xs, self._ys
+        self._watch_vertices()
+        xs = [point._x for point in self.vertices]
+        ys = [point._y for point in self.vertices]
+        if len(xs) >= INCREMENTAL_MIN_VERTICES:
+            self._xs, self._ys = xs, ys
+        return xs, ys
+
+    def compute_bounding_box(self) -> "tuple":
+        """Calcula la caja envolvente de la figura, devuelve la tupla
+        (x mínima, y mínima, x máxima, y máxima)."""
+        xs, ys = self._coordinates()
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def compute_signed_area(self) -> "float":
+        """Calcula el área con signo usando la fórmula del cordón de zapato; es positiva
+        si los vértices están en sentido antihorario."""
+        # Se importa aquí para no encarecer la importación de geometry
+        from All_shapes import backends
+
+        return backends.get_backend().signed_area(*self._coordinates())
     
     def compute_area(self) -> "float":
         """Calcula el área de la figura y devuelve su valor numérico."""
-        pass
+        return abs(self.signed_area)
 
     def compute_perimeter(self) -> "float":
         """Calcula el perímetro de la figura y devuelve su valor numérico."""
+        if self._edges is None:
+            from All_shapes import backends
+
+            return backends.get_backend().perimeter(*self._coordinates())
+
         shape_perimeter = 0
 
         for edges in self.edges:
@@ -149,7 +613,25 @@ class Shape:
         return shape_perimeter
     
     def compute_inner_angles(self) -> "list":
-        pass
+        """Calcula los ángulos internos (en grados) en cada vértice, devuelve una lista
+        con los ángulos internos de la instancia."""
+        from All_shapes import backends
+
+        return backends.get_backend().inner_angles(*self._coordinates())
+
+    def contains(self, points):
+        """Indica si uno o varios puntos están dentro de la figura; ver
+        containment.contains_points."""
+        from All_shapes.containment import contains_points
+
+        return contains_points(self, points)
+
+    def triangulate(self, method: str = "auto", as_shapes: bool = False):
+        """Divide la figura en triángulos; devuelve un arreglo (n - 2, 3) con los
+        índices de los vértices de cada uno, ver triangulate.triangulate."""
+        from All_shapes.triangulate import triangulate
+
+        return triangulate(self, method, as_shapes)
 
     def __str__(self):
         vertices = [point.__str__() for point in self.vertices]
@@ -166,6 +648,8 @@ class Rectangle(Shape):
         - param vertices: lista de instancias de puntos utilizadas para crear las aristas
         (instancias de líneas).
     """
+    __slots__ = ()
+
     def __init__(self, is_regular, vertices):
         if len(vertices) != 4: 
             raise ValueError("El rectángulo debe tener exactamente 4 vértices.")
@@ -192,13 +676,16 @@ class Square(Rectangle):
         - param vertices: lista de instancias de puntos utilizadas para crear las aristas
         (instancias de líneas).
     """
+    __slots__ = ()
+
     def __init__(self, is_regular, vertices):
         super().__init__(is_regular, vertices)
         
         a, b, c, d = (edge.length for edge in self.edges)
 
         if self.is_regular == True:
-            if not (a == b and b == c and c == d and d == a):
+            # Si las longitudes redondeadas difieren se comprueba de forma exacta
+            if not (a == b and b == c and c == d and d == a) and not self._has_equal_sides():
                 raise ValueError (
                     "El cuadrado debe tener la misma longitud en todos los lados.")
         else:
@@ -214,6 +701,8 @@ class Triangle(Shape):
         - param vertices: lista de instancias de puntos utilizadas para crear las aristas
         (instancias de líneas).
     """
+    __slots__ = ()
+
     def __init__(self, is_regular, vertices):
         if len(vertices) != 3:
             raise ValueError("La instancia de triángulo debe tener 3 vértices.")
@@ -250,6 +739,8 @@ class Equilateral(Triangle):
         - param vertices: lista de instancias de puntos utilizadas para crear las aristas
         (instancias de líneas).
     """
+    __slots__ = ()
+
     def __init__(self, is_regular, vertices):
         super().__init__(is_regular, vertices)
         if self.is_regular == False:
@@ -258,7 +749,7 @@ class Equilateral(Triangle):
         # Los triángulos equiláteros deben tener la misma longitud en todos los lados
         a, b, c = (edge.length for edge in self.edges)
         
-        if not (a == b and b == c):
+        if not (a == b and b == c) and not self._has_equal_sides():
             raise ValueError (
                 "El triángulo equilátero debe tener la misma longitud en todos los lados.")
 
@@ -272,6 +763,8 @@ class Isosceles(Triangle):
         - param vertices: lista de instancias de puntos utilizadas para crear las aristas
         (instancias de líneas).
     """
+    __slots__ = ()
+
     def __init__(self, is_regular, vertices):
         super().__init__(is_regular, vertices)
         if self.is_regular == True:
@@ -301,6 +794,8 @@ class Scalene(Triangle):
         - param vertices: lista de instancias de puntos utilizadas para crear las aristas
         (instancias de líneas).
     """
+    __slots__ = ()
+
     def __init__(self, is_regular, vertices):
         super().__init__(is_regular, vertices)
         if self.is_regular == True:
@@ -330,6 +825,8 @@ class Trirectangle(Triangle):
         - param vertices: lista de instancias de puntos utilizadas para crear las aristas
         (instancias de líneas).
     """
+    __slots__ = ()
+
     def __init__(self, is_regular, vertices):
         super().__init__(is_regular, vertices)
         # Verificar si la forma es regular
@@ -338,6 +835,8 @@ class Trirectangle(Triangle):
 
         a, b, c = sorted(edge.length for edge in self.edges)
 
-        if not (c**2 - (10**-9)) < (a**2 + b**2) <= c**2:
+        # La ventana de tolerancia acepta lados redondeados; el ángulo recto exacto
+        # cubre los que el redondeo deja fuera de ella
+        if not (c**2 - (10**-9)) < (a**2 + b**2) <= c**2 and not self._has_right_angle():
             raise ValueError(
             "El triángulo rectángulo no puede ser formado con los vértices dados.")
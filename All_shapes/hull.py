@@ -0,0 +1,126 @@
+import numpy as np
+
+from All_shapes.geometry import Point, Shape
+
+
+def _as_coords(points) -> "tuple":
+    """Devuelve (coordenadas (N, 2), lista de Point o None) a partir de una lista de
+    instancias de Point o de un arreglo de coordenadas."""
+    if isinstance(points, np.ndarray):
+        return np.asarray(points, dtype=np.float64).reshape(-1, 2), None
+    points = list(points)
+    if points and isinstance(points[0], Point):
+        return np.array([point.point_getter() for point in points],
+                        dtype=np.float64).reshape(-1, 2), points
+    return np.asarray(points, dtype=np.float64).reshape(-1, 2), None
+
+
+def _discard_interior(coords: "np.ndarray") -> "np.ndarray":
+    """Descarta los puntos que están dentro del octágono formado por los puntos
+    extremos en ocho direcciones (heurística de Akl-Toussaint), en una pasada
+    vectorizada."""
+    if coords.shape[0] < 64:
+        return np.arange(coords.shape[0])
+    x, y = coords[:, 0], coords[:, 1]
+    # Extremos ordenados por dirección en sentido antihorario, empezando en 180°
+    corners = coords[[np.argmin(x), np.argmin(x + y), np.argmin(y), np.argmax(x - y),
+                      np.argmax(x), np.argmax(x + y), np.argmax(y), np.argmax(y - x)]]
+    inside = np.ones(coords.shape[0], dtype=bool)
+    for start, end in zip(corners, np.roll(corners, -1, axis=0)):
+        cross = (end[0] - start[0]) * (y - start[1]) - (end[1] - start[1]) * (x - start[0])
+        inside &= cross > 0
+    return np.flatnonzero(~inside)
+
+
+def hull_indices(coords) -> "np.ndarray":
+    """Calcula la envolvente convexa con el algoritmo de cadena monótona en
+    O(n log n) y devuelve los índices de sus vértices en sentido antihorario.
+
+    - param coords: arreglo de forma (N, 2) con las coordenadas de los puntos.
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    candidates = _discard_interior(coords)
+    order = candidates[np.lexsort((coords[candidates, 1], coords[candidates, 0]))]
+    # Los puntos repetidos quedan juntos al ordenar; se conserva el primero de cada uno
+    repeated = np.all(coords[order[1:]] == coords[order[:-1]], axis=1)
+    order = order[np.concatenate(([True], ~repeated))]
+    if len(order) < 3:
+        return order
+    xs, ys = coords[order, 0].tolist(), coords[order, 1].tolist()
+
+    def chain(indices):
+        kept = []
+        for index in indices:
+            while len(kept) >= 2:
+                first, second = kept[-2], kept[-1]
+                cross = ((xs[second] - xs[first]) * (ys[index] - ys[first]) -
+                         (ys[second] - ys[first]) * (xs[index] - xs[first]))
+                if cross > 0:
+                    break
+                kept.pop()
+            kept.append(index)
+        return kept
+
+    positions = range(len(order))
+    lower = chain(positions)
+    upper = chain(reversed(positions))
+    return order[lower[:-1] + upper[:-1]]
+
+
+def convex_hull(points) -> "Shape":
+    """Construye la envolvente convexa de un conjunto de puntos como una instancia de
+    Shape con los vértices en sentido antihorario.
+
+    - param points: lista de instancias de Point o arreglo de forma (N, 2). Si se
+    pasan instancias de Point, la figura usa esas mismas instancias como vértices.
+    """
+    coords, originals = _as_coords(points)
+    if coords.shape[0] == 0:
+        raise ValueError("La envolvente convexa necesita al menos un punto.")
+    indices = hull_indices(coords)
+    if originals is not None:
+        vertices = [originals[index] for index in indices.tolist()]
+    else:
+        vertices = [Point(x, y) for x, y in coords[indices].tolist()]
+    return Shape(False, vertices)
+
+
+class HullBuilder:
+    """Clase Constructor de Envolvente que calcula la envolvente convexa de una nube de
+    puntos que llega por partes, sin tenerla completa en memoria.
+
+    Cada parte se une con los vértices de la envolvente acumulada, que es lo único
+    que se conserva entre partes.
+    """
+
+    def __init__(self):
+        self._coords = np.empty((0, 2), dtype=np.float64)
+        self.count = 0
+
+    def update(self, points) -> "HullBuilder":
+        """Agrega una parte de la nube (lista de Point o arreglo (N, 2))."""
+        coords, _ = _as_coords(points)
+        self.count += coords.shape[0]
+        merged = np.concatenate((self._coords, coords))
+        self._coords = merged[hull_indices(merged)] if merged.shape[0] else merged
+        return self
+
+    @property
+    def coords(self) -> "np.ndarray":
+        """Coordenadas de los vértices de la envolvente acumulada."""
+        return self._coords
+
+    def shape(self) -> "Shape":
+        """Devuelve la envolvente acumulada como una instancia de Shape."""
+        if self._coords.shape[0] == 0:
+            raise ValueError("La envolvente convexa necesita al menos un punto.")
+        return Shape(False, [Point(x, y) for x, y in self._coords.tolist()])
+
+
+def streaming_hull(chunks) -> "Shape":
+    """Calcula la envolvente convexa de un iterable de partes de la nube de puntos,
+    por ejemplo los lotes de un archivo que no cabe en memoria."""
+    builder = HullBuilder()
+    for chunk in chunks:
+        builder.update(chunk)
+    return builder.shape()
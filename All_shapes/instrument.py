@@ -0,0 +1,151 @@
+import atexit
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from functools import wraps
+
+from All_shapes import geometry
+
+
+class _Stats:
+    __slots__ = ("calls", "seconds", "errors")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.errors = 0
+
+
+# Estado de la instrumentación activa; vacío cuando está desactivada
+_originals = {}
+_stats = {}
+_events = []
+_settings = {"max_events": 0, "trace_path": None, "summary": False}
+_origin = time.perf_counter()
+
+
+def _default_targets() -> "list[type]":
+    """Clases de geometry cuyos métodos se instrumentan por defecto."""
+    return [value for value in vars(geometry).values()
+            if inspect.isclass(value) and value.__module__ == geometry.__name__]
+
+
+def _wrap(qualified_name: str, function):
+    stats = _stats.setdefault(qualified_name, _Stats())
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except BaseException:
+            stats.errors += 1
+            raise
+        finally:
+            end = time.perf_counter()
+            stats.calls += 1
+            stats.seconds += end - start
+            if len(_events) < _settings["max_events"]:
+                _events.append((qualified_name, start, end, threading.get_ident()))
+    return wrapper
+
+
+def enable(targets: "list[type]" = None, trace_path: str = None,
+           max_events: int = 1_000_000, summary: bool = False):
+    """Activa la instrumentación reemplazando los métodos de las clases indicadas por
+    versiones que cuentan llamadas, tiempo acumulado y excepciones.
+
+    - param targets: clases a instrumentar; por defecto todas las de geometry.
+    - param trace_path: si se indica, al terminar el proceso se guarda ahí la línea de
+    tiempo en formato Chrome trace (chrome://tracing o Perfetto).
+    - param max_events: número máximo de eventos guardados para la línea de tiempo.
+    - param summary: si es True, al terminar el proceso se imprime el resumen en
+    stderr.
+
+    Mientras está desactivada no queda ningún envoltorio en las clases, por lo que no
+    tiene costo.
+    """
+    if _originals:
+        disable()
+    _stats.clear()
+    _events.clear()
+    _settings.update(max_events=max_events if trace_path else 0,
+                     trace_path=trace_path, summary=summary)
+    for cls in targets or _default_targets():
+        for name, value in list(vars(cls).items()):
+            if not inspect.isfunction(value):
+                continue
+            if name.startswith("__") and name != "__init__":
+                continue
+            _originals[(cls, name)] = value
+            setattr(cls, name, _wrap(f"{cls.__name__}.{name}", value))
+
+
+def disable():
+    """Restaura los métodos originales; las estadísticas se conservan."""
+    for (cls, name), function in _originals.items():
+        setattr(cls, name, function)
+    _originals.clear()
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def stats() -> dict:
+    """Devuelve {método: {"calls", "seconds", "errors"}} de los métodos llamados."""
+    return {name: {"calls": item.calls, "seconds": item.seconds, "errors": item.errors}
+            for name, item in _stats.items() if item.calls}
+
+
+def summary() -> str:
+    """Devuelve un resumen en texto ordenado por tiempo acumulado.
+
+    El tiempo es inclusivo: el de calculate_edges incluye el de Line.__init__.
+    """
+    lines = [f"{'método':40} {'llamadas':>10} {'tiempo (s)':>11} "
+             f"{'µs/llamada':>11} {'errores':>8}"]
+    for name, item in sorted(stats().items(), key=lambda entry: -entry[1]["seconds"]):
+        lines.append(f"{name:40} {item['calls']:>10} {item['seconds']:>11.4f} "
+                     f"{item['seconds'] / item['calls'] * 1e6:>11.2f} {item['errors']:>8}")
+    return "\n".join(lines)
+
+
+def write_trace(path: str):
+    """Guarda los eventos registrados en formato Chrome trace (JSON)."""
+    pid = os.getpid()
+    events = [{"name": name, "ph": "X", "pid": pid, "tid": thread,
+               "ts": (start - _origin) * 1e6, "dur": (end - start) * 1e6}
+              for name, start, end, thread in _events]
+    with open(path, "w") as output:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, output)
+
+
+@atexit.register
+def _report():
+    if _settings["trace_path"]:
+        write_trace(_settings["trace_path"])
+    if _settings["summary"] and _stats:
+        print(summary(), file=sys.stderr)
+
+
+class profiling:
+    """Administrador de contexto que activa la instrumentación dentro de un bloque.
+
+        with instrument.profiling() as report:
+            ...
+        print(report.summary())
+    """
+
+    def __init__(self, **options):
+        self._options = options
+
+    def __enter__(self):
+        enable(**self._options)
+        return sys.modules[__name__]
+
+    def __exit__(self, *exc_info):
+        disable()
@@ -0,0 +1,229 @@
+from heapq import heappush, heappushpop
+
+import numpy as np
+
+from All_shapes.geometry import Point
+
+
+class KDTree:
+    """Clase Árbol KD para búsquedas de vecinos más cercanos y por radio.
+
+    Inicializa el árbol con una lista de instancias de Point o un arreglo de forma
+    (N, 2). Los puntos se reordenan una sola vez de modo que cada nodo ocupa un
+    rango contiguo del arreglo, dividido por la mediana del eje de mayor extensión;
+    las hojas se recorren de forma vectorizada.
+
+        - param points: lista de instancias de Point o arreglo de forma (N, 2).
+        - param leaf_size: número máximo de puntos por hoja.
+
+        Las búsquedas devuelven índices de la entrada original; si el árbol se creó
+        con instancias de Point, point_of(indice) devuelve la instancia original.
+    """
+
+    def __init__(self, points, leaf_size: int = 32):
+        if isinstance(points, np.ndarray):
+            self.points = None
+            coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        else:
+            self.points = list(points)
+            coords = np.array([point.point_getter() for point in self.points],
+                              dtype=np.float64).reshape(-1, 2)
+        if coords.shape[0] == 0:
+            raise ValueError("El árbol KD necesita al menos un punto.")
+        self.leaf_size = max(1, leaf_size)
+        self._order = np.arange(coords.shape[0])
+        # Nodos: rango [lo, hi), eje de división (-1 en hojas), valor y dos hijos
+        self._lo, self._hi, self._axis, self._split = [], [], [], []
+        self._left, self._right = [], []
+        self._build(coords)
+        self._coords = coords
+        sorted_coords = coords[self._order]
+        self._x = np.ascontiguousarray(sorted_coords[:, 0])
+        self._y = np.ascontiguousarray(sorted_coords[:, 1])
+
+    def _new_node(self, lo: int, hi: int) -> int:
+        self._lo.append(lo)
+        self._hi.append(hi)
+        self._axis.append(-1)
+        self._split.append(0.0)
+        self._left.append(-1)
+        self._right.append(-1)
+        return len(self._lo) - 1
+
+    def _build(self, coords: "np.ndarray"):
+        stack = [self._new_node(0, coords.shape[0])]
+        while stack:
+            node = stack.pop()
+            lo, hi = self._lo[node], self._hi[node]
+            if hi - lo <= self.leaf_size:
+                continue
+            block = coords[self._order[lo:hi]]
+            spread = block.max(axis=0) - block.min(axis=0)
+            axis = int(spread[1] > spread[0])
+            middle = (hi - lo) // 2
+            partition = np.argpartition(block[:, axis], middle)
+            self._order[lo:hi] = self._order[lo:hi][partition]
+            self._axis[node] = axis
+            self._split[node] = float(block[partition[middle], axis])
+            self._left[node] = self._new_node(lo, lo + middle)
+            self._right[node] = self._new_node(lo + middle, hi)
+            stack.extend((self._left[node], self._right[node]))
+
+    def __len__(self):
+        return self._order.shape[0]
+
+    def point_of(self, index: int) -> "Point":
+        """Devuelve la instancia de Point original (o una nueva si el árbol se creó con
+        un arreglo) correspondiente a un índice."""
+        if self.points is not None:
+            return self.points[index]
+        x, y = self._coords[index].tolist()
+        return Point(x, y)
+
+    def _query_one(self, x: float, y: float, k: int) -> "tuple":
+        best = []  # montículo de (-distancia², índice) con los k mejores
+        worst = np.inf
+        stack = [(0, 0.0)]
+        while stack:
+            node, plane = stack.pop()
+            if plane >= worst:
+                continue
+            axis = self._axis[node]
+            if axis < 0:
+                lo, hi = self._lo[node], self._hi[node]
+                distances = (self._x[lo:hi] - x)**2 + (self._y[lo:hi] - y)**2
+                for offset in np.flatnonzero(distances < worst).tolist():
+                    item = (-float(distances[offset]), lo + offset)
+                    if len(best) < k:
+                        heappush(best, item)
+                    else:
+                        heappushpop(best, item)
+                    if len(best) == k:
+                        worst = -best[0][0]
+                continue
+            delta = (x if axis == 0 else y) - self._split[node]
+            near, far = ((self._left[node], self._right[node]) if delta < 0
+                         else (self._right[node], self._left[node]))
+            stack.append((far, delta * delta))
+            stack.append((near, plane))
+        best.sort(reverse=True)
+        distances = [(-distance)**0.5 for distance, _ in best]
+        indices = self._order[[position for _, position in best]].tolist()
+        return distances, indices
+
+    def query(self, points, k: int = 1):
+        """Busca los k vecinos más cercanos.
+
+        - param points: un Point, una pareja (x, y) o un arreglo (M, 2) de consultas.
+        - param k: número de vecinos.
+
+        Para una sola consulta devuelve (distancias, índices) como listas ordenadas;
+        para un arreglo devuelve dos arreglos de forma (M, k).
+        """
+        k = min(k, len(self))
+        if isinstance(points, Point):
+            return self._query_one(*points.point_getter(), k)
+        queries = np.asarray(points, dtype=np.float64)
+        if queries.ndim == 1:
+            return self._query_one(float(queries[0]), float(queries[1]), k)
+        distances = np.empty((queries.shape[0], k))
+        indices = np.empty((queries.shape[0], k), dtype=np.int64)
+        for row, (x, y) in enumerate(queries.tolist()):
+            distances[row], indices[row] = self._query_one(x, y, k)
+        return distances, indices
+
+    def nearest_points(self, point: "Point", k: int = 1) -> "list[Point]":
+        """Devuelve las instancias de Point de los k vecinos más cercanos."""
+        return [self.point_of(index) for index in self.query(point, k)[1]]
+
+    def _radius_one(self, x: float, y: float, radius: float) -> "list[int]":
+        found = []
+        squared = radius * radius
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            axis = self._axis[node]
+            if axis < 0:
+                lo, hi = self._lo[node], self._hi[node]
+                distances = (self._x[lo:hi] - x)**2 + (self._y[lo:hi] - y)**2
+                found.append(self._order[lo:hi][distances <= squared])
+                continue
+            delta = (x if axis == 0 else y) - self._split[node]
+            if delta <= radius:
+                stack.append(self._left[node])
+            if delta >= -radius:
+                stack.append(self._right[node])
+        return np.concatenate(found).tolist() if found else []
+
+    def query_radius(self, points, radius: float):
+        """Busca todos los puntos a una distancia menor o igual a radius.
+
+        - param points: un Point, una pareja (x, y) o un arreglo (M, 2) de consultas.
+
+        Devuelve la lista de índices para una consulta, o una lista de listas para un
+        arreglo de consultas.
+        """
+        if isinstance(points, Point):
+            return self._radius_one(*points.point_getter(), radius)
+        queries = np.asarray(points, dtype=np.float64)
+        if queries.ndim == 1:
+            return self._radius_one(float(queries[0]), float(queries[1]), radius)
+        return [self._radius_one(x, y, radius) for x, y in queries.tolist()]
+
+    def _closest_in_blocks(self, first: "tuple", second: "tuple", best: float) -> "tuple":
+        """Busca la pareja más cercana entre dos rangos [lo, hi) del arreglo ordenado
+        (el mismo rango si first == second) y devuelve (distancia², posición,
+        posición) si mejora best, o None."""
+        (lo, hi), (other_lo, other_hi) = first, second
+        dx = self._x[lo:hi, None] - self._x[None, other_lo:other_hi]
+        dy = self._y[lo:hi, None] - self._y[None, other_lo:other_hi]
+        distances = dx * dx + dy * dy
+        if first == second:
+            np.fill_diagonal(distances, np.inf)
+        row, column = np.unravel_index(int(np.argmin(distances)), distances.shape)
+        if distances[row, column] < best:
+            return float(distances[row, column]), lo + int(row), other_lo + int(column)
+        return None
+
+    def closest_pair(self) -> "tuple":
+        """Devuelve (índice, otro índice, distancia) de la pareja de puntos más cercana.
+
+        Primero se busca la pareja más cercana dentro de cada hoja; luego cada hoja se
+        compara, de forma vectorizada, solo con las hojas posteriores que quedan a
+        menos de la mejor distancia de su caja, bajando por el árbol. Cada hoja visita
+        O(log n) nodos, así que el costo es O(n log n) aunque muchos puntos compartan
+        una coordenada.
+        """
+        if len(self) < 2:
+            raise ValueError("Se necesitan al menos dos puntos.")
+        leaves = [node for node, axis in enumerate(self._axis) if axis < 0]
+        best, pair = np.inf, (0, 1)
+        for leaf in leaves:
+            block = (self._lo[leaf], self._hi[leaf])
+            if block[1] - block[0] > 1:
+                found = self._closest_in_blocks(block, block, best)
+                if found is not None:
+                    best, pair = found[0], found[1:]
+        for leaf in leaves:
+            lo, hi = self._lo[leaf], self._hi[leaf]
+            low = (float(self._x[lo:hi].min()), float(self._y[lo:hi].min()))
+            high = (float(self._x[lo:hi].max()), float(self._y[lo:hi].max()))
+            stack = [0]
+            while stack:
+                node = stack.pop()
+                axis = self._axis[node]
+                if axis < 0:
+                    # Cada pareja de hojas se compara una sola vez
+                    if node > leaf:
+                        found = self._closest_in_blocks(
+                            (lo, hi), (self._lo[node], self._hi[node]), best)
+                        if found is not None:
+                            best, pair = found[0], found[1:]
+                    continue
+                distance = best**0.5
+                if low[axis] - distance < self._split[node]:
+                    stack.append(self._left[node])
+                if high[axis] + distance > self._split[node]:
+                    stack.append(self._right[node])
+        first, second = self._order[list(pair)].tolist()
+        return first, second, best**0.5
@@ -0,0 +1,84 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from All_shapes.shape_batch import ShapeBatch
+
+# Resultados que calcula cada trabajador y su tipo de dato
+RESULTS = {"perimeter": np.float64, "area": np.float64, "regular": np.bool_}
+
+# Bloques de memoria compartida ya abiertos en el proceso trabajador
+_attached = {}
+
+
+def _shared_array(name: str, shape: tuple, dtype) -> "np.ndarray":
+    """Devuelve un arreglo sobre un bloque de memoria compartida, abriéndolo solo la
+    primera vez en cada proceso."""
+    if name not in _attached:
+        _attached[name] = shared_memory.SharedMemory(name=name)
+    return np.ndarray(shape, dtype=dtype, buffer=_attached[name].buf)
+
+
+def _evaluate_chunk(layout: dict, start: int, end: int):
+    """Calcula los resultados de los polígonos start:end y los escribe en la memoria
+    compartida de salida."""
+    arrays = {key: _shared_array(*spec) for key, spec in layout.items()}
+    offsets = arrays["offsets"]
+    first, last = offsets[start], offsets[end]
+    batch = ShapeBatch(arrays["coords"][first:last], offsets[start:end + 1] - first)
+    arrays["perimeter"][start:end] = batch.compute_perimeter()
+    arrays["area"][start:end] = batch.compute_area()
+    arrays["regular"][start:end] = batch.compute_regularity()
+
+
+def evaluate(shapes, workers: int = None, chunk_size: int = None) -> dict:
+    """Calcula perímetro, área y regularidad de muchos polígonos usando varios
+    procesos.
+
+    Las coordenadas se copian una sola vez a memoria compartida; los trabajadores
+    reciben solo los nombres de los bloques y el rango de polígonos a procesar, y
+    escriben sus resultados directamente en arreglos compartidos.
+
+    - param shapes: instancia de ShapeBatch o lista de figuras.
+    - param workers: número de procesos; por defecto el número de núcleos.
+    - param chunk_size: polígonos por tarea; por defecto se reparten en cuatro
+    tareas por proceso.
+
+    Devuelve un diccionario con los arreglos "perimeter", "area" y "regular".
+    """
+    batch = shapes if isinstance(shapes, ShapeBatch) else ShapeBatch.from_shapes(shapes)
+    count = len(batch)
+    workers = workers or os.cpu_count()
+    chunk_size = chunk_size or max(1, -(-count // (workers * 4)))
+
+    inputs = {"coords": batch.coords, "offsets": batch.offsets}
+    specs = {key: (array.shape, array.dtype) for key, array in inputs.items()}
+    specs.update({key: ((count,), np.dtype(dtype)) for key, dtype in RESULTS.items()})
+
+    blocks = {}
+    try:
+        layout = {}
+        for key, (shape, dtype) in specs.items():
+            block = shared_memory.SharedMemory(
+                create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+            blocks[key] = block
+            layout[key] = (block.name, shape, dtype)
+            if key in inputs:
+                np.ndarray(shape, dtype=dtype, buffer=block.buf)[...] = inputs[key]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            tasks = [executor.submit(_evaluate_chunk, layout, start,
+                                     min(start + chunk_size, count))
+                     for start in range(0, count, chunk_size)]
+            for task in tasks:
+                task.result()
+
+        return {key: np.ndarray(specs[key][0], dtype=specs[key][1],
+                                buffer=blocks[key].buf).copy()
+                for key in RESULTS}
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
@@ -0,0 +1,191 @@
+import numpy as np
+
+from All_shapes.geometry import Point
+
+# Los nombres usados solo en anotaciones se importan únicamente para los verificadores
+# de tipos, como en geometry
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from All_shapes.transform import Affine
+
+
+class PointView(Point):
+    """Clase Vista de Punto que representa un punto guardado dentro de un PointArray.
+
+    No guarda coordenadas propias: lee y escribe directamente en las columnas del
+    arreglo, por lo que cualquier código que espera un Point sigue funcionando.
+
+        - param array: instancia de PointArray que contiene las coordenadas.
+        - param index: posición del punto dentro del arreglo.
+    """
+
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, array: "PointArray", index: int):
+        self._array = array
+        self._index = index
+
+    @property
+    def _x(self) -> float:
+        return float(self._array.x[self._index])
+
+    @_x.setter
+    def _x(self, value: float):
+        self._array.x[self._index] = value
+
+    @property
+    def _y(self) -> float:
+        return float(self._array.y[self._index])
+
+    @_y.setter
+    def _y(self, value: float):
+        self._array.y[self._index] = value
+
+    def __eq__(self, other):
+        """Dos vistas son iguales si representan la misma posición del mismo arreglo."""
+        if isinstance(other, PointView):
+            return self._array is other._array and self._index == other._index
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self._array), self._index))
+
+    def _watch(self, shape_ref):
+        """Registra la figura en el arreglo, ya que las vistas no son persistentes."""
+        self._array._watch(self._index, shape_ref)
+
+    def _notify_shapes(self):
+        self._array._notify_shapes([self._index])
+
+
+class PointArray:
+    """Clase Arreglo de Puntos que guarda muchos puntos en columnas contiguas.
+
+    Inicializa el objeto con las coordenadas x e y de todos los puntos, guardadas
+    como arreglos float64 de NumPy para poder operar sobre ellos de forma vectorizada.
+
+        - param xs: secuencia con las coordenadas en el eje x.
+        - param ys: secuencia con las coordenadas en el eje y.
+    """
+
+    def __init__(self, xs=(), ys=()):
+        self.x = np.ascontiguousarray(xs, dtype=np.float64).reshape(-1)
+        self.y = np.ascontiguousarray(ys, dtype=np.float64).reshape(-1)
+        if self.x.shape != self.y.shape:
+            raise ValueError("Las columnas x e y deben tener la misma longitud.")
+        # Figuras registradas por índice de punto, ver Shape._watch_vertices
+        self._shapes = {}
+
+    @classmethod
+    def from_points(cls, points: "list[Point]") -> "PointArray":
+        """Crea un PointArray a partir de una lista de instancias de Point."""
+        xs = np.fromiter((point._x for point in points), dtype=np.float64)
+        ys = np.fromiter((point._y for point in points), dtype=np.float64)
+        return cls(xs, ys)
+
+    @classmethod
+    def from_coords(cls, coords) -> "PointArray":
+        """Crea un PointArray a partir de un arreglo de forma (N, 2)."""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        return cls(coords[:, 0], coords[:, 1])
+
+    @property
+    def coords(self) -> "np.ndarray":
+        """Devuelve una copia de las coordenadas como un arreglo de forma (N, 2)."""
+        return np.column_stack((self.x, self.y))
+
+    def point_setter(self, new_x, new_y, indices=None):
+        """Coloca varios puntos en nuevas coordenadas en una sola operación.
+
+        - param new_x: nuevas posiciones en el eje x (escalar o arreglo).
+        - param new_y: nuevas posiciones en el eje y (escalar o arreglo).
+        - param indices: posiciones a modificar; si es None se modifican todos.
+        """
+        if indices is None:
+            indices = slice(None)
+        self.x[indices] = new_x
+        self.y[indices] = new_y
+        if self._shapes:
+            self._notify_shapes(np.arange(len(self))[indices].reshape(-1).tolist())
+
+    def point_getter(self):
+        """Devuelve las columnas x e y del arreglo."""
+        return self.x, self.y
+
+    def transform(self, affine: "Affine", indices=None):
+        """Aplica una transformación afín a los puntos indicados (o a todos) en una
+        sola pasada vectorizada.
+
+        - param affine: instancia de transform.Affine; para encadenar varias
+        transformaciones compóngalas antes con Affine.then.
+        - param indices: posiciones a transformar; si es None se transforman todos.
+        """
+        selection = slice(None) if indices is None else indices
+        self.point_setter(*affine.apply_arrays(self.x[selection], self.y[selection]),
+                          indices)
+
+    def reset(self, indices=None):
+        """Coloca los puntos indicados (o todos) en las coordenadas (0,0)."""
+        self.point_setter(0.0, 0.0, indices)
+
+    def _watch(self, index: int, shape_ref):
+        """Registra una figura que usa el punto indicado como vértice."""
+        shape_refs = self._shapes.setdefault(index, [])
+        shape_refs.append(shape_ref)
+        # Al duplicarse la lista se descartan las figuras que ya no existen
+        if len(shape_refs) & (len(shape_refs) - 1) == 0:
+            shape_refs[:] = [item for item in shape_refs if item() is not None]
+
+    def _notify_shapes(self, indices):
+        """Avisa a las figuras registradas en los puntos indicados que se movieron."""
+        for index in indices:
+            shape_refs = self._shapes.get(index)
+            if not shape_refs:
+                continue
+            alive = []
+            for shape_ref in shape_refs:
+                shape = shape_ref()
+                if shape is not None:
+                    shape._vertex_moved(PointView(self, index))
+                    alive.append(shape_ref)
+            if alive:
+                self._shapes[index] = alive
+            else:
+                del self._shapes[index]
+
+    def compute_distance(self, other) -> "np.ndarray":
+        """Calcula distancias de forma vectorizada y las devuelve como un arreglo.
+
+        - param other: si es un Point se calcula la distancia de cada punto del
+        arreglo a ese punto (uno a muchos); si es un PointArray de la misma longitud
+        se calcula la distancia elemento a elemento.
+        """
+        if isinstance(other, PointArray):
+            if len(other) != len(self):
+                raise ValueError("Los arreglos de puntos deben tener la misma longitud.")
+            return np.hypot(self.x - other.x, self.y - other.y)
+        return np.hypot(self.x - other._x, self.y - other._y)
+
+    def to_points(self) -> "list[Point]":
+        """Devuelve una lista de instancias independientes de Point."""
+        return [Point(x, y) for x, y in zip(self.x.tolist(), self.y.tolist())]
+
+    def __len__(self):
+        return self.x.shape[0]
+
+    def __getitem__(self, index: int) -> "PointView":
+        """Devuelve una vista ligera del punto en la posición indicada."""
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Índice fuera del rango del arreglo de puntos.")
+        return PointView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield PointView(self, index)
+
+    def __str__(self):
+        """Método que devuelve una representación en cadena del arreglo."""
+        return f"Arreglo de {len(self)} puntos."
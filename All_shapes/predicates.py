@@ -0,0 +1,197 @@
+"""Predicados geométricos robustos.
+
+Cada predicado devuelve el signo (-1, 0 o 1) de un determinante. Primero se evalúa
+en punto flotante junto con una cota del error de redondeo (filtro de Shewchuk); solo
+si el valor cae dentro de la cota se repite el cálculo con aritmética exacta
+(fractions.Fraction, que representa cualquier float sin error). Así el resultado es
+siempre el exacto para las coordenadas dadas y el camino lento se usa únicamente en
+casos casi degenerados.
+
+Las coordenadas deben ser finitas.
+"""
+
+# Como en geometry, los nombres de las anotaciones solo se importan para los
+# verificadores de tipos: geometry importa este módulo y NumPy solo se carga en las
+# funciones vectorizadas
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import numpy as np
+
+    from All_shapes.geometry import Point
+
+_EPSILON = 2.0 ** -53
+# Cotas relativas del error de la evaluación en punto flotante
+_CCW_BOUND = (3 + 16 * _EPSILON) * _EPSILON
+_ICC_BOUND = (10 + 96 * _EPSILON) * _EPSILON
+_LENGTH_BOUND = (6 + 64 * _EPSILON) * _EPSILON
+
+# Número de evaluaciones que necesitaron aritmética exacta
+counters = {"exact": 0}
+
+
+def _sign(value) -> int:
+    return (value > 0) - (value < 0)
+
+
+def reset_counters():
+    counters["exact"] = 0
+
+
+def _orient2d_exact(ax, ay, bx, by, cx, cy) -> int:
+    # Se importa aquí para no encarecer la importación del módulo
+    from fractions import Fraction
+
+    counters["exact"] += 1
+    ax, ay, bx, by, cx, cy = map(Fraction, (ax, ay, bx, by, cx, cy))
+    return _sign((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+
+
+def orient2d(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> int:
+    """Orientación del triángulo (a, b, c): 1 si c está a la izquierda de la recta
+    a -> b (sentido antihorario), -1 si está a la derecha y 0 si son colineales."""
+    left = (bx - ax) * (cy - ay)
+    right = (by - ay) * (cx - ax)
+    determinant = left - right
+    if abs(determinant) > _CCW_BOUND * (abs(left) + abs(right)):
+        return 1 if determinant > 0 else -1
+    return _orient2d_exact(ax, ay, bx, by, cx, cy)
+
+
+def orient(p: "Point", q: "Point", r: "Point") -> int:
+    """orient2d para tres instancias de Point."""
+    return orient2d(p._x, p._y, q._x, q._y, r._x, r._y)
+
+
+def _incircle_exact(ax, ay, bx, by, cx, cy, dx, dy) -> int:
+    from fractions import Fraction
+
+    counters["exact"] += 1
+    ax, ay, bx, by, cx, cy, dx, dy = map(Fraction, (ax, ay, bx, by, cx, cy, dx, dy))
+    adx, ady, bdx, bdy, cdx, cdy = ax - dx, ay - dy, bx - dx, by - dy, cx - dx, cy - dy
+    return _sign((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy) +
+                 (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy) +
+                 (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
+
+
+def incircle(ax: float, ay: float, bx: float, by: float, cx: float, cy: float,
+             dx: float, dy: float) -> int:
+    """Posición de d respecto a la circunferencia que pasa por a, b y c (dados en
+    sentido antihorario): 1 si está dentro, -1 si está fuera y 0 si está sobre ella.
+    Si a, b y c están en sentido horario el signo se invierte."""
+    adx, ady, bdx, bdy, cdx, cdy = ax - dx, ay - dy, bx - dx, by - dy, cx - dx, cy - dy
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+    determinant = (alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) +
+                   clift * (adxbdy - bdxady))
+    permanent = ((abs(bdxcdy) + abs(cdxbdy)) * alift + (abs(cdxady) + abs(adxcdy)) * blift +
+                 (abs(adxbdy) + abs(bdxady)) * clift)
+    if abs(determinant) > _ICC_BOUND * permanent:
+        return 1 if determinant > 0 else -1
+    return _incircle_exact(ax, ay, bx, by, cx, cy, dx, dy)
+
+
+def _dot_exact(ax, ay, bx, by, cx, cy) -> int:
+    from fractions import Fraction
+
+    counters["exact"] += 1
+    ax, ay, bx, by, cx, cy = map(Fraction, (ax, ay, bx, by, cx, cy))
+    return _sign((ax - bx) * (cx - bx) + (ay - by) * (cy - by))
+
+
+def dot_sign(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> int:
+    """Signo del producto punto (a - b) · (c - b): 0 si el ángulo en b es recto, 1 si
+    es agudo y -1 si es obtuso."""
+    first = (ax - bx) * (cx - bx)
+    second = (ay - by) * (cy - by)
+    dot = first + second
+    if abs(dot) > _CCW_BOUND * (abs(first) + abs(second)):
+        return 1 if dot > 0 else -1
+    return _dot_exact(ax, ay, bx, by, cx, cy)
+
+
+def _compare_lengths_exact(ax, ay, bx, by, cx, cy, dx, dy) -> int:
+    from fractions import Fraction
+
+    counters["exact"] += 1
+    ax, ay, bx, by, cx, cy, dx, dy = map(Fraction, (ax, ay, bx, by, cx, cy, dx, dy))
+    return _sign((bx - ax)**2 + (by - ay)**2 - (dx - cx)**2 - (dy - cy)**2)
+
+
+def compare_lengths(ax: float, ay: float, bx: float, by: float, cx: float, cy: float,
+                    dx: float, dy: float) -> int:
+    """Compara las longitudes de los segmentos ab y cd: 1 si ab es más largo, -1 si
+    es más corto y 0 si miden exactamente lo mismo."""
+    first = (bx - ax) * (bx - ax) + (by - ay) * (by - ay)
+    second = (dx - cx) * (dx - cx) + (dy - cy) * (dy - cy)
+    difference = first - second
+    if abs(difference) > _LENGTH_BOUND * (first + second):
+        return 1 if difference > 0 else -1
+    return _compare_lengths_exact(ax, ay, bx, by, cx, cy, dx, dy)
+
+
+def intersection_parameter(ax: float, ay: float, bx: float, by: float, cx: float,
+                           cy: float, dx: float, dy: float) -> float:
+    """Parámetro t del punto a + t (b - a) donde la recta ab corta a la recta cd,
+    calculado de forma exacta y redondeado al final; sirve para rectas casi paralelas,
+    en las que el denominador en punto flotante puede redondearse a cero."""
+    from fractions import Fraction
+
+    ax, ay, bx, by, cx, cy, dx, dy = map(Fraction, (ax, ay, bx, by, cx, cy, dx, dy))
+    denominator = (bx - ax) * (dy - cy) - (by - ay) * (dx - cx)
+    if denominator == 0:
+        raise ValueError("Las rectas son paralelas.")
+    return float(((cx - ax) * (dy - cy) - (cy - ay) * (dx - cx)) / denominator)
+
+
+def _columns(*arrays) -> "list":
+    import numpy as np
+
+    return [np.asarray(array, dtype=np.float64).reshape(-1, 2) for array in arrays]
+
+
+def orient2d_array(a, b, c) -> "np.ndarray":
+    """Versión vectorizada de orient2d para arreglos de forma (N, 2); devuelve un
+    arreglo int8 de signos. Solo las filas que el filtro no puede decidir se
+    recalculan de forma exacta."""
+    import numpy as np
+
+    a, b, c = _columns(a, b, c)
+    left = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1])
+    right = (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+    determinant = left - right
+    signs = np.sign(determinant).astype(np.int8)
+    uncertain = np.flatnonzero(np.abs(determinant) <= _CCW_BOUND * (np.abs(left) +
+                                                                    np.abs(right)))
+    for row in uncertain.tolist():
+        signs[row] = _orient2d_exact(*a[row].tolist(), *b[row].tolist(), *c[row].tolist())
+    return signs
+
+
+def incircle_array(a, b, c, d) -> "np.ndarray":
+    """Versión vectorizada de incircle para arreglos de forma (N, 2); devuelve un
+    arreglo int8 de signos."""
+    import numpy as np
+
+    a, b, c, d = _columns(a, b, c, d)
+    ad, bd, cd = a - d, b - d, c - d
+    bdxcdy, cdxbdy = bd[:, 0] * cd[:, 1], cd[:, 0] * bd[:, 1]
+    cdxady, adxcdy = cd[:, 0] * ad[:, 1], ad[:, 0] * cd[:, 1]
+    adxbdy, bdxady = ad[:, 0] * bd[:, 1], bd[:, 0] * ad[:, 1]
+    alift = (ad * ad).sum(axis=1)
+    blift = (bd * bd).sum(axis=1)
+    clift = (cd * cd).sum(axis=1)
+    determinant = (alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) +
+                   clift * (adxbdy - bdxady))
+    permanent = ((np.abs(bdxcdy) + np.abs(cdxbdy)) * alift +
+                 (np.abs(cdxady) + np.abs(adxcdy)) * blift +
+                 (np.abs(adxbdy) + np.abs(bdxady)) * clift)
+    signs = np.sign(determinant).astype(np.int8)
+    uncertain = np.flatnonzero(np.abs(determinant) <= _ICC_BOUND * permanent)
+    for row in uncertain.tolist():
+        signs[row] = _incircle_exact(*a[row].tolist(), *b[row].tolist(),
+                                     *c[row].tolist(), *d[row].tolist())
+    return signs
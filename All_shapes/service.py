@@ -0,0 +1,246 @@
+"""Servicio asyncio de geometría con agrupación de peticiones en lotes.
+
+Protocolo: una petición JSON por línea y una respuesta JSON por línea.
+
+    {"id": 1, "op": "distance", "vertices": [[0, 0], [3, 4]]}
+    {"id": 1, "result": 5.0}
+
+Operaciones: distance (dos vértices), perimeter, area, inner_angles y classify
+(tres vértices). Las peticiones de una misma operación que llegan dentro de la
+ventana de latencia se calculan juntas en una sola pasada vectorizada.
+
+Uso:
+    python -m All_shapes.service --port 8765
+    python -m All_shapes.service --unix /tmp/geometry.sock
+"""
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import deque
+
+import numpy as np
+
+from All_shapes.classify import classify_triangles
+from All_shapes.shape_batch import ShapeBatch
+
+
+def _distance(requests: list) -> list:
+    coords = np.array([request["vertices"] for request in requests], dtype=np.float64)
+    delta = coords[:, 1] - coords[:, 0]
+    return np.hypot(delta[:, 0], delta[:, 1]).tolist()
+
+
+def _perimeter(requests: list) -> list:
+    return ShapeBatch.from_polygons([r["vertices"] for r in requests]).compute_perimeter().tolist()
+
+
+def _area(requests: list) -> list:
+    return ShapeBatch.from_polygons([r["vertices"] for r in requests]).compute_area().tolist()
+
+
+def _inner_angles(requests: list) -> list:
+    batch = ShapeBatch.from_polygons([request["vertices"] for request in requests])
+    return [angles.tolist() for angles in batch.split(batch.compute_inner_angles())]
+
+
+def _classify(requests: list) -> list:
+    return classify_triangles([request["vertices"] for request in requests]).tolist()
+
+
+# Operación: (función vectorizada, número de vértices requerido o mínimo)
+OPERATIONS = {
+    "distance": (_distance, 2),
+    "perimeter": (_perimeter, -3),
+    "area": (_area, -3),
+    "inner_angles": (_inner_angles, -3),
+    "classify": (_classify, 3),
+}
+
+# Número de latencias recientes que guarda el servicio para stats
+LATENCY_SAMPLES = 100_000
+
+
+def validate(request: dict):
+    """Verifica una petición antes de agregarla a un lote, para que una petición
+    inválida no haga fallar a las demás."""
+    if request.get("op") not in OPERATIONS:
+        raise ValueError(f"Operación desconocida: {request.get('op')}.")
+    vertices = request.get("vertices")
+    if not isinstance(vertices, list) or not all(
+            isinstance(vertex, list) and len(vertex) == 2 for vertex in vertices):
+        raise ValueError("vertices debe ser una lista de pares [x, y].")
+    # bool es subclase de int, pero no es una coordenada
+    if not all(isinstance(value, (int, float)) and not isinstance(value, bool) and
+               math.isfinite(value) for vertex in vertices for value in vertex):
+        raise ValueError("Las coordenadas deben ser números finitos.")
+    required = OPERATIONS[request["op"]][1]
+    if (required > 0 and len(vertices) != required or
+            required < 0 and len(vertices) < -required):
+        raise ValueError(f"Número de vértices inválido para {request['op']}.")
+
+
+class _Batcher:
+    """Acumula las peticiones de una operación y las calcula juntas al cerrar la
+    ventana de latencia o al llenar el lote."""
+
+    def __init__(self, service: "GeometryService", compute):
+        self._service = service
+        self._compute = compute
+        self._pending = []
+        self._timer = None
+
+    def submit(self, request: dict) -> "asyncio.Future":
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self._service.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._service.window, self._flush)
+        return future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        items, self._pending = self._pending, []
+        if items:
+            self._service._tasks.add(asyncio.ensure_future(self._run(items)))
+
+    async def _run(self, items: list):
+        requests = [request for request, _ in items]
+        try:
+            if len(requests) >= self._service.offload_threshold:
+                loop = asyncio.get_running_loop()
+                results = await loop.run_in_executor(
+                    self._service.executor, self._compute, requests)
+            else:
+                results = self._compute(requests)
+        except Exception as error:
+            if len(items) == 1:
+                if not items[0][1].done():
+                    items[0][1].set_exception(error)
+            else:
+                # Se repite cada petición por separado para que el error solo le
+                # llegue a la que lo causó
+                for item in items:
+                    await self._run([item])
+        else:
+            for (_, future), result in zip(items, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._service._tasks.discard(asyncio.current_task())
+
+
+class GeometryService:
+    """Clase Servicio de Geometría que atiende peticiones JSON por TCP o socket Unix.
+
+        - param window: segundos que se espera para juntar peticiones en un lote.
+        - param max_batch: tamaño de lote con el que se calcula sin esperar la ventana.
+        - param offload_threshold: tamaño de lote a partir del cual el cálculo se hace
+        en el ejecutor, para no bloquear el bucle de eventos.
+        - param executor: ejecutor para los lotes grandes; None usa el del bucle.
+
+        Tiene los atributos adicionales requests, con el número de peticiones
+        atendidas, y latencies, con la latencia en segundos de las últimas
+        LATENCY_SAMPLES, que se resumen con el método stats.
+    """
+
+    def __init__(self, window: float = 0.002, max_batch: int = 1024,
+                 offload_threshold: int = 256, executor=None):
+        self.window = window
+        self.max_batch = max_batch
+        self.offload_threshold = offload_threshold
+        self.executor = executor
+        self.requests = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._batchers = {op: _Batcher(self, compute)
+                          for op, (compute, _) in OPERATIONS.items()}
+        self._tasks = set()
+        self._started = None
+        self._server = None
+
+    async def handle(self, request: dict):
+        """Atiende una petición ya decodificada y devuelve su resultado."""
+        validate(request)
+        return await self._batchers[request["op"]].submit(request)
+
+    async def _respond(self, line: bytes, writer: "asyncio.StreamWriter"):
+        start = time.perf_counter()
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            response = {"id": request_id, "result": await self.handle(request)}
+        except Exception as error:
+            response = {"id": request_id, "error": str(error)}
+        self.requests += 1
+        self.latencies.append(time.perf_counter() - start)
+        if not writer.is_closing():
+            writer.write(json.dumps(response).encode() + b"\n")
+
+    async def _client(self, reader: "asyncio.StreamReader", writer: "asyncio.StreamWriter"):
+        responses = set()
+        try:
+            while line := await reader.readline():
+                task = asyncio.ensure_future(self._respond(line, writer))
+                responses.add(task)
+                task.add_done_callback(responses.discard)
+            if responses:
+                await asyncio.gather(*responses)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765, path: str = None):
+        """Empieza a escuchar en host:port o, si se indica path, en un socket Unix."""
+        self._started = time.perf_counter()
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._client, path=path)
+        else:
+            self._server = await asyncio.start_server(self._client, host, port)
+        return self._server
+
+    async def close(self):
+        """Deja de aceptar conexiones y espera a que se cierre el servidor."""
+        self._server.close()
+        await self._server.wait_closed()
+
+    def stats(self) -> dict:
+        """Devuelve el número de peticiones, las latencias p50 y p99 en milisegundos y
+        las peticiones por segundo desde que empezó el servidor; las latencias son las
+        de las últimas LATENCY_SAMPLES peticiones."""
+        if not self.latencies:
+            return {"requests": 0, "p50_ms": 0.0, "p99_ms": 0.0, "requests_per_s": 0.0}
+        p50, p99 = np.percentile(self.latencies, [50, 99]) * 1e3
+        elapsed = time.perf_counter() - self._started
+        return {"requests": self.requests, "p50_ms": float(p50),
+                "p99_ms": float(p99), "requests_per_s": self.requests / elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="ruta de un socket Unix en lugar de TCP")
+    parser.add_argument("--window", type=float, default=0.002)
+    parser.add_argument("--max-batch", type=int, default=1024)
+    args = parser.parse_args()
+
+    async def serve():
+        service = GeometryService(args.window, args.max_batch)
+        server = await service.start(args.host, args.port, args.unix)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
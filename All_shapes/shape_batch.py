@@ -0,0 +1,165 @@
+import numpy as np
+
+from All_shapes.geometry import Point, Shape
+
+# Los nombres usados solo en anotaciones se importan únicamente para los verificadores
+# de tipos, como en geometry
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from All_shapes.transform import Affine
+
+
+class ShapeBatch:
+    """Clase Lote de Figuras que guarda muchos polígonos en un único búfer plano.
+
+    Los vértices de todos los polígonos se guardan seguidos en un arreglo de forma
+    (M, 2) y un arreglo de desplazamientos de longitud N + 1 indica dónde empieza y
+    termina cada polígono (arreglo irregular). Todas las métricas se calculan para
+    todos los polígonos en pasadas vectorizadas.
+
+        - param coords: arreglo de forma (M, 2) con los vértices de todos los polígonos.
+        - param offsets: arreglo de enteros de longitud N + 1; el polígono i ocupa las
+        filas offsets[i]:offsets[i + 1] de coords.
+    """
+
+    def __init__(self, coords, offsets):
+        self._coords = np.ascontiguousarray(coords, dtype=np.float64).reshape(-1, 2)
+        self._pending = None
+        self.offsets = np.ascontiguousarray(offsets, dtype=np.int64).reshape(-1)
+        if (self.offsets.shape[0] == 0 or self.offsets[0] != 0
+                or self.offsets[-1] != self._coords.shape[0]):
+            raise ValueError("Los desplazamientos no coinciden con el búfer de coordenadas.")
+        if np.any(np.diff(self.offsets) < 3):
+            raise ValueError("Cada polígono del lote debe tener al menos 3 vértices.")
+        self._neighbours = None
+
+    @classmethod
+    def from_polygons(cls, polygons) -> "ShapeBatch":
+        """Crea un lote a partir de una secuencia de listas de pares (x, y)."""
+        counts = []
+        flat = []
+        for polygon in polygons:
+            counts.append(len(polygon))
+            flat.extend(polygon)
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(np.asarray(flat, dtype=np.float64).reshape(-1, 2), offsets)
+
+    @classmethod
+    def from_shapes(cls, shapes: "list[Shape]") -> "ShapeBatch":
+        """Crea un lote a partir de instancias de Shape (o de sus subclases)."""
+        return cls.from_polygons(
+            [[point.point_getter() for point in shape.vertices] for shape in shapes])
+
+    @property
+    def coords(self) -> "np.ndarray":
+        """Arreglo de forma (M, 2) con los vértices de todos los polígonos; si hay una
+        transformación pendiente (ver transform) se aplica antes de devolverlo."""
+        if self._pending is not None:
+            self._coords = self._pending.apply_coords(self._coords)
+            self._pending = None
+        return self._coords
+
+    def transform(self, affine: "Affine") -> "ShapeBatch":
+        """Aplica una transformación afín a todos los polígonos de forma perezosa.
+
+        - param affine: instancia de transform.Affine.
+
+        Las transformaciones se componen y se aplican en una sola pasada vectorizada
+        la próxima vez que se leen las coordenadas; el resultado es un arreglo nuevo,
+        por lo que también funciona con lotes de solo lectura (ver store.ShapeStore).
+        Devuelve el propio lote para encadenar.
+        """
+        self._pending = affine if self._pending is None else self._pending.then(affine)
+        return self
+
+    @property
+    def counts(self) -> "np.ndarray":
+        """Devuelve el número de vértices de cada polígono."""
+        return np.diff(self.offsets)
+
+    def _adjacency(self):
+        """Calcula (una sola vez) el índice del polígono, el vértice siguiente y el
+        anterior de cada fila del búfer."""
+        if self._neighbours is None:
+            size = self.coords.shape[0]
+            starts = self.offsets[:-1]
+            ends = self.offsets[1:] - 1
+            polygon_ids = np.repeat(np.arange(len(self)), self.counts)
+            following = np.arange(1, size + 1)
+            following[ends] = starts
+            previous = np.arange(-1, size - 1)
+            previous[starts] = ends
+            self._neighbours = polygon_ids, following, previous
+        return self._neighbours
+
+    def edge_lengths(self) -> "np.ndarray":
+        """Devuelve la longitud de la arista que sale de cada vértice del búfer."""
+        _, following, _ = self._adjacency()
+        delta = self.coords[following] - self.coords
+        return np.hypot(delta[:, 0], delta[:, 1])
+
+    def compute_perimeter(self) -> "np.ndarray":
+        """Calcula el perímetro de todos los polígonos y lo devuelve como un arreglo."""
+        polygon_ids, _, _ = self._adjacency()
+        return np.bincount(polygon_ids, weights=self.edge_lengths(), minlength=len(self))
+
+    def compute_signed_area(self) -> "np.ndarray":
+        """Calcula el área con signo (fórmula del cordón de zapato) de todos los
+        polígonos; es positiva si los vértices están en sentido antihorario."""
+        polygon_ids, following, _ = self._adjacency()
+        x, y = self.coords[:, 0], self.coords[:, 1]
+        cross = x * y[following] - x[following] * y
+        return 0.5 * np.bincount(polygon_ids, weights=cross, minlength=len(self))
+
+    def compute_area(self) -> "np.ndarray":
+        """Calcula el área de todos los polígonos y la devuelve como un arreglo."""
+        return np.abs(self.compute_signed_area())
+
+    def compute_regularity(self) -> "np.ndarray":
+        """Indica para cada polígono si todas sus aristas miden lo mismo, con la misma
+        comparación (math.isclose) que usa Shape.is_valid."""
+        polygon_ids, _, _ = self._adjacency()
+        lengths = self.edge_lengths()
+        first = lengths[self.offsets[:-1]][polygon_ids]
+        close = np.abs(lengths - first) <= 1e-09 * np.maximum(np.abs(lengths), np.abs(first))
+        return np.bincount(polygon_ids, weights=~close, minlength=len(self)) == 0
+
+    def compute_inner_angles(self) -> "np.ndarray":
+        """Calcula el ángulo interno (en grados) de cada vértice del búfer.
+
+        El resultado está alineado con coords; use split para obtener una lista por
+        polígono.
+        """
+        polygon_ids, following, previous = self._adjacency()
+        incoming = self.coords - self.coords[previous]
+        outgoing = self.coords[following] - self.coords
+        cross = incoming[:, 0] * outgoing[:, 1] - incoming[:, 1] * outgoing[:, 0]
+        dot = (incoming * outgoing).sum(axis=1)
+        orientation = np.where(self.compute_signed_area() < 0, -1.0, 1.0)[polygon_ids]
+        turn = np.degrees(np.arctan2(cross, dot)) * orientation
+        return 180.0 - turn
+
+    def split(self, values) -> "list[np.ndarray]":
+        """Divide un arreglo alineado con coords en un arreglo por polígono."""
+        return np.split(np.asarray(values), self.offsets[1:-1])
+
+    def to_shape(self, index: int) -> "Shape":
+        """Construye una instancia de Shape con los vértices del polígono indicado."""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return Shape(False, [Point(x, y) for x, y in self.coords[start:end].tolist()])
+
+    def __len__(self):
+        return self.offsets.shape[0] - 1
+
+    def __getitem__(self, index: int) -> "np.ndarray":
+        """Devuelve una vista de las coordenadas del polígono indicado."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice fuera del rango del lote de figuras.")
+        return self.coords[self.offsets[index]:self.offsets[index + 1]]
+
+    def __str__(self):
+        """Método que devuelve una representación en cadena del lote."""
+        return f"Lote de {len(self)} figuras con {self.coords.shape[0]} vértices."
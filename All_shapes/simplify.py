@@ -0,0 +1,236 @@
+from collections import namedtuple
+from heapq import heapify, heappop, heappush
+
+import numpy as np
+
+from All_shapes.geometry import Shape
+from All_shapes.shape_batch import ShapeBatch
+
+SimplifyReport = namedtuple("SimplifyReport", ["vertices_before", "vertices_after",
+                                               "reduction", "area_error",
+                                               "perimeter_error"])
+
+METHODS = ("douglas_peucker", "visvalingam")
+
+
+def _relative_error(before, after):
+    before = np.asarray(before, dtype=np.float64)
+    difference = np.abs(np.asarray(after, dtype=np.float64) - before)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(before > 0, difference / before, difference)
+
+
+def _report(counts_before, before_area, before_perimeter, counts_after,
+            after_area, after_perimeter) -> "SimplifyReport":
+    counts_before = np.asarray(counts_before)
+    counts_after = np.asarray(counts_after)
+    return SimplifyReport(counts_before, counts_after, 1 - counts_after / counts_before,
+                          _relative_error(before_area, after_area),
+                          _relative_error(before_perimeter, after_perimeter))
+
+
+def _group_argmax(values: "np.ndarray", starts: "np.ndarray",
+                  lengths: "np.ndarray") -> "np.ndarray":
+    """Posición del máximo de cada grupo contiguo (no vacío) de values."""
+    maxima = np.maximum.reduceat(values, starts)
+    groups = np.repeat(np.arange(starts.shape[0]), lengths)
+    hits = np.flatnonzero(values >= maxima[groups])
+    # hits está ordenado, así que el primero de cada grupo es donde cambia el grupo
+    owners = groups[hits]
+    first = np.ones(hits.shape[0], dtype=bool)
+    first[1:] = owners[1:] != owners[:-1]
+    return hits[first]
+
+
+def _douglas_peucker(coords: "np.ndarray", offsets: "np.ndarray",
+                     tolerance: float) -> "np.ndarray":
+    """Devuelve la máscara de vértices conservados por Douglas-Peucker para todos
+    los polígonos de un búfer plano.
+
+    Cada anillo se corta en su primer vértice y en el más lejano a él, y se
+    simplifican las dos cadenas. Todos los tramos pendientes de todos los polígonos
+    se procesan juntos en cada nivel, por lo que hay una pasada vectorizada por nivel
+    de la recursión y no una por tramo.
+    """
+    size, count = coords.shape[0], offsets.shape[0] - 1
+    counts = np.diff(offsets)
+    polygon_ids = np.repeat(np.arange(count), counts)
+    # Búfer extendido: cada anillo se cierra repitiendo su primer vértice al final
+    rows = np.arange(size) + polygon_ids
+    closing = offsets[1:] + np.arange(count)
+    extended = np.empty((size + count, 2))
+    extended[rows] = coords
+    extended[closing] = coords[offsets[:-1]]
+    extended_x, extended_y = extended[:, 0].copy(), extended[:, 1].copy()
+    starts = offsets[:-1] + np.arange(count)
+
+    distance = ((coords - coords[offsets[:-1]][polygon_ids])**2).sum(axis=1)
+    farthest = _group_argmax(distance, offsets[:-1], counts) + polygon_ids[offsets[:-1]]
+    kept = np.zeros(size + count, dtype=bool)
+    kept[starts] = kept[farthest] = True
+
+    first = np.concatenate((starts, farthest))
+    last = np.concatenate((farthest, closing))
+    fallback = None
+    while first.shape[0]:
+        lengths = last - first - 1
+        active = lengths > 0
+        first, last, lengths = first[active], last[active], lengths[active]
+        if not first.shape[0]:
+            break
+        group_starts = np.cumsum(lengths) - lengths
+        groups = np.repeat(np.arange(first.shape[0]), lengths)
+        index = np.arange(groups.shape[0]) - group_starts[groups] + first[groups] + 1
+        start_x, start_y = extended_x[first], extended_y[first]
+        direction_x = extended_x[last] - start_x
+        direction_y = extended_y[last] - start_y
+        norm = np.hypot(direction_x, direction_y)
+        # Los tramos de longitud cero usan la distancia al punto inicial
+        degenerate = norm == 0
+        norm[degenerate] = 1
+        offset_x = extended_x[index] - start_x[groups]
+        offset_y = extended_y[index] - start_y[groups]
+        distance = np.abs(direction_x[groups] * offset_y - direction_y[groups] * offset_x)
+        distance /= norm[groups]
+        if degenerate.any():
+            points = degenerate[groups]
+            distance[points] = np.hypot(offset_x[points], offset_y[points])
+        best = _group_argmax(distance, group_starts, lengths)
+        split_at, split_distance = index[best], distance[best]
+        if fallback is None:
+            fallback = split_at, split_distance
+        split = split_distance > tolerance
+        kept[split_at[split]] = True
+        first = np.concatenate((first[split], split_at[split]))
+        last = np.concatenate((split_at[split], last[split]))
+
+    kept = kept[rows]
+    # Los anillos de hasta tres vértices se conservan completos
+    kept |= np.repeat(counts <= 3, counts)
+    # Un anillo más delgado que la tolerancia conserva su vértice más alejado
+    short = np.bincount(polygon_ids, weights=kept, minlength=count) < np.minimum(3, counts)
+    if fallback is not None and short.any():
+        split_at, split_distance = fallback
+        owners = np.searchsorted(starts, split_at, side="right") - 1
+        candidates = np.flatnonzero(short[owners])
+        order = candidates[np.lexsort((-split_distance[candidates], owners[candidates]))]
+        _, first_of_owner = np.unique(owners[order], return_index=True)
+        chosen = split_at[order[first_of_owner]]
+        kept[chosen - owners[order[first_of_owner]]] = True
+    # Si el primer vértice, el más lejano y el de la división coinciden (vértices
+    # repetidos) se completan con los primeros vértices no conservados
+    short = np.bincount(polygon_ids, weights=kept, minlength=count) < np.minimum(3, counts)
+    for polygon in np.flatnonzero(short).tolist():
+        start, end = int(offsets[polygon]), int(offsets[polygon + 1])
+        missing = 3 - int(kept[start:end].sum())
+        kept[start + np.flatnonzero(~kept[start:end])[:missing]] = True
+    return kept
+
+
+def _visvalingam_ring(xs: "list", ys: "list", tolerance: float) -> "list[int]":
+    """Devuelve los índices conservados por Visvalingam-Whyatt en un anillo.
+
+    Se elimina repetidamente el vértice cuyo triángulo con sus vecinos tiene menor
+    área efectiva, mientras esa área sea menor que tolerance y queden más de tres
+    vértices. El área de un vecino nunca baja de la del vértice eliminado, para que
+    el orden de eliminación sea monótono.
+    """
+    size = len(xs)
+    previous = [index - 1 for index in range(size)]
+    previous[0] = size - 1
+    following = [index + 1 for index in range(size)]
+    following[-1] = 0
+
+    def triangle(index):
+        p, n = previous[index], following[index]
+        return abs((xs[index] - xs[p]) * (ys[n] - ys[p]) -
+                   (xs[n] - xs[p]) * (ys[index] - ys[p])) / 2
+
+    areas = [triangle(index) for index in range(size)]
+    heap = [(area, index) for index, area in enumerate(areas)]
+    heapify(heap)
+    removed = [False] * size
+    remaining = size
+    while heap and remaining > 3:
+        area, index = heappop(heap)
+        if removed[index] or area != areas[index]:
+            continue
+        if area >= tolerance:
+            break
+        removed[index] = True
+        remaining -= 1
+        p, n = previous[index], following[index]
+        following[p], previous[n] = n, p
+        for neighbour in (p, n):
+            areas[neighbour] = max(triangle(neighbour), area)
+            heappush(heap, (areas[neighbour], neighbour))
+    return [index for index in range(size) if not removed[index]]
+
+
+def _kept_mask(coords: "np.ndarray", offsets: "np.ndarray", tolerance: float,
+               method: str) -> "np.ndarray":
+    if method == "douglas_peucker":
+        return _douglas_peucker(coords, offsets, tolerance)
+    if method == "visvalingam":
+        kept = np.zeros(coords.shape[0], dtype=bool)
+        xs, ys = coords[:, 0].tolist(), coords[:, 1].tolist()
+        for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist()):
+            ring = _visvalingam_ring(xs[start:end], ys[start:end], tolerance)
+            kept[np.asarray(ring, dtype=np.int64) + start] = True
+        return kept
+    raise ValueError(f"Método de simplificación desconocido, use uno de {METHODS}.")
+
+
+def simplify(shape, tolerance: float, method: str = "douglas_peucker") -> "tuple":
+    """Simplifica una figura reduciendo su número de vértices.
+
+    - param shape: instancia de Shape (o de sus subclases) o lista de Point.
+    - param tolerance: con "douglas_peucker", distancia máxima de un vértice eliminado
+    a la figura simplificada; con "visvalingam", área mínima del triángulo que forma
+    un vértice con sus vecinos para conservarlo.
+    - param method: "douglas_peucker" o "visvalingam".
+
+    Devuelve (figura simplificada, SimplifyReport). La figura nueva es un Shape que usa
+    las mismas instancias de Point que la original; el reporte indica el número de
+    vértices antes y después, la fracción eliminada y el error relativo de área y
+    perímetro. Siempre se conservan al menos tres vértices.
+    """
+    original = shape if isinstance(shape, Shape) else Shape(False, list(shape))
+    vertices = original.vertices
+    coords = np.array([point.point_getter() for point in vertices],
+                      dtype=np.float64).reshape(-1, 2)
+    if coords.shape[0] <= 3:
+        kept = np.ones(coords.shape[0], dtype=bool)
+    else:
+        kept = _kept_mask(coords, np.array([0, coords.shape[0]]), tolerance, method)
+    simplified = Shape(False, [vertices[index] for index in np.flatnonzero(kept).tolist()])
+    report = SimplifyReport(len(vertices), len(simplified.vertices),
+                            1 - len(simplified.vertices) / len(vertices),
+                            float(_relative_error(original.area, simplified.area)),
+                            float(_relative_error(original.perimeter,
+                                                  simplified.perimeter)))
+    return simplified, report
+
+
+def simplify_batch(batch: "ShapeBatch", tolerance: float,
+                   method: str = "douglas_peucker") -> "tuple":
+    """Simplifica todos los polígonos de un ShapeBatch.
+
+    - param batch: instancia de ShapeBatch (búfer plano de coordenadas y
+    desplazamientos).
+    - param tolerance: ver simplify.
+    - param method: "douglas_peucker" (vectorizado sobre todo el lote) o
+    "visvalingam" (un recorrido por polígono).
+
+    Devuelve (ShapeBatch simplificado, SimplifyReport) donde cada campo del reporte es
+    un arreglo con un valor por polígono.
+    """
+    kept = _kept_mask(batch.coords, batch.offsets, tolerance, method)
+    polygon_ids = np.repeat(np.arange(len(batch)), batch.counts)
+    counts = np.bincount(polygon_ids[kept], minlength=len(batch))
+    offsets = np.zeros(len(batch) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    simplified = ShapeBatch(batch.coords[kept], offsets)
+    report = _report(batch.counts, batch.compute_area(), batch.compute_perimeter(),
+                     counts, simplified.compute_area(), simplified.compute_perimeter())
+    return simplified, report
@@ -0,0 +1,209 @@
+from math import ceil, sqrt
+
+from All_shapes.geometry import Shape
+
+
+def _union(boxes) -> "tuple":
+    """Devuelve la caja que contiene a todas las cajas dadas."""
+    min_x, min_y, max_x, max_y = zip(*boxes)
+    return min(min_x), min(min_y), max(max_x), max(max_y)
+
+
+def _intersects(a: "tuple", b: "tuple") -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _contains(outer: "tuple", inner: "tuple") -> bool:
+    return (outer[0] <= inner[0] and outer[1] <= inner[1] and
+            inner[2] <= outer[2] and inner[3] <= outer[3])
+
+
+def _box_area(box: "tuple") -> float:
+    return (box[2] - box[0]) * (box[3] - box[1])
+
+
+class _Node:
+    """Nodo del árbol R; en las hojas children es una lista de parejas
+    (caja, figura) y en los nodos internos una lista de nodos."""
+
+    __slots__ = ("bbox", "leaf", "children")
+
+    def __init__(self, leaf: bool, children: list):
+        self.leaf = leaf
+        self.children = children
+        self.bbox = None
+        self.refresh()
+
+    def box_of(self, child) -> "tuple":
+        return child[0] if self.leaf else child.bbox
+
+    def refresh(self):
+        """Recalcula la caja del nodo a partir de sus hijos."""
+        if self.children:
+            self.bbox = _union([self.box_of(child) for child in self.children])
+
+
+class ShapeIndex:
+    """Clase Índice de Figuras, un árbol R empaquetado con STR (Sort-Tile-Recursive)
+    sobre las cajas envolventes de las figuras.
+
+    Inicializa el índice cargando de una sola vez las figuras dadas; luego admite
+    inserciones y eliminaciones individuales. Las consultas devuelven las instancias
+    originales de Shape cuyas cajas envolventes tocan la ventana o el punto pedido.
+
+        - param shapes: figuras con las que se construye el índice.
+        - param node_capacity: número máximo de hijos por nodo.
+
+        Si una figura indexada se mueve, debe llamarse a update para que el índice
+        use su nueva caja envolvente.
+    """
+
+    def __init__(self, shapes: "list[Shape]" = (), node_capacity: int = 16):
+        if node_capacity < 2:
+            raise ValueError("La capacidad de los nodos debe ser al menos 2.")
+        self.node_capacity = node_capacity
+        self._boxes = {}
+        entries = []
+        for shape in shapes:
+            box = shape.bounding_box
+            self._boxes[id(shape)] = box
+            entries.append((box, shape))
+        self._root = self._bulk_load(entries)
+
+    def _bulk_load(self, entries: list) -> "_Node":
+        """Construye el árbol de abajo hacia arriba con el algoritmo STR."""
+        nodes = self._pack(entries, leaf=True)
+        while len(nodes) > 1:
+            nodes = self._pack(nodes, leaf=False)
+        return nodes[0] if nodes else _Node(True, [])
+
+    def _pack(self, items: list, leaf: bool) -> "list[_Node]":
+        """Agrupa los elementos en nodos ordenándolos por franjas en x y luego en y."""
+        if not items:
+            return []
+        capacity = self.node_capacity
+        box_of = (lambda item: item[0]) if leaf else (lambda item: item.bbox)
+        slices = ceil(sqrt(ceil(len(items) / capacity)))
+        slice_size = slices * capacity
+        items = sorted(items, key=lambda item: box_of(item)[0] + box_of(item)[2])
+        nodes = []
+        for start in range(0, len(items), slice_size):
+            strip = sorted(items[start:start + slice_size],
+                           key=lambda item: box_of(item)[1] + box_of(item)[3])
+            for offset in range(0, len(strip), capacity):
+                nodes.append(_Node(leaf, strip[offset:offset + capacity]))
+        return nodes
+
+    def query(self, min_x: float, min_y: float, max_x: float, max_y: float) -> "list[Shape]":
+        """Devuelve las figuras cuya caja envolvente toca la ventana dada."""
+        window = (min_x, min_y, max_x, max_y)
+        found = []
+        if not self._boxes or not _intersects(self._root.bbox, window):
+            return found
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.leaf:
+                found.extend(shape for box, shape in node.children
+                             if _intersects(box, window))
+            else:
+                stack.extend(child for child in node.children
+                             if _intersects(child.bbox, window))
+        return found
+
+    def query_point(self, x: float, y: float) -> "list[Shape]":
+        """Devuelve las figuras cuya caja envolvente contiene el punto (x, y)."""
+        return self.query(x, y, x, y)
+
+    def insert(self, shape: "Shape"):
+        """Agrega una figura al índice."""
+        if id(shape) in self._boxes:
+            raise ValueError("La figura ya está en el índice.")
+        box = shape.bounding_box
+        self._boxes[id(shape)] = box
+        if not self._root.children:
+            self._root = _Node(True, [(box, shape)])
+            return
+
+        path = [self._root]
+        while not path[-1].leaf:
+            path.append(min(path[-1].children, key=lambda child: (
+                _box_area(_union((child.bbox, box))) - _box_area(child.bbox),
+                _box_area(child.bbox))))
+        path[-1].children.append((box, shape))
+
+        # Se dividen los nodos llenos desde la hoja hacia la raíz
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            node.refresh()
+            if len(node.children) <= self.node_capacity:
+                continue
+            sibling = self._split(node)
+            if depth == 0:
+                self._root = _Node(False, [node, sibling])
+            else:
+                path[depth - 1].children.append(sibling)
+
+    def _split(self, node: "_Node") -> "_Node":
+        """Divide un nodo lleno por la mitad a lo largo de su eje más largo y
+        devuelve el nuevo nodo hermano."""
+        axis = 0 if node.bbox[2] - node.bbox[0] >= node.bbox[3] - node.bbox[1] else 1
+        node.children.sort(key=lambda child: node.box_of(child)[axis] +
+                           node.box_of(child)[axis + 2])
+        half = len(node.children) // 2
+        sibling = _Node(node.leaf, node.children[half:])
+        node.children = node.children[:half]
+        node.refresh()
+        return sibling
+
+    def delete(self, shape: "Shape"):
+        """Elimina una figura del índice."""
+        box = self._boxes.pop(id(shape), None)
+        if box is None:
+            raise KeyError("La figura no está en el índice.")
+        path = self._find_leaf(self._root, box, shape, [])
+        leaf = path[-1]
+        leaf.children = [entry for entry in leaf.children if entry[1] is not shape]
+
+        # Se eliminan los nodos vacíos y se ajustan las cajas hacia la raíz
+        for depth in range(len(path) - 1, 0, -1):
+            node = path[depth]
+            if not node.children:
+                path[depth - 1].children.remove(node)
+            else:
+                node.refresh()
+        self._root.refresh()
+        while not self._root.leaf and len(self._root.children) == 1:
+            self._root = self._root.children[0]
+        if not self._root.children:
+            self._root = _Node(True, [])
+
+    def _find_leaf(self, node: "_Node", box: "tuple", shape: "Shape", path: list):
+        """Busca la hoja que contiene la figura y devuelve el camino desde la raíz."""
+        path.append(node)
+        if node.leaf:
+            if any(entry[1] is shape for entry in node.children):
+                return path
+        else:
+            for child in node.children:
+                if _contains(child.bbox, box):
+                    found = self._find_leaf(child, box, shape, path)
+                    if found:
+                        return found
+        path.pop()
+        return None
+
+    def update(self, shape: "Shape"):
+        """Actualiza la posición de una figura indexada que se movió."""
+        self.delete(shape)
+        self.insert(shape)
+
+    def __len__(self):
+        return len(self._boxes)
+
+    def __contains__(self, shape: "Shape"):
+        return id(shape) in self._boxes
+
+    def __str__(self):
+        """Método que devuelve una representación en cadena del índice."""
+        return f"Índice espacial con {len(self)} figuras."
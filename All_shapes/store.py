@@ -0,0 +1,174 @@
+import mmap
+import struct
+
+import numpy as np
+
+from All_shapes import geometry
+from All_shapes.geometry import Point
+
+# Encabezado: firma, versión, reservado, número de figuras, número de vértices y las
+# posiciones en bytes de los bloques de coordenadas, desplazamientos y etiquetas.
+MAGIC = b"SHPSTORE"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQQQQ")
+ALIGNMENT = 64
+
+# Etiqueta por figura; el bit alto indica si la figura es regular
+TYPE_TAGS = {name: tag for tag, name in enumerate(
+    ("Shape", "Triangle", "Rectangle", "Square", "Equilateral", "Isosceles",
+     "Scalene", "Trirectangle"))}
+TAG_TYPES = {tag: getattr(geometry, name) for name, tag in TYPE_TAGS.items()}
+REGULAR_BIT = 0x80
+
+
+def _aligned(position: int) -> int:
+    return -(-position // ALIGNMENT) * ALIGNMENT
+
+
+def shape_tag(shape: "geometry.Shape") -> int:
+    """Devuelve la etiqueta con la que se guarda la figura."""
+    tag = TYPE_TAGS.get(type(shape).__name__, TYPE_TAGS["Shape"])
+    return tag | REGULAR_BIT if shape.is_regular else tag
+
+
+class StoreWriter:
+    """Clase Escritor de Almacén que guarda figuras en el formato binario.
+
+    Las coordenadas se escriben en el archivo a medida que se agregan figuras; los
+    desplazamientos y las etiquetas se escriben al cerrar, junto con el encabezado.
+
+        - param path: ruta del archivo a crear.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "wb")
+        self._file.write(b"\0" * _aligned(HEADER.size))
+        self._coords_offset = self._file.tell()
+        self._offsets = [0]
+        self._tags = bytearray()
+
+    def add(self, shape: "geometry.Shape"):
+        """Agrega una instancia de Shape o de alguna de sus subclases."""
+        coords = np.array([point.point_getter() for point in shape.vertices],
+                          dtype="<f8")
+        self._write(coords, [len(shape.vertices)], [shape_tag(shape)])
+
+    def add_batch(self, batch, tags=None):
+        """Agrega todos los polígonos de un ShapeBatch.
+
+        - param batch: instancia de ShapeBatch.
+        - param tags: etiquetas por polígono; si es None se guardan como Shape.
+        """
+        if tags is None:
+            tags = np.zeros(len(batch), dtype=np.uint8)
+        self._write(batch.coords.astype("<f8", copy=False), batch.counts, tags)
+
+    def _write(self, coords, counts, tags):
+        self._file.write(np.ascontiguousarray(coords).tobytes())
+        self._offsets.extend((np.cumsum(counts, dtype=np.int64) + self._offsets[-1]).tolist())
+        self._tags.extend(bytes(np.asarray(tags, dtype=np.uint8)))
+
+    def close(self):
+        """Escribe los desplazamientos, las etiquetas y el encabezado, y cierra."""
+        if self._file.closed:
+            return
+        vertex_count = self._offsets[-1]
+        offsets_offset = _aligned(self._file.tell())
+        self._file.write(b"\0" * (offsets_offset - self._file.tell()))
+        self._file.write(np.asarray(self._offsets, dtype="<i8").tobytes())
+        tags_offset = self._file.tell()
+        self._file.write(bytes(self._tags))
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, len(self._tags), vertex_count,
+                                     self._coords_offset, offsets_offset, tags_offset))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_store(path, shapes: "list[geometry.Shape]"):
+    """Guarda una colección de figuras (o un ShapeBatch) en el formato binario."""
+    with StoreWriter(path) as writer:
+        if hasattr(shapes, "offsets"):
+            writer.add_batch(shapes)
+        else:
+            for shape in shapes:
+                writer.add(shape)
+
+
+class ShapeStore:
+    """Clase Almacén de Figuras que abre un archivo binario mediante mmap.
+
+    Abrir el almacén solo lee el encabezado; coords, offsets y tags son arreglos de
+    NumPy que apuntan directamente al archivo mapeado, sin copiar datos. Al indexar
+    el almacén se construye la figura de geometry correspondiente en O(1).
+
+        - param path: ruta del archivo creado con StoreWriter o write_store.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as source:
+            self._mmap = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, _, shape_count, vertex_count, coords_offset, offsets_offset,
+         tags_offset) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError("El archivo no es un almacén de figuras.")
+        if version != VERSION:
+            raise ValueError(f"Versión de almacén no soportada: {version}.")
+        self.coords = np.frombuffer(self._mmap, dtype="<f8", count=2 * vertex_count,
+                                    offset=coords_offset).reshape(-1, 2)
+        self.offsets = np.frombuffer(self._mmap, dtype="<i8", count=shape_count + 1,
+                                     offset=offsets_offset)
+        self.tags = np.frombuffer(self._mmap, dtype=np.uint8, count=shape_count,
+                                  offset=tags_offset)
+
+    def coords_of(self, index: int) -> "np.ndarray":
+        """Devuelve una vista de las coordenadas de la figura indicada."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice fuera del rango del almacén.")
+        return self.coords[self.offsets[index]:self.offsets[index + 1]]
+
+    def batch(self):
+        """Devuelve un ShapeBatch que comparte la memoria del archivo mapeado."""
+        from All_shapes.shape_batch import ShapeBatch
+
+        return ShapeBatch(self.coords, self.offsets)
+
+    def close(self):
+        """Libera los arreglos y cierra el archivo mapeado."""
+        self.coords = self.offsets = self.tags = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Alguna vista sigue en uso; el mapeo se libera cuando esta desaparezca
+            pass
+
+    def __len__(self):
+        return self.tags.shape[0]
+
+    def __getitem__(self, index: int) -> "geometry.Shape":
+        """Construye la figura guardada en la posición indicada."""
+        coords = self.coords_of(index)
+        tag = int(self.tags[index])
+        vertices = [Point(x, y) for x, y in coords.tolist()]
+        return TAG_TYPES[tag & ~REGULAR_BIT](bool(tag & REGULAR_BIT), vertices)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __str__(self):
+        """Método que devuelve una representación en cadena del almacén."""
+        return f"Almacén de {len(self)} figuras con {self.coords.shape[0]} vértices."
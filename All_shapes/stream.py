@@ -0,0 +1,184 @@
+import csv
+import io
+import json
+import os
+import time
+
+from All_shapes import geometry
+from All_shapes.geometry import Point
+
+# Clases que se pueden nombrar en los archivos de entrada
+SHAPE_TYPES = {
+    name: getattr(geometry, name)
+    for name in ("Shape", "Rectangle", "Square", "Triangle", "Equilateral",
+                 "Isosceles", "Scalene", "Trirectangle")
+}
+# Clases que solo se pueden construir como regulares
+REGULAR_TYPES = {"Square", "Equilateral"}
+
+
+def _open(source, fmt: str):
+    """Devuelve el archivo de texto y el formato a partir de una ruta o un flujo."""
+    if isinstance(source, (str, os.PathLike)):
+        if fmt is None:
+            extension = os.path.splitext(str(source))[1].lower()
+            fmt = "csv" if extension == ".csv" else "jsonl"
+        return open(source, newline=""), fmt, True
+    if isinstance(source, io.BufferedIOBase) or hasattr(source, "readinto"):
+        source = io.TextIOWrapper(source, newline="")
+    return source, fmt or "jsonl", False
+
+
+def _parse_csv(stream):
+    """Genera (tipo, es_regular, vértices) por cada fila CSV.
+
+    Cada fila es un polígono: un nombre de clase opcional seguido de las coordenadas
+    x1, y1, x2, y2, ...
+    """
+    for row in csv.reader(stream):
+        if not row:
+            continue
+        name = "Shape"
+        if row[0] in SHAPE_TYPES:
+            name = row.pop(0)
+        values = [float(value) for value in row]
+        yield name, name in REGULAR_TYPES, list(zip(values[0::2], values[1::2]))
+
+
+def _parse_jsonl(stream):
+    """Genera (tipo, es_regular, vértices) por cada línea JSON.
+
+    Cada línea es una lista de pares [x, y] o un objeto con las llaves "vertices" y,
+    opcionalmente, "type" e "is_regular".
+    """
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        if isinstance(record, list):
+            record = {"vertices": record}
+        name = record.get("type", "Shape")
+        if name not in SHAPE_TYPES:
+            raise ValueError(f"Tipo de figura desconocido: {name}.")
+        yield (name, record.get("is_regular", name in REGULAR_TYPES),
+               [tuple(vertex) for vertex in record["vertices"]])
+
+
+def read_records(source, fmt: str = None):
+    """Lee un archivo o flujo y genera (tipo, es_regular, vértices) por figura, sin
+    cargar el archivo completo en memoria.
+
+    - param source: ruta de un archivo .csv o .jsonl, o un flujo ya abierto.
+    - param fmt: "csv" o "jsonl"; si es None se deduce de la extensión.
+    """
+    stream, fmt, owned = _open(source, fmt)
+    if fmt not in ("csv", "jsonl"):
+        raise ValueError("El formato debe ser 'csv' o 'jsonl'.")
+    try:
+        yield from (_parse_csv if fmt == "csv" else _parse_jsonl)(stream)
+    finally:
+        if owned:
+            stream.close()
+
+
+def read_shapes(source, fmt: str = None, skip_invalid: bool = False):
+    """Genera instancias de Shape, Triangle, Rectangle, etc. a partir de un archivo o
+    flujo, una figura a la vez.
+
+    - param source: ruta de un archivo .csv o .jsonl, o un flujo ya abierto.
+    - param fmt: "csv" o "jsonl"; si es None se deduce de la extensión.
+    - param skip_invalid: si es True se descartan las figuras cuyo constructor lanza
+    ValueError en lugar de propagar el error.
+    """
+    for name, is_regular, vertices in read_records(source, fmt):
+        try:
+            yield SHAPE_TYPES[name](is_regular, [Point(x, y) for x, y in vertices])
+        except ValueError:
+            if not skip_invalid:
+                raise
+
+
+def read_batches(source, fmt: str = None, chunk_size: int = 10_000):
+    """Genera instancias de ShapeBatch con hasta chunk_size polígonos cada una.
+
+    - param source: ruta de un archivo .csv o .jsonl, o un flujo ya abierto.
+    - param fmt: "csv" o "jsonl"; si es None se deduce de la extensión.
+    - param chunk_size: número máximo de polígonos por lote.
+    """
+    from All_shapes.shape_batch import ShapeBatch
+
+    chunk = []
+    for _, _, vertices in read_records(source, fmt):
+        chunk.append(vertices)
+        if len(chunk) == chunk_size:
+            yield ShapeBatch.from_polygons(chunk)
+            chunk = []
+    if chunk:
+        yield ShapeBatch.from_polygons(chunk)
+
+
+class Pipeline:
+    """Clase Tubería que encadena etapas perezosas sobre un flujo de figuras.
+
+    Inicializa la tubería con un iterable de figuras o lotes (por ejemplo el que
+    devuelve read_shapes o read_batches). Las etapas map y filter se aplican a medida
+    que se consumen los elementos, de modo que la memoria no depende del tamaño de la
+    entrada.
+
+        - param source: iterable de figuras o de lotes de figuras.
+
+        Tiene los atributos adicionales:
+        - count: número de figuras que salieron de la fuente hasta el momento.
+        - elapsed: segundos dedicados a leer y procesar los elementos.
+    """
+
+    def __init__(self, source):
+        self._source = source
+        self._stages = []
+        self.count = 0
+        self.elapsed = 0.0
+
+    def map(self, function) -> "Pipeline":
+        """Agrega una etapa que transforma cada elemento con function."""
+        self._stages.append(lambda items: map(function, items))
+        return self
+
+    def filter(self, predicate) -> "Pipeline":
+        """Agrega una etapa que deja pasar solo los elementos que cumplen predicate."""
+        self._stages.append(lambda items: filter(predicate, items))
+        return self
+
+    def _counted(self):
+        for item in self._source:
+            # Los lotes cuentan por el número de figuras que contienen
+            self.count += len(item) if hasattr(item, "offsets") else 1
+            yield item
+
+    def __iter__(self):
+        items = self._counted()
+        for stage in self._stages:
+            items = stage(items)
+        start = time.perf_counter()
+        try:
+            for item in items:
+                self.elapsed += time.perf_counter() - start
+                yield item
+                start = time.perf_counter()
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+    def run(self) -> int:
+        """Consume la tubería completa descartando los resultados y devuelve el número
+        de elementos que llegaron al final."""
+        return sum(1 for _ in self)
+
+    @property
+    def throughput(self) -> float:
+        """Figuras procesadas por segundo."""
+        return self.count / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        """Método que devuelve el reporte de rendimiento de la tubería."""
+        return (f"{self.count} figuras en {self.elapsed:.2f} s "
+                f"({self.throughput:,.0f} figuras/s).")
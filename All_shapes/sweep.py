@@ -0,0 +1,252 @@
+from bisect import bisect_left, bisect_right
+from heapq import heappush, heappop
+from math import inf
+
+from All_shapes.geometry import Point, Line, Shape
+from All_shapes.predicates import intersection_parameter, orient2d
+
+# Ancho relativo de la ventana en la que se buscan, dentro del estado, los segmentos
+# cercanos a un evento; si se tocan se decide de forma exacta
+REL_TOL = 1e-09
+
+
+class _Segment:
+    """Segmento normalizado para el barrido: (x1, y1) es el extremo de la izquierda
+    (o el de abajo si el segmento es vertical)."""
+
+    __slots__ = ("index", "x1", "y1", "x2", "y2", "slope")
+
+    def __init__(self, index: int, line: "Line"):
+        start, end = line.start.point_getter(), line.end.point_getter()
+        if end < start:
+            start, end = end, start
+        self.index = index
+        self.x1, self.y1 = start
+        self.x2, self.y2 = end
+        self.slope = inf if self.x1 == self.x2 else (self.y2 - self.y1) / (self.x2 - self.x1)
+
+    def y_at(self, x: float, y: float) -> float:
+        """Altura del segmento en la vertical x; en segmentos verticales se devuelve
+        y limitado a su extensión."""
+        if self.slope == inf:
+            return min(max(y, self.y1), self.y2)
+        if x <= self.x1:
+            return self.y1
+        if x >= self.x2:
+            return self.y2
+        return self.y1 + (x - self.x1) * self.slope
+
+
+def _crosses_exactly(first: "_Segment", second: "_Segment") -> bool:
+    """Indica con predicados exactos si dos segmentos no colineales se tocan."""
+    return (orient2d(first.x1, first.y1, first.x2, first.y2, second.x1, second.y1) !=
+            orient2d(first.x1, first.y1, first.x2, first.y2, second.x2, second.y2) and
+            orient2d(second.x1, second.y1, second.x2, second.y2, first.x1, first.y1) !=
+            orient2d(second.x1, second.y1, second.x2, second.y2, first.x2, first.y2))
+
+
+def _touches(first: "_Segment", second: "_Segment") -> bool:
+    """Indica de forma exacta si dos segmentos comparten algún punto: si se cruzan o
+    se tocan, o si son colineales y se solapan (un extremo de uno está sobre el
+    otro)."""
+    if _crosses_exactly(first, second):
+        return True
+    # Colineales (se prueba en ambos sentidos por si uno de ellos es un punto): los
+    # extremos están ordenados, así que basta comparar los rangos
+    if (orient2d(first.x1, first.y1, first.x2, first.y2, second.x1, second.y1) != 0 or
+            orient2d(first.x1, first.y1, first.x2, first.y2, second.x2, second.y2) != 0 or
+            orient2d(second.x1, second.y1, second.x2, second.y2, first.x1, first.y1) != 0 or
+            orient2d(second.x1, second.y1, second.x2, second.y2, first.x2, first.y2) != 0):
+        return False
+    return (max((first.x1, first.y1), (second.x1, second.y1)) <=
+            min((first.x2, first.y2), (second.x2, second.y2)))
+
+
+def _contains(segment: "_Segment", x: float, y: float) -> bool:
+    """Indica de forma exacta si el punto (x, y) está sobre el segmento."""
+    return ((segment.x1, segment.y1) <= (x, y) <= (segment.x2, segment.y2) and
+            orient2d(segment.x1, segment.y1, segment.x2, segment.y2, x, y) == 0)
+
+
+def _cross(first: "_Segment", second: "_Segment"):
+    """Devuelve el punto (x, y) donde se cruzan dos segmentos, o None si no se
+    tocan.
+
+    Si se tocan se decide con predicates.orient2d; solo el punto de cruce se calcula
+    en punto flotante (con intersection_parameter si las rectas son casi paralelas y
+    el denominador se redondea a cero) y se limita al segmento.
+    """
+    if not _crosses_exactly(first, second):
+        return None
+    r_x, r_y = first.x2 - first.x1, first.y2 - first.y1
+    s_x, s_y = second.x2 - second.x1, second.y2 - second.y1
+    denominator = r_x * s_y - r_y * s_x
+    q_x, q_y = second.x1 - first.x1, second.y1 - first.y1
+    if denominator != 0:
+        t = (q_x * s_y - q_y * s_x) / denominator
+    else:
+        t = intersection_parameter(first.x1, first.y1, first.x2, first.y2,
+                                   second.x1, second.y1, second.x2, second.y2)
+    t = min(max(t, 0.0), 1.0)
+    return first.x1 + t * r_x, first.y1 + t * r_y
+
+
+def _sweep(lines: "list[Line]"):
+    """Barrido de Bentley-Ottmann; genera (i, j, x, y) por cada pareja de segmentos
+    que se tocan, con i < j, en orden de x creciente.
+
+    Qué parejas se tocan se decide con predicados exactos (_touches); la ventana de
+    REL_TOL alrededor de la altura del evento solo sirve para ubicar en el estado los
+    segmentos cercanos y reordenarlos. Los puntos de cruce calculados se redondean,
+    así que cada evento de cruce recuerda además los segmentos que lo generaron.
+    Solo se pueden perder cruces entre detalles más finos que REL_TOL por la escala
+    de las coordenadas; nunca se reportan segmentos que no se tocan.
+    """
+    segments = [_Segment(index, line) for index, line in enumerate(lines)]
+    if not segments:
+        return
+    scale = max(max(abs(s.x1), abs(s.y1), abs(s.x2), abs(s.y2)) for s in segments)
+    eps = REL_TOL * max(scale, 1.0)
+
+    queue = []
+    starts = {}
+    ends = {}
+    for segment in segments:
+        for point in ((segment.x1, segment.y1), (segment.x2, segment.y2)):
+            if point not in starts:
+                starts[point] = []
+                heappush(queue, point)
+        starts[(segment.x1, segment.y1)].append(segment)
+        if segment.x1 != segment.x2 or segment.y1 != segment.y2:
+            ends.setdefault((segment.x2, segment.y2), []).append(segment)
+
+    status = []
+    reported = set()
+    # Evento de cruce -> segmentos que se cruzan en él
+    crossings = {}
+
+    def report(first, second, x, y):
+        """Devuelve el cruce de dos segmentos si se tocan y no se había reportado;
+        si el evento no está sobre ambos se reporta el punto de cruce calculado."""
+        pair = (first.index, second.index) if first.index < second.index else \
+            (second.index, first.index)
+        if pair in reported or not _touches(first, second):
+            return None
+        reported.add(pair)
+        if not (_contains(first, x, y) and _contains(second, x, y)):
+            x, y = _cross(first, second) or (x, y)
+        return pair[0], pair[1], x, y
+
+    def schedule(below, above, x, y):
+        """Programa el cruce de dos vecinos como evento, o lo devuelve para
+        reportarlo de inmediato."""
+        if below is None or above is None:
+            return None
+        point = _cross(below, above)
+        if point is None:
+            return None
+        # Si el redondeo lo deja antes del evento actual o más allá del final de un
+        # segmento, el cruce ya no puede procesarse como evento
+        if (point <= (x, y) or point > (below.x2, below.y2) or
+                point > (above.x2, above.y2)):
+            return report(below, above, *point)
+        if point not in starts:
+            starts[point] = []
+            heappush(queue, point)
+        crossings.setdefault(point, set()).update((below, above))
+        return None
+
+    while queue:
+        x, y = heappop(queue)
+        upper = starts.pop((x, y))
+        anchored = [*crossings.pop((x, y), ()), *ends.pop((x, y), ())]
+        key = lambda segment: segment.y_at(x, y)
+        low = bisect_left(status, y - eps, key=key)
+        high = bisect_right(status, y + eps, key=key)
+        for segment in anchored:
+            # Un segmento que termina o se cruza en el punto pero quedó fuera de la
+            # ventana (por el redondeo de las alturas) amplía el bloque a reordenar
+            if segment not in status[low:high]:
+                position = status.index(segment)
+                low, high = min(low, position), max(high, position + 1)
+
+        # Los segmentos del bloque pasan por el punto o muy cerca de él: a la derecha
+        # quedan ordenados por pendiente. Cuáles se tocan se decide de forma exacta.
+        nearby = status[low:high]
+        continuing = [segment for segment in nearby
+                      if segment.x2 != x or segment.y2 != y]
+        inserted = [segment for segment in upper
+                    if segment.x1 != segment.x2 or segment.y1 != segment.y2]
+        involved = nearby + upper
+        for first in range(len(involved)):
+            for second in range(first + 1, len(involved)):
+                found = report(involved[first], involved[second], x, y)
+                if found is not None:
+                    yield found
+
+        # Justo a la derecha del punto los segmentos que pasan por él quedan
+        # ordenados por pendiente
+        block = sorted(continuing + inserted, key=lambda segment: segment.slope)
+        status[low:high] = block
+        start = low
+        previous = status[start - 1] if start > 0 else None
+        after = start + len(block)
+        following = status[after] if after < len(status) else None
+        if block:
+            found = [schedule(previous, block[0], x, y),
+                     schedule(block[-1], following, x, y)]
+        else:
+            found = [schedule(previous, following, x, y)]
+        for item in found:
+            if item is not None:
+                yield item
+
+
+def intersections(lines: "list[Line]") -> "list[tuple]":
+    """Encuentra todos los cruces entre las líneas dadas con un barrido de
+    Bentley-Ottmann.
+
+    Hace O((N + K) log N) comparaciones, pero el estado del barrido es una lista y
+    cada evento la modifica con una asignación de rebanada, que mueve en memoria
+    hasta N referencias: en el peor caso el costo es O((N + K) N), aunque con una
+    constante muy pequeña. Con decenas de miles de segmentos activos a la vez domina
+    ese movimiento.
+
+    - param lines: lista de instancias de Line.
+
+    Devuelve una lista de tuplas (línea, otra línea, punto de cruce). Los segmentos
+    colineales que se solapan se reportan una vez, en el primer punto compartido.
+    """
+    return [(lines[i], lines[j], Point(x, y)) for i, j, x, y in _sweep(lines)]
+
+
+def any_intersection(lines: "list[Line]", ignore=None):
+    """Devuelve el primer cruce encontrado como (i, j, Point) o None si no hay
+    ninguno; el barrido se detiene en cuanto encuentra uno.
+
+    - param lines: lista de instancias de Line.
+    - param ignore: función opcional ignore(i, j, x, y) que indica si un cruce entre
+    las líneas i y j en (x, y) debe pasarse por alto.
+    """
+    for i, j, x, y in _sweep(lines):
+        if ignore is None or not ignore(i, j, x, y):
+            return i, j, Point(x, y)
+    return None
+
+
+def is_self_intersecting(shape: "Shape") -> bool:
+    """Determina si las aristas de la figura se cruzan entre sí, sin contar el
+    vértice que comparten dos aristas consecutivas."""
+    vertices = shape.vertices
+    count = len(vertices)
+
+    def shared_vertex(i, j, x, y):
+        if (j - i) % count == 1:
+            shared = vertices[j]
+        elif (i - j) % count == 1:
+            shared = vertices[i]
+        else:
+            return False
+        return shared.point_getter() == (x, y)
+
+    return any_intersection(shape.edges, ignore=shared_vertex) is not None
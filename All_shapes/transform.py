@@ -0,0 +1,156 @@
+from math import cos, radians, sin, sqrt
+
+
+class Affine:
+    """Clase Transformación Afín que representa la matriz de 3x3
+
+        | a  b  c |
+        | d  e  f |
+        | 0  0  1 |
+
+    que lleva el punto (x, y) a (a*x + b*y + c, d*x + e*y + f).
+
+    Las transformaciones se componen en una sola matriz con then (o con el operador
+    @, donde t2 @ t1 aplica primero t1), por lo que una cadena de traslaciones,
+    rotaciones y escalas se aplica a los vértices en una sola pasada.
+    """
+
+    __slots__ = ("a", "b", "c", "d", "e", "f")
+
+    def __init__(self, a: float = 1.0, b: float = 0.0, c: float = 0.0,
+                 d: float = 0.0, e: float = 1.0, f: float = 0.0):
+        self.a, self.b, self.c = a, b, c
+        self.d, self.e, self.f = d, e, f
+
+    @classmethod
+    def identity(cls) -> "Affine":
+        return cls()
+
+    @classmethod
+    def translation(cls, dx: float, dy: float) -> "Affine":
+        """Traslación por (dx, dy)."""
+        return cls(1.0, 0.0, dx, 0.0, 1.0, dy)
+
+    @classmethod
+    def rotation(cls, angle: float, origin: "tuple" = (0.0, 0.0)) -> "Affine":
+        """Rotación en sentido antihorario de angle grados alrededor de origin."""
+        cosine, sine = cos(radians(angle)), sin(radians(angle))
+        x, y = origin
+        return cls(cosine, -sine, x - cosine * x + sine * y,
+                   sine, cosine, y - sine * x - cosine * y)
+
+    @classmethod
+    def scaling(cls, sx: float, sy: float = None, origin: "tuple" = (0.0, 0.0)) -> "Affine":
+        """Escala por sx en x y por sy en y (sy = sx si no se indica) desde origin."""
+        sy = sx if sy is None else sy
+        x, y = origin
+        return cls(sx, 0.0, x - sx * x, 0.0, sy, y - sy * y)
+
+    @classmethod
+    def shear(cls, kx: float, ky: float = 0.0) -> "Affine":
+        """Cizallamiento: x += kx*y, y += ky*x."""
+        return cls(1.0, kx, 0.0, ky, 1.0, 0.0)
+
+    @classmethod
+    def from_matrix(cls, matrix) -> "Affine":
+        """Crea la transformación a partir de una matriz de 3x3 (o de 2x3)."""
+        (a, b, c), (d, e, f) = matrix[0][:3], matrix[1][:3]
+        return cls(float(a), float(b), float(c), float(d), float(e), float(f))
+
+    def then(self, other: "Affine") -> "Affine":
+        """Devuelve la transformación que aplica primero self y luego other."""
+        return Affine(other.a * self.a + other.b * self.d,
+                      other.a * self.b + other.b * self.e,
+                      other.a * self.c + other.b * self.f + other.c,
+                      other.d * self.a + other.e * self.d,
+                      other.d * self.b + other.e * self.e,
+                      other.d * self.c + other.e * self.f + other.f)
+
+    def __matmul__(self, other: "Affine") -> "Affine":
+        return other.then(self)
+
+    def inverse(self) -> "Affine":
+        determinant = self.determinant
+        if determinant == 0:
+            raise ValueError("La transformación no es invertible.")
+        a, b, d, e = (self.e / determinant, -self.b / determinant,
+                      -self.d / determinant, self.a / determinant)
+        return Affine(a, b, -a * self.c - b * self.f, d, e, -d * self.c - e * self.f)
+
+    @property
+    def matrix(self) -> "list[list[float]]":
+        """Matriz de 3x3 como listas anidadas."""
+        return [[self.a, self.b, self.c], [self.d, self.e, self.f], [0.0, 0.0, 1.0]]
+
+    @property
+    def determinant(self) -> float:
+        """Factor por el que se multiplica el área con signo."""
+        return self.a * self.e - self.b * self.d
+
+    @property
+    def scale_factor(self) -> "float":
+        """Factor por el que se multiplican las longitudes si la transformación es de
+        semejanza (rotación, reflexión, traslación y escala uniforme); None si no lo
+        es, porque entonces las longitudes cambian de forma distinta en cada
+        dirección."""
+        # La parte lineal es de semejanza si sus columnas son ortogonales y de igual
+        # longitud
+        first = self.a * self.a + self.d * self.d
+        second = self.b * self.b + self.e * self.e
+        dot = self.a * self.b + self.d * self.e
+        tolerance = 1e-12 * max(first, second)
+        if abs(first - second) > tolerance or abs(dot) > tolerance:
+            return None
+        return sqrt(first)
+
+    @property
+    def is_similarity(self) -> bool:
+        return self.scale_factor is not None
+
+    @property
+    def is_rigid(self) -> bool:
+        """Indica si conserva longitudes (rotación, reflexión y traslación)."""
+        scale = self.scale_factor
+        return scale is not None and abs(scale - 1) <= 1e-12
+
+    @property
+    def is_axis_aligned(self) -> bool:
+        """Indica si lleva rectángulos alineados con los ejes en rectángulos alineados
+        con los ejes (solo escala y traslación)."""
+        return self.b == 0 and self.d == 0
+
+    def apply(self, x: float, y: float) -> "tuple":
+        """Transforma un punto y devuelve sus nuevas coordenadas."""
+        return self.a * x + self.b * y + self.c, self.d * x + self.e * y + self.f
+
+    def apply_lists(self, xs: "list[float]", ys: "list[float]") -> "tuple":
+        """Transforma listas de coordenadas y devuelve dos listas nuevas."""
+        a, b, c, d, e, f = self.a, self.b, self.c, self.d, self.e, self.f
+        return ([a * x + b * y + c for x, y in zip(xs, ys)],
+                [d * x + e * y + f for x, y in zip(xs, ys)])
+
+    def apply_arrays(self, xs, ys) -> "tuple":
+        """Transforma arreglos de NumPy de coordenadas de forma vectorizada."""
+        return (self.a * xs + self.b * ys + self.c,
+                self.d * xs + self.e * ys + self.f)
+
+    def apply_coords(self, coords):
+        """Transforma un arreglo de forma (N, 2) y devuelve uno nuevo."""
+        import numpy as np
+
+        linear = np.array([[self.a, self.d], [self.b, self.e]])
+        return coords @ linear + np.array([self.c, self.f])
+
+    def __eq__(self, other):
+        if not isinstance(other, Affine):
+            return NotImplemented
+        return (self.a, self.b, self.c, self.d, self.e, self.f) == \
+            (other.a, other.b, other.c, other.d, other.e, other.f)
+
+    def __hash__(self):
+        return hash((self.a, self.b, self.c, self.d, self.e, self.f))
+
+    def __str__(self):
+        """Método que devuelve una representación en cadena de la transformación."""
+        return (f"Transformación afín [[{self.a}, {self.b}, {self.c}], "
+                f"[{self.d}, {self.e}, {self.f}], [0, 0, 1]]")
@@ -0,0 +1,358 @@
+"""Triangulación de polígonos simples (recorte de orejas) y de nubes de puntos
+(Delaunay con Bowyer-Watson).
+
+Los resultados son arreglos de enteros de forma (N, 3) con los índices de los vértices
+de cada triángulo, en sentido antihorario. Las pruebas de orientación y de
+circunferencia usan los predicados exactos de All_shapes.predicates.
+"""
+from math import sqrt
+
+import numpy as np
+
+from All_shapes.geometry import Point, Shape, Triangle
+from All_shapes.point_array import PointArray
+from All_shapes.predicates import incircle, orient2d
+
+METHODS = ("naive", "grid")
+# A partir de este número de vértices el método "auto" usa la rejilla
+GRID_MIN_VERTICES = 64
+
+
+def _as_coords(points) -> "tuple":
+    """Devuelve (listas x e y, lista de Point o None) a partir de un Shape, un
+    PointArray, una lista de Point o un arreglo (N, 2)."""
+    if isinstance(points, Shape):
+        points = points.vertices
+    if isinstance(points, PointArray):
+        return points.x.tolist(), points.y.tolist(), list(points)
+    if not isinstance(points, np.ndarray):
+        points = list(points)
+        if points and isinstance(points[0], Point):
+            return ([point._x for point in points], [point._y for point in points],
+                    points)
+    coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    return coords[:, 0].tolist(), coords[:, 1].tolist(), None
+
+
+def _empty() -> "np.ndarray":
+    return np.empty((0, 3), dtype=np.int64)
+
+
+class _ReflexGrid:
+    """Rejilla uniforme con los vértices reflejos de un anillo.
+
+    Un triángulo solo se compara con los vértices de las celdas que toca su caja
+    envolvente. Los vértices que dejan de ser reflejos se descartan al consultar.
+    """
+
+    __slots__ = ("min_x", "min_y", "inverse_x", "inverse_y", "size", "cells")
+
+    def __init__(self, xs: "list", ys: "list", reflex: "list[int]"):
+        self.min_x, self.min_y = min(xs), min(ys)
+        self.size = max(1, int(sqrt(len(reflex))))
+        width, height = max(xs) - self.min_x, max(ys) - self.min_y
+        self.inverse_x = self.size / width if width > 0 else 0.0
+        self.inverse_y = self.size / height if height > 0 else 0.0
+        self.cells = {}
+        for index in reflex:
+            key = (self._column(xs[index]), self._row(ys[index]))
+            self.cells.setdefault(key, []).append(index)
+
+    def _column(self, x: float) -> int:
+        return min(int((x - self.min_x) * self.inverse_x), self.size - 1)
+
+    def _row(self, y: float) -> int:
+        return min(int((y - self.min_y) * self.inverse_y), self.size - 1)
+
+    def query(self, min_x: float, min_y: float, max_x: float, max_y: float):
+        cells = self.cells
+        for column in range(self._column(min_x), self._column(max_x) + 1):
+            for row in range(self._row(min_y), self._row(max_y) + 1):
+                yield from cells.get((column, row), ())
+
+
+def _ear_clip(xs: "list", ys: "list", method: str) -> "list[tuple]":
+    """Recorta orejas de un anillo en sentido antihorario y devuelve las ternas de
+    índices.
+
+    Solo un vértice reflejo puede estar dentro de una oreja, así que solo se prueban
+    esos: todos con "naive" (O(n·r)) o los de las celdas vecinas con "grid", que en
+    polígonos sin grandes concentraciones de vértices reflejos es casi lineal. Tras
+    recortar una oreja se salta al vértice siguiente a su vecino, lo que evita
+    abanicos de triángulos muy delgados.
+    """
+    size = len(xs)
+    previous = [index - 1 for index in range(size)]
+    previous[0] = size - 1
+    following = [index + 1 for index in range(size)]
+    following[-1] = 0
+    reflex = [orient2d(xs[previous[index]], ys[previous[index]], xs[index], ys[index],
+                       xs[following[index]], ys[following[index]]) <= 0
+              for index in range(size)]
+    reflex_vertices = [index for index in range(size) if reflex[index]]
+    grid = _ReflexGrid(xs, ys, reflex_vertices) if method == "grid" else None
+
+    def is_ear(index: int, strict: bool) -> bool:
+        p, n = previous[index], following[index]
+        ax, ay, bx, by, cx, cy = xs[p], ys[p], xs[index], ys[index], xs[n], ys[n]
+        turn = orient2d(ax, ay, bx, by, cx, cy)
+        if turn < 0 or (strict and turn == 0):
+            return False
+        min_x, min_y = min(ax, bx, cx), min(ay, by, cy)
+        max_x, max_y = max(ax, bx, cx), max(ay, by, cy)
+        if grid is None:
+            candidates = reflex_vertices
+        else:
+            candidates = grid.query(min_x, min_y, max_x, max_y)
+        for other in candidates:
+            x, y = xs[other], ys[other]
+            if (x < min_x or x > max_x or y < min_y or y > max_y or not reflex[other]
+                    or other == p or other == index or other == n):
+                continue
+            # Un vértice repetido en una esquina de la oreja no la bloquea si no es
+            # estricta
+            if not strict and ((x == ax and y == ay) or (x == cx and y == cy)):
+                continue
+            if (orient2d(ax, ay, bx, by, x, y) >= 0 and orient2d(bx, by, cx, cy, x, y) >= 0
+                    and orient2d(cx, cy, ax, ay, x, y) >= 0):
+                return False
+        return True
+
+    triangles = []
+    remaining = size
+    ear = stop = 0
+    # Primero solo orejas estrictamente convexas, luego también vértices colineales
+    # o repetidos y, si el anillo no es simple, cualquier vértice
+    strict, forced = True, False
+    while remaining > 3:
+        if forced or is_ear(ear, strict):
+            p, n = previous[ear], following[ear]
+            triangles.append((p, ear, n))
+            following[p], previous[n] = n, p
+            reflex[ear] = False
+            remaining -= 1
+            for neighbour in (p, n):
+                if reflex[neighbour]:
+                    reflex[neighbour] = orient2d(
+                        xs[previous[neighbour]], ys[previous[neighbour]],
+                        xs[neighbour], ys[neighbour],
+                        xs[following[neighbour]], ys[following[neighbour]]) <= 0
+            ear = stop = following[n]
+            strict, forced = True, False
+            continue
+        ear = following[ear]
+        if ear == stop:
+            if strict:
+                strict = False
+            else:
+                forced = True
+    triangles.append((previous[ear], ear, following[ear]))
+    return triangles
+
+
+def triangulate(shape, method: str = "auto", as_shapes: bool = False):
+    """Triangula un polígono simple recortando orejas.
+
+    - param shape: Shape (o una subclase), PointArray, lista de Point o arreglo (N, 2)
+    con los vértices del polígono en cualquier sentido.
+    - param method: "naive" prueba cada oreja contra todos los vértices reflejos;
+    "grid" los guarda en una rejilla uniforme y es casi lineal en polígonos grandes;
+    "auto" usa "grid" a partir de GRID_MIN_VERTICES vértices.
+    - param as_shapes: si es True devuelve una lista de instancias de Triangle que
+    usan los mismos Point que la figura (si se dieron Point).
+
+    Devuelve un arreglo de enteros (n - 2, 3) con los índices de los vértices de cada
+    triángulo en sentido antihorario. Si el polígono no es simple el resultado sigue
+    teniendo n - 2 triángulos, pero pueden solaparse.
+    """
+    xs, ys, points = _as_coords(shape)
+    size = len(xs)
+    if method == "auto":
+        method = "grid" if size >= GRID_MIN_VERTICES else "naive"
+    if method not in METHODS:
+        raise ValueError(f"Método de triangulación desconocido, use uno de {METHODS}.")
+    if size < 3:
+        raise ValueError("El polígono debe tener al menos 3 vértices.")
+    signed_area = sum(x0 * y1 - x1 * y0 for x0, y0, x1, y1
+                      in zip(xs, ys, xs[1:] + xs[:1], ys[1:] + ys[:1]))
+    if signed_area < 0:
+        triangles = np.array(_ear_clip(xs[::-1], ys[::-1], method), dtype=np.int64)
+        triangles = size - 1 - triangles
+    else:
+        triangles = np.array(_ear_clip(xs, ys, method), dtype=np.int64)
+    if as_shapes:
+        return to_triangles(points if points is not None else np.column_stack((xs, ys)),
+                            triangles)
+    return triangles
+
+
+def _insertion_order(xs: "list", ys: "list") -> "list[int]":
+    """Ordena los puntos en franjas verticales recorridas en zigzag, para que cada
+    punto se inserte cerca del anterior y la búsqueda del triángulo que lo contiene
+    sea corta."""
+    x, y = np.asarray(xs), np.asarray(ys)
+    strips = max(1, int(sqrt(x.shape[0] / 4)))
+    width = x.max() - x.min()
+    strip = np.zeros(x.shape[0], dtype=np.int64) if width == 0 else \
+        np.minimum(((x - x.min()) / width * strips).astype(np.int64), strips - 1)
+    return np.lexsort((np.where(strip % 2, -y, y), strip)).tolist()
+
+
+def delaunay(points) -> "np.ndarray":
+    """Calcula la triangulación de Delaunay de una nube de puntos con el algoritmo de
+    Bowyer-Watson.
+
+    - param points: lista de Point, PointArray o arreglo (N, 2).
+
+    Devuelve un arreglo de enteros (M, 3) con los índices de los puntos de cada
+    triángulo en sentido antihorario. Los puntos repetidos se usan una sola vez; si
+    todos son colineales (o hay menos de tres) el arreglo está vacío.
+
+    En lugar de un triángulo envolvente artificial, cada arista de la envolvente
+    convexa tiene un triángulo fantasma con un vértice en el infinito (índice -1),
+    cuyo círculo es el semiplano exterior. Así el resultado no depende del tamaño de
+    un triángulo auxiliar y todas las pruebas son exactas.
+    """
+    xs, ys, _ = _as_coords(points)
+    if len(xs) < 3:
+        return _empty()
+    order = _insertion_order(xs, ys)
+
+    # Triángulo inicial: los dos primeros puntos distintos y el primero no colineal
+    first = order[0]
+    second = next((index for index in order
+                   if (xs[index], ys[index]) != (xs[first], ys[first])), None)
+    if second is None:
+        return _empty()
+    third = next((index for index in order
+                  if orient2d(xs[first], ys[first], xs[second], ys[second],
+                              xs[index], ys[index]) != 0), None)
+    if third is None:
+        return _empty()
+    if orient2d(xs[first], ys[first], xs[second], ys[second], xs[third], ys[third]) < 0:
+        second, third = third, second
+
+    # vertices[t] son los vértices de t; neighbours[t][i] es el triángulo al otro lado
+    # de la arista opuesta a vertices[t][i]
+    vertices = [[first, second, third], [second, first, -1], [third, second, -1],
+                [first, third, -1]]
+    neighbours = [[2, 3, 1], [3, 2, 0], [1, 3, 0], [2, 1, 0]]
+    alive = [True, True, True, True]
+
+    def conflicts(triangle: int, x: float, y: float) -> bool:
+        triangle_vertices = vertices[triangle]
+        if -1 in triangle_vertices:
+            # Arista finita del fantasma, con el exterior a su izquierda
+            position = triangle_vertices.index(-1)
+            u = triangle_vertices[(position + 1) % 3]
+            v = triangle_vertices[(position + 2) % 3]
+            side = orient2d(xs[u], ys[u], xs[v], ys[v], x, y)
+            if side != 0:
+                return side > 0
+            # Sobre la recta solo cuenta si está estrictamente dentro del segmento
+            return (min(xs[u], xs[v]) <= x <= max(xs[u], xs[v]) and
+                    min(ys[u], ys[v]) <= y <= max(ys[u], ys[v]) and
+                    (x, y) != (xs[u], ys[u]) and (x, y) != (xs[v], ys[v]))
+        a, b, c = triangle_vertices
+        return incircle(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c], x, y) > 0
+
+    def locate(start: int, x: float, y: float) -> int:
+        """Camina desde start hacia el punto; devuelve el triángulo real que lo
+        contiene o el primer fantasma cuyo semiplano lo contiene."""
+        triangle = start
+        if -1 in vertices[triangle]:
+            triangle = neighbours[triangle][vertices[triangle].index(-1)]
+        while True:
+            triangle_vertices = vertices[triangle]
+            if -1 in triangle_vertices:
+                return triangle
+            for i in range(3):
+                u, v = triangle_vertices[(i + 1) % 3], triangle_vertices[(i + 2) % 3]
+                if orient2d(xs[u], ys[u], xs[v], ys[v], x, y) < 0:
+                    triangle = neighbours[triangle][i]
+                    break
+            else:
+                return triangle
+
+    used = {first, second, third}
+    last = 0
+    for point in order:
+        if point in used:
+            continue
+        x, y = xs[point], ys[point]
+        # El triángulo donde termina la caminata siempre está en conflicto con el
+        # punto, salvo si el punto repite uno de sus vértices
+        start = locate(last, x, y)
+        if any(vertex != -1 and xs[vertex] == x and ys[vertex] == y
+               for vertex in vertices[start]):
+            continue
+
+        # Cavidad: triángulos cuyo círculo contiene al punto, conectados con start
+        cavity, stack = {start}, [start]
+        boundary = []
+        while stack:
+            triangle = stack.pop()
+            for i, neighbour in enumerate(neighbours[triangle]):
+                if neighbour in cavity:
+                    continue
+                if conflicts(neighbour, x, y):
+                    cavity.add(neighbour)
+                    stack.append(neighbour)
+                else:
+                    boundary.append((triangle, i, neighbour))
+
+        # Cada arista del borde forma un triángulo nuevo con el punto
+        by_first, by_second = {}, {}
+        created = []
+        for triangle, i, outside in boundary:
+            triangle_vertices = vertices[triangle]
+            u, v = triangle_vertices[(i + 1) % 3], triangle_vertices[(i + 2) % 3]
+            new = len(vertices)
+            vertices.append([u, v, point])
+            neighbours.append([None, None, outside])
+            alive.append(True)
+            neighbours[outside][neighbours[outside].index(triangle)] = new
+            by_first[u], by_second[v] = new, new
+            created.append(new)
+        for new in created:
+            u, v, _ = vertices[new]
+            neighbours[new][0] = by_first[v]
+            neighbours[new][1] = by_second[u]
+        for triangle in cavity:
+            alive[triangle] = False
+        used.add(point)
+        last = created[-1]
+
+    triangles = [triangle_vertices for triangle_vertices, live in zip(vertices, alive)
+                 if live and -1 not in triangle_vertices]
+    return np.array(triangles, dtype=np.int64).reshape(-1, 3)
+
+
+def to_triangles(points, triangles) -> "list[Triangle]":
+    """Convierte un arreglo de índices (N, 3) en instancias de Triangle.
+
+    - param points: lista de Point (que se reutilizan como vértices), PointArray o
+    arreglo (N, 2).
+    - param triangles: arreglo de índices devuelto por triangulate o delaunay.
+    """
+    if isinstance(points, Shape):
+        points = points.vertices
+    if isinstance(points, np.ndarray):
+        points = [Point(x, y) for x, y in np.asarray(points, dtype=np.float64)
+                  .reshape(-1, 2).tolist()]
+    return [Triangle(False, [points[a], points[b], points[c]])
+            for a, b, c in np.asarray(triangles).tolist()]
+
+
+def triangle_areas(points, triangles) -> "np.ndarray":
+    """Calcula de forma vectorizada el área con signo de cada triángulo (positiva en
+    sentido antihorario); su suma es el área del polígono triangulado.
+
+    - param points: Shape, PointArray, lista de Point o arreglo (N, 2).
+    - param triangles: arreglo de índices (M, 3).
+    """
+    xs, ys, _ = _as_coords(points)
+    x, y = np.asarray(xs), np.asarray(ys)
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    return ((x[b] - x[a]) * (y[c] - y[a]) - (y[b] - y[a]) * (x[c] - x[a])) / 2
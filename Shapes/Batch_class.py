@@ -0,0 +1,181 @@
+
+from math import isclose
+
+import numpy as np
+
+from Shapes.Rectangle_class import Rectangle
+from Shapes.Square_class import Square
+from Shapes.Triangles_class import Equilateral, Isosceles, Scalene, Triangle, Trirectangle
+
+# Triangle classification codes; RIGHT is combined with ISOSCELES or SCALENE
+INVALID = 0
+EQUILATERAL = 1
+ISOSCELES = 2
+SCALENE = 4
+RIGHT = 8
+
+REL_TOL = 1e-09
+
+
+def _columns(*columns) -> "list[np.ndarray]":
+    arrays = [np.ascontiguousarray(column, dtype=np.float64).reshape(-1)
+              for column in columns]
+    if any(array.shape != arrays[0].shape for array in arrays):
+        raise ValueError("All columns must have the same length.")
+    return arrays
+
+
+def _isclose(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    """Vectorized math.isclose with the default relative tolerance."""
+    return np.abs(a - b) <= REL_TOL * np.maximum(np.abs(a), np.abs(b))
+
+
+class RectangleBatch:
+    """Many rectangles stored as width and height columns.
+
+    Metrics are computed for every row at once; to_shapes exports the rows back to
+    Rectangle (or Square) instances.
+    """
+
+    def __init__(self, widths, heights):
+        self.widths, self.heights = _columns(widths, heights)
+
+    @classmethod
+    def from_shapes(cls, rectangles: "list[Rectangle]") -> "RectangleBatch":
+        """Build a batch from Rectangle or Square instances."""
+        return cls([shape.width for shape in rectangles],
+                   [shape.height for shape in rectangles])
+
+    def area(self) -> "np.ndarray":
+        """Calculate the area of every rectangle."""
+        return self.widths * self.heights
+
+    def perimeter(self) -> "np.ndarray":
+        """Calculate the perimeter of every rectangle."""
+        return 2 * (self.widths + self.heights)
+
+    def is_square(self) -> "np.ndarray":
+        """Boolean mask of the rows whose width equals their height."""
+        return self.widths == self.heights
+
+    def to_shapes(self) -> "list[Rectangle]":
+        """Export every row as a Square when width equals height, else a Rectangle."""
+        return [Square(width) if width == height else Rectangle(width, height)
+                for width, height in zip(self.widths.tolist(), self.heights.tolist())]
+
+    def __len__(self):
+        return self.widths.shape[0]
+
+    def __getitem__(self, index: int) -> "Rectangle":
+        width, height = float(self.widths[index]), float(self.heights[index])
+        return Square(width) if width == height else Rectangle(width, height)
+
+    def __str__(self):
+        return f"RectangleBatch({len(self)} rectangles)"
+
+
+class TriangleBatch:
+    """Many triangles stored as three side-length columns.
+
+    Area, perimeter, triangle inequality validation and classification are computed
+    for every row at once; to_shapes exports the rows back to the Triangle classes.
+    """
+
+    def __init__(self, side1, side2, side3):
+        self.side1, self.side2, self.side3 = _columns(side1, side2, side3)
+        self._sorted = None
+
+    @classmethod
+    def from_shapes(cls, triangles: "list[Triangle]") -> "TriangleBatch":
+        """Build a batch from Triangle instances (or any of its subclasses)."""
+        return cls([shape.side1 for shape in triangles],
+                   [shape.side2 for shape in triangles],
+                   [shape.side3 for shape in triangles])
+
+    def _sorted_sides(self) -> "tuple":
+        """Shortest, middle and longest side of every row (computed once)."""
+        if self._sorted is None:
+            low, high = np.minimum(self.side1, self.side2), np.maximum(self.side1, self.side2)
+            self._sorted = (np.minimum(low, self.side3),
+                            np.maximum(low, np.minimum(high, self.side3)),
+                            np.maximum(high, self.side3))
+        return self._sorted
+
+    def perimeter(self) -> "np.ndarray":
+        """Calculate the perimeter of every triangle."""
+        return self.side1 + self.side2 + self.side3
+
+    def area(self) -> "np.ndarray":
+        """Calculate the area of every triangle with Heron's formula.
+
+        Rows that are not valid triangles get NaN.
+        """
+        s = self.perimeter() / 2
+        product = s * (s - self.side1) * (s - self.side2) * (s - self.side3)
+        with np.errstate(invalid="ignore"):
+            return np.where(self.is_valid(), np.sqrt(product), np.nan)
+
+    def is_valid(self) -> "np.ndarray":
+        """Boolean mask of the rows with positive sides that satisfy the strict
+        triangle inequality."""
+        a, b, c = self._sorted_sides()
+        return (a > 0) & (a + b > c)
+
+    def validate(self):
+        """Raise ValueError if any row is not a valid triangle."""
+        invalid = np.flatnonzero(~self.is_valid())
+        if invalid.size:
+            raise ValueError(f"{invalid.size} rows are not valid triangles, "
+                             f"first at index {invalid[0]}.")
+
+    def classify(self) -> "np.ndarray":
+        """Classify every triangle.
+
+        Returns an array of codes: EQUILATERAL, ISOSCELES or SCALENE, with the RIGHT
+        bit added to right triangles, and INVALID for rows that are not triangles.
+        Sides are compared with math.isclose semantics.
+        """
+        a, b, c = self._sorted_sides()
+        equal_low, equal_high = _isclose(a, b), _isclose(b, c)
+        codes = np.where(equal_low & equal_high, EQUILATERAL,
+                         np.where(equal_low | equal_high, ISOSCELES, SCALENE))
+        codes = codes | np.where(_isclose(a * a + b * b, c * c), RIGHT, 0)
+        return np.where(self.is_valid(), codes, INVALID).astype(np.int8)
+
+    def _to_shape(self, code: int, side1: float, side2: float, side3: float) -> "Triangle":
+        a, b, c = sorted((side1, side2, side3))
+        if code == EQUILATERAL:
+            return Equilateral(side1)
+        if code & RIGHT:
+            return Trirectangle(a, b)
+        if code == ISOSCELES:
+            equal, base = (b, a) if isclose(b, c) else (a, c)
+            return Isosceles(equal, base)
+        if code == SCALENE:
+            return Scalene(side1, side2, side3)
+        return Triangle(side1, side2, side3)
+
+    def to_shapes(self, classify: bool = True) -> "list[Triangle]":
+        """Export every row as a per-object triangle.
+
+        With classify=True each row becomes Equilateral, Trirectangle, Isosceles or
+        Scalene according to classify(); invalid rows become plain Triangle objects.
+        With classify=False every row is a plain Triangle.
+        """
+        rows = zip(self.side1.tolist(), self.side2.tolist(), self.side3.tolist())
+        if not classify:
+            return [Triangle(*sides) for sides in rows]
+        return [self._to_shape(code, *sides)
+                for code, sides in zip(self.classify().tolist(), rows)]
+
+    def __len__(self):
+        return self.side1.shape[0]
+
+    def __getitem__(self, index: int) -> "Triangle":
+        sides = (float(self.side1[index]), float(self.side2[index]),
+                 float(self.side3[index]))
+        code = int(TriangleBatch(*([side] for side in sides)).classify()[0])
+        return self._to_shape(code, *sides)
+
+    def __str__(self):
+        return f"TriangleBatch({len(self)} triangles)"
@@ -2,10 +2,19 @@
 from Shapes.Point_class import Point
 
 class Line:
-    def __init__(self, start_point: tuple, end_point: tuple):
-        self.start = Point(start_point)
-        self.end = Point(end_point)
+    """Line segment between two points.
+
+    Endpoints may be given as Point instances, which are shared rather than copied,
+    or as (x, y) tuples.
+    """
+
+    __slots__ = ("start", "end", "length")
+
+    def __init__(self, start_point: "Point | tuple", end_point: "Point | tuple"):
+        self.start = start_point if isinstance(start_point, Point) else Point(start_point)
+        self.end = end_point if isinstance(end_point, Point) else Point(end_point)
         self.length = self.compute_length()
+
     def compute_length(self):
         return self.start.compute_distance(self.end)
 
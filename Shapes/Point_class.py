@@ -2,6 +2,8 @@
 class Point:
     """Class to represent a 2D point."""
 
+    __slots__ = ("x", "y")
+
     def __init__(self, coords: tuple):
         """Initialize the point with x and y coordinates."""
         self.x, self.y = coords
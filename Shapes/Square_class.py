@@ -1,4 +1,4 @@
-from Rectangle_class import Rectangle
+from Shapes.Rectangle_class import Rectangle
 
 class Square(Rectangle):
     """Square class, a special case of Rectangle."""
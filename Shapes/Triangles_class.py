@@ -1,4 +1,4 @@
-from Shape_class import Shape
+from Shapes.Shape_class import Shape
 
 class Triangle(Shape):
     """General Triangle class defined by the lengths of its three sides."""
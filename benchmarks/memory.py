@@ -0,0 +1,99 @@
+"""Mide con tracemalloc la memoria por punto, línea y polígono de ambos paquetes.
+
+Uso:
+    python benchmarks/memory.py                  # mide el árbol actual
+    python benchmarks/memory.py --baseline REV   # compara con una revisión de git
+
+Con --baseline se extraen All_shapes y Shapes de la revisión indicada en un
+directorio temporal y se miden en un proceso aparte, de modo que el "antes" y el
+"después" se obtienen con exactamente el mismo código de medición.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def bytes_per_object(factory, count: int) -> float:
+    """Devuelve los bytes asignados por objeto al crear count objetos con factory."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(index) for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def measure(count: int) -> dict:
+    """Mide los objetos de ambos paquetes con el código importable en sys.path."""
+    from All_shapes import geometry
+    from Shapes.Line_class import Line as TupleLine
+    from Shapes.Point_class import Point as TuplePoint
+
+    points = [geometry.Point(index, index) for index in range(count + 1)]
+
+    def polygon(index):
+        vertices = [geometry.Point(index + dx, dy)
+                    for dx, dy in ((0, 0), (3, 0), (4, 2), (2, 4), (0, 2))]
+        shape = geometry.Shape(False, vertices)
+        shape.compute_perimeter()
+        return shape
+
+    return {
+        "All_shapes.Point": bytes_per_object(lambda i: geometry.Point(i, i), count),
+        "All_shapes.Line": bytes_per_object(
+            lambda i: geometry.Line(points[i], points[i + 1]), count),
+        "All_shapes.Shape (5 vértices, con aristas)": bytes_per_object(
+            polygon, count // 10),
+        "Shapes.Point": bytes_per_object(lambda i: TuplePoint((i, i)), count),
+        "Shapes.Line": bytes_per_object(
+            lambda i: TupleLine((i, i), (i + 1, i)), count),
+    }
+
+
+def measure_revision(revision: str, count: int) -> dict:
+    """Mide los paquetes tal como estaban en una revisión de git."""
+    with tempfile.TemporaryDirectory() as directory:
+        archive = os.path.join(directory, "tree.tar")
+        subprocess.run(["git", "archive", "-o", archive, revision, "All_shapes", "Shapes"],
+                       cwd=ROOT, check=True)
+        with tarfile.open(archive) as tree:
+            tree.extractall(directory)
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--count", str(count), "--json",
+             "--tree", directory],
+            check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--baseline", help="revisión de git con la que comparar")
+    parser.add_argument("--json", action="store_true", help="imprime solo el JSON")
+    parser.add_argument("--tree", default=ROOT, help="directorio con los paquetes a medir")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.tree)
+    current = measure(args.count)
+    if args.json:
+        print(json.dumps(current))
+        return
+
+    baseline = measure_revision(args.baseline, args.count) if args.baseline else {}
+    print(f"{'objeto':45} {'antes':>10} {'después':>10}")
+    for name, value in current.items():
+        before = baseline.get(name)
+        before = f"{before:10.1f}" if before is not None else f"{'-':>10}"
+        print(f"{name:45} {before} {value:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Mide cómo escala parallel.evaluate de 1 a N procesos.
+
+Uso:
+    python benchmarks/parallel.py                       # 10^6 polígonos
+    python benchmarks/parallel.py --polygons 5000000 --workers 1 2 4 8 16
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from All_shapes.parallel import evaluate
+from All_shapes.shape_batch import ShapeBatch
+
+
+def random_batch(count: int, seed: int = 0) -> "ShapeBatch":
+    """Crea count polígonos aleatorios de 3 a 8 vértices."""
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(3, 9, count)
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return ShapeBatch(rng.random((offsets[-1], 2)) * 1000, offsets)
+
+
+def main():
+    cores = os.cpu_count()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polygons", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1))))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    batch = random_batch(args.polygons)
+    start = time.perf_counter()
+    expected = batch.compute_perimeter(), batch.compute_area()
+    serial = time.perf_counter() - start
+    print(f"{args.polygons} polígonos, {cores} núcleos")
+    print(f"{'procesos':>9} {'tiempo (s)':>11} {'aceleración':>12}")
+    print(f"{'serial':>9} {serial:>11.3f} {1:>11.2f}x")
+    for workers in args.workers:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = evaluate(batch, workers=workers)
+            best = min(best, time.perf_counter() - start)
+        assert np.allclose(results["perimeter"], expected[0])
+        assert np.allclose(results["area"], expected[1])
+        print(f"{workers:>9} {best:>11.3f} {serial / best:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
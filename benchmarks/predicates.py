@@ -0,0 +1,128 @@
+"""Mide qué fracción de las evaluaciones de los predicados robustos se resuelve con
+el filtro de punto flotante y el costo frente a la aritmética exacta.
+
+Uso:
+    python benchmarks/predicates.py                    # 10^5 casos por conjunto
+    python benchmarks/predicates.py --count 1000000
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from All_shapes import predicates
+
+
+def uniform_cases(count: int, rng: "random.Random") -> "list[tuple]":
+    """Tres puntos al azar en [-1000, 1000]²: el caso típico."""
+    return [tuple(rng.uniform(-1000, 1000) for _ in range(6)) for _ in range(count)]
+
+
+def grid_cases(count: int, rng: "random.Random") -> "list[tuple]":
+    """Puntos en una malla entera pequeña: muchos colineales exactos."""
+    return [tuple(float(rng.randint(0, 4)) for _ in range(6)) for _ in range(count)]
+
+
+def near_collinear_cases(count: int, rng: "random.Random") -> "list[tuple]":
+    """El tercer punto está sobre el segmento, desplazado a lo sumo un ulp: el peor
+    caso para el filtro."""
+    cases = []
+    for _ in range(count):
+        ax, ay = rng.uniform(-1000, 1000), rng.uniform(-1000, 1000)
+        bx, by = ax + rng.uniform(-10, 10), ay + rng.uniform(-10, 10)
+        t = rng.random()
+        cx, cy = ax + t * (bx - ax), ay + t * (by - ay)
+        cx += rng.choice((-1, 0, 1)) * math.ulp(cx)
+        cases.append((ax, ay, bx, by, cx, cy))
+    return cases
+
+
+def cocircular_cases(count: int, rng: "random.Random") -> "list[tuple]":
+    """Cuatro esquinas de rectángulos enteros (exactamente concíclicas) y cuatro
+    puntos de malla al azar, en partes iguales."""
+    cases = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            x, y = float(rng.randint(-500, 500)), float(rng.randint(-500, 500))
+            w, h = float(rng.randint(1, 50)), float(rng.randint(1, 50))
+            cases.append((x, y, x + w, y, x + w, y + h, x, y + h))
+        else:
+            cases.append(tuple(float(rng.randint(0, 20)) for _ in range(8)))
+    return cases
+
+
+def exact_orient2d(ax, ay, bx, by, cx, cy) -> int:
+    """orient2d calculado siempre con Fraction, como referencia."""
+    ax, ay, bx, by, cx, cy = map(Fraction, (ax, ay, bx, by, cx, cy))
+    determinant = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    return (determinant > 0) - (determinant < 0)
+
+
+def exact_incircle(ax, ay, bx, by, cx, cy, dx, dy) -> int:
+    """incircle calculado siempre con Fraction, como referencia."""
+    ax, ay, bx, by, cx, cy, dx, dy = map(Fraction, (ax, ay, bx, by, cx, cy, dx, dy))
+    adx, ady, bdx, bdy, cdx, cdy = ax - dx, ay - dy, bx - dx, by - dy, cx - dx, cy - dy
+    determinant = ((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy) +
+                   (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy) +
+                   (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
+    return (determinant > 0) - (determinant < 0)
+
+
+def measure(name: str, cases: "list[tuple]", predicate, reference, vectorized):
+    """Imprime una fila de la tabla y comprueba que los tres caminos coinciden."""
+    predicates.reset_counters()
+    start = time.perf_counter()
+    signs = [predicate(*case) for case in cases]
+    filtered = (time.perf_counter() - start) / len(cases)
+    fast = 1 - predicates.counters["exact"] / len(cases)
+
+    sample = cases[:max(1, len(cases) // 10)]
+    start = time.perf_counter()
+    expected = [reference(*case) for case in sample]
+    exact = (time.perf_counter() - start) / len(sample)
+    assert signs[:len(sample)] == expected
+
+    coords = np.array(cases)
+    start = time.perf_counter()
+    columns = [coords[:, column:column + 2] for column in range(0, coords.shape[1], 2)]
+    batch = vectorized(*columns)
+    vector = (time.perf_counter() - start) / len(cases)
+    assert batch.tolist() == signs
+
+    print(f"{name:>24} {fast:>13.4%} {filtered * 1e6:>12.3f} "
+          f"{exact * 1e6:>12.3f} {vector * 1e6:>12.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'conjunto':>24} {'camino rápido':>14} {'filtro (µs)':>12} "
+          f"{'exacto (µs)':>12} {'vector (µs)':>12}")
+    for name, generate in (("orient2d uniforme", uniform_cases),
+                           ("orient2d malla entera", grid_cases),
+                           ("orient2d casi colineal", near_collinear_cases)):
+        measure(name, generate(args.count, rng), predicates.orient2d, exact_orient2d,
+                predicates.orient2d_array)
+    for name, generate in (("incircle uniforme", uniform_cases),
+                           ("incircle concíclico", cocircular_cases)):
+        cases = generate(args.count, rng)
+        if len(cases[0]) == 6:
+            cases = [case + (rng.uniform(-1000, 1000), rng.uniform(-1000, 1000))
+                     for case in cases]
+        measure(name, cases, predicates.incircle, exact_incircle,
+                predicates.incircle_array)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Generador de carga para All_shapes.service: latencia p50/p99 y peticiones/s.
+
+Levanta el servicio en el mismo proceso y abre varias conexiones concurrentes, cada
+una con un número fijo de peticiones en vuelo.
+
+Uso:
+    python benchmarks/service.py
+    python benchmarks/service.py --clients 64 --requests 200000 --window 0.001 0.005
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from All_shapes.service import GeometryService
+
+
+def random_request(request_id: int, rng: "random.Random") -> dict:
+    """Crea una petición pequeña de una operación al azar."""
+    op = rng.choice(("distance", "perimeter", "area", "inner_angles", "classify"))
+    count = {"distance": 2, "classify": 3}.get(op, rng.randint(3, 6))
+    vertices = [[rng.uniform(0, 10), rng.uniform(0, 10)] for _ in range(count)]
+    return {"id": request_id, "op": op, "vertices": vertices}
+
+
+async def client(port: int, requests: list, in_flight: int, latencies: list):
+    """Envía las peticiones manteniendo in_flight pendientes a la vez."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    sent = {}
+    pending = iter(requests)
+
+    def send(count):
+        for request in itertools.islice(pending, count):
+            sent[request["id"]] = time.perf_counter()
+            writer.write(json.dumps(request).encode() + b"\n")
+
+    send(in_flight)
+    while sent:
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - sent.pop(response["id"]))
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        send(1)
+    writer.close()
+
+
+async def run(window: float, clients: int, total: int, in_flight: int) -> tuple:
+    service = GeometryService(window=window)
+    server = await service.start(port=0)
+    port = server.sockets[0].getsockname()[1]
+    rng = random.Random(0)
+    requests = [random_request(index, rng) for index in range(total)]
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, requests[index::clients], in_flight, latencies)
+                           for index in range(clients)))
+    elapsed = time.perf_counter() - start
+    await service.close()
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+    return p50, p99, total / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--in-flight", type=int, default=4)
+    parser.add_argument("--window", type=float, nargs="+", default=[0.0, 0.001, 0.005])
+    args = parser.parse_args()
+
+    print(f"{'ventana (ms)':>12} {'p50 (ms)':>9} {'p99 (ms)':>9} {'peticiones/s':>13}")
+    for window in args.window:
+        p50, p99, rate = asyncio.run(run(window, args.clients, args.requests,
+                                         args.in_flight))
+        print(f"{window * 1e3:>12.1f} {p50:>9.2f} {p99:>9.2f} {rate:>13,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Compara la latencia de consulta del ShapeIndex contra un recorrido lineal.
+
+Uso:
+    python benchmarks/spatial.py                       # 10^4 y 10^5 figuras
+    python benchmarks/spatial.py --sizes 10000 1000000 --queries 200
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from All_shapes.geometry import Point, Shape
+from All_shapes.spatial import ShapeIndex
+
+
+def random_shapes(count: int, world: float, rng: "random.Random") -> "list[Shape]":
+    """Crea figuras pequeñas de 3 a 6 vértices repartidas en el mundo."""
+    shapes = []
+    for _ in range(count):
+        x, y = rng.uniform(0, world), rng.uniform(0, world)
+        vertices = [Point(x + rng.uniform(0, 2), y + rng.uniform(0, 2))
+                    for _ in range(rng.randint(3, 6))]
+        shapes.append(Shape(False, vertices))
+    return shapes
+
+
+def linear_scan(shapes: "list[Shape]", window: "tuple") -> "list[Shape]":
+    """Recorre los vértices de todas las figuras, como se hacía sin índice."""
+    min_x, min_y, max_x, max_y = window
+    found = []
+    for shape in shapes:
+        xs = [point._x for point in shape.vertices]
+        ys = [point._y for point in shape.vertices]
+        if min(xs) <= max_x and min_x <= max(xs) and min(ys) <= max_y and min_y <= max(ys):
+            found.append(shape)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'figuras':>9} {'carga (s)':>10} {'índice (ms)':>12} "
+          f"{'lineal (ms)':>12} {'aceleración':>12}")
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        world = size ** 0.5 * 4
+        shapes = random_shapes(size, world, rng)
+        windows = []
+        for _ in range(args.queries):
+            x, y = rng.uniform(0, world), rng.uniform(0, world)
+            windows.append((x, y, x + 10, y + 10))
+
+        start = time.perf_counter()
+        index = ShapeIndex(shapes)
+        load = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = [index.query(*window) for window in windows]
+        index_time = (time.perf_counter() - start) / len(windows)
+
+        scanned_windows = windows[:max(1, args.queries // 10)]
+        start = time.perf_counter()
+        scanned = [linear_scan(shapes, window) for window in scanned_windows]
+        scan_time = (time.perf_counter() - start) / len(scanned_windows)
+
+        for got, expected in zip(indexed, scanned):
+            assert {id(shape) for shape in got} == {id(shape) for shape in expected}
+        print(f"{size:>9} {load:>10.2f} {index_time * 1e3:>12.3f} "
+              f"{scan_time * 1e3:>12.3f} {scan_time / index_time:>11.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Mide el costo de importar All_shapes.geometry en frío (python -X importtime).
+
+Uso:
+    python benchmarks/startup.py                  # mide el árbol actual
+    python benchmarks/startup.py --baseline REV   # compara con una revisión de git
+    python benchmarks/startup.py --baseline REV --max-slowdown 5
+
+Falla si importar geometry carga NumPy o, con --baseline, si la importación es más
+de --max-slowdown por ciento más lenta que en la revisión indicada.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE = "All_shapes.geometry"
+PROBE = f"import sys, {MODULE}; print('numpy' in sys.modules)"
+
+
+def measure(tree: str, runs: int) -> dict:
+    """Importa el módulo runs veces en procesos nuevos y devuelve el menor tiempo
+    acumulado de importación, el menor tiempo de pared y si se cargó NumPy."""
+    environment = {**os.environ, "PYTHONPATH": tree}
+    import_us, wall, loads_numpy = [], [], False
+    # La primera ejecución solo genera los .pyc, como ocurre al instalar el paquete
+    subprocess.run([sys.executable, "-c", PROBE], env=environment, cwd=tree,
+                   capture_output=True, check=True)
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE],
+                                 env=environment, cwd=tree, capture_output=True,
+                                 text=True, check=True)
+        wall.append(time.perf_counter() - start)
+        loads_numpy = process.stdout.strip() == "True"
+        for line in process.stderr.splitlines():
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[2] == MODULE:
+                import_us.append(int(fields[1]))
+    return {"import_ms": min(import_us) / 1e3, "wall_ms": min(wall) * 1e3,
+            "numpy": loads_numpy}
+
+
+def extract(revision: str, directory: str) -> str:
+    """Extrae All_shapes de una revisión de git en directory."""
+    archive = os.path.join(directory, "tree.tar")
+    subprocess.run(["git", "archive", "-o", archive, revision, "All_shapes"],
+                   cwd=ROOT, check=True)
+    with tarfile.open(archive) as tree:
+        tree.extractall(directory)
+    return directory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--baseline", help="revisión de git con la que comparar")
+    parser.add_argument("--max-slowdown", type=float, default=10.0,
+                        help="aumento máximo admitido del tiempo de importación "
+                             "respecto de --baseline, en por ciento (10 por omisión)")
+    args = parser.parse_args()
+
+    rows = {"actual": measure(ROOT, args.runs)}
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as directory:
+            rows[args.baseline] = measure(extract(args.baseline, directory), args.runs)
+    with tempfile.TemporaryDirectory() as directory:
+        rows["python -c pass"] = measure_bare(directory, args.runs)
+
+    print(f"{'árbol':20} {'import (ms)':>12} {'proceso (ms)':>13} {'carga numpy':>12}")
+    for name, row in rows.items():
+        import_ms = f"{row['import_ms']:12.2f}" if row["import_ms"] is not None else f"{'-':>12}"
+        print(f"{name:20} {import_ms} {row['wall_ms']:13.2f} {str(row['numpy']):>12}")
+    if rows["actual"]["numpy"]:
+        sys.exit("Importar geometry cargó NumPy.")
+    if args.baseline:
+        slowdown = rows["actual"]["import_ms"] / rows[args.baseline]["import_ms"] - 1
+        if slowdown * 100 > args.max_slowdown:
+            sys.exit(f"Importar geometry es {slowdown:.1%} más lento que en "
+                     f"{args.baseline} (máximo {args.max_slowdown:g}%).")
+
+
+def measure_bare(directory: str, runs: int) -> dict:
+    """Tiempo de pared de un intérprete que no importa nada, como referencia."""
+    wall = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], cwd=directory, check=True)
+        wall.append(time.perf_counter() - start)
+    return {"import_ms": None, "wall_ms": min(wall) * 1e3, "numpy": False}
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Mide el rendimiento y el pico de memoria de la lectura en flujo de figuras.
+
+Uso:
+    python benchmarks/stream.py                          # 10^4 y 10^5 figuras
+    python benchmarks/stream.py --sizes 100000 1000000 --format csv
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from All_shapes.stream import Pipeline, read_batches, read_shapes
+
+
+def write_dataset(path: str, count: int, fmt: str, seed: int = 0):
+    """Escribe count rectángulos y polígonos aleatorios en el formato indicado."""
+    rng = random.Random(seed)
+    with open(path, "w") as output:
+        for index in range(count):
+            x, y = rng.uniform(0, 1000), rng.uniform(0, 1000)
+            if index % 2:
+                name = "Rectangle"
+                vertices = [(x, y), (x + 4, y), (x + 4, y + 2), (x, y + 2)]
+            else:
+                name = "Shape"
+                vertices = [(x + rng.uniform(0, 5), y + rng.uniform(0, 5))
+                            for _ in range(rng.randint(3, 8))]
+            if fmt == "csv":
+                output.write(",".join([name] + [f"{value}" for vertex in vertices
+                                                for value in vertex]) + "\n")
+            else:
+                output.write(f'{{"type": "{name}", "vertices": {vertices}}}\n'
+                             .replace("(", "[").replace(")", "]"))
+
+
+def measure(build) -> tuple:
+    """Consume dos veces la tubería creada por build: una sin trazar la memoria para
+    obtener el rendimiento y otra con tracemalloc para obtener el pico de memoria.
+    Devuelve (pico de memoria en bytes, reporte)."""
+    pipeline = build()
+    pipeline.run()
+    tracemalloc.start()
+    build().run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, str(pipeline)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="jsonl")
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            path = os.path.join(directory, f"shapes.{args.format}")
+            write_dataset(path, size, args.format)
+
+            objects = lambda: (Pipeline(read_shapes(path))
+                               .map(lambda shape: (shape.perimeter, shape.area))
+                               .filter(lambda metrics: metrics[1] > 1))
+            peak, report = measure(objects)
+            print(f"objetos  n={size:>9}  pico={peak / 2**20:7.2f} MiB  {report}")
+
+            batches = lambda: (Pipeline(read_batches(path, chunk_size=args.chunk_size))
+                               .map(lambda batch: (batch.compute_perimeter(),
+                                                   batch.compute_area())))
+            peak, report = measure(batches)
+            print(f"lotes    n={size:>9}  pico={peak / 2**20:7.2f} MiB  {report}")
+
+
+if __name__ == "__main__":
+    main()
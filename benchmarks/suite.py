@@ -0,0 +1,208 @@
+"""Banco de pruebas de rendimiento de los caminos críticos de ambos paquetes.
+
+Uso:
+    python benchmarks/suite.py run -o resultados.json
+    python benchmarks/suite.py run --only Point -o resultados.json
+    python benchmarks/suite.py compare base.json nuevo.json --threshold 0.10
+
+compare termina con código 1 si algún caso es más lento que la base por encima del
+umbral, para poder usarlo en integración continua.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import All_shapes.geometry as geometry
+from Shapes.Rectangle_class import Rectangle as SideRectangle
+from Shapes.Square_class import Square as SideSquare
+from Shapes.Triangles_class import Triangle as SideTriangle, Equilateral as SideEquilateral
+
+# Tamaños por defecto: número de operaciones por repetición o número de vértices
+SIZES = (100, 1_000, 10_000)
+VERTEX_COUNTS = (4, 64, 1_024)
+
+CASES = {}
+
+
+def case(name: str, sizes: tuple = SIZES):
+    """Registra una función que prepara un caso; recibe el tamaño y devuelve
+    (función sin argumentos a medir, número de operaciones que realiza)."""
+    def register(setup):
+        CASES[name] = (setup, sizes)
+        return setup
+    return register
+
+
+def _regular_polygon(count: int, radius: float = 10.0) -> "list":
+    from math import cos, sin, tau
+    return [(radius * cos(tau * index / count), radius * sin(tau * index / count))
+            for index in range(count)]
+
+
+def _points(coords) -> "list[geometry.Point]":
+    return [geometry.Point(x, y) for x, y in coords]
+
+
+@case("Point.compute_distance")
+def _distance(size):
+    points = _points((index, index * 0.5) for index in range(size + 1))
+    pairs = list(zip(points, points[1:]))
+    return lambda: [first.compute_distance(second) for first, second in pairs], size
+
+
+@case("Shape.__init__+edges+inner_angles", VERTEX_COUNTS)
+def _shape_init(size):
+    vertices = _points(_regular_polygon(size))
+
+    def build():
+        shape = geometry.Shape(False, vertices)
+        shape.edges
+        shape.inner_angles
+    return build, 1
+
+
+@case("Shape.compute_perimeter", VERTEX_COUNTS)
+def _shape_perimeter(size):
+    vertices = _points(_regular_polygon(size))
+    return lambda: geometry.Shape(False, vertices).compute_perimeter(), 1
+
+
+@case("Triangle.compute_area")
+def _triangle_area(size):
+    triangles = [geometry.Triangle(False, _points([(0, 0), (3 + index, 0), (0, 4)]))
+                 for index in range(size)]
+    for triangle in triangles:
+        triangle.edges
+    return lambda: [triangle.compute_area() for triangle in triangles], size
+
+
+@case("Triangle.compute_inner_angles")
+def _triangle_angles(size):
+    triangles = [geometry.Triangle(False, _points([(0, 0), (3 + index, 0), (0, 4)]))
+                 for index in range(size)]
+    for triangle in triangles:
+        triangle.edges
+    return lambda: [triangle.compute_inner_angles() for triangle in triangles], size
+
+
+@case("Square.__init__ (validación)")
+def _square(size):
+    coords = [(0, 0), (0, 3), (3, 3), (3, 0)]
+    return lambda: [geometry.Square(True, _points(coords)) for _ in range(size)], size
+
+
+@case("Equilateral.__init__ (validación)")
+def _equilateral(size):
+    coords = [(0, 0), (3, 0), (1.5, 3 * 3**0.5 / 2)]
+    return lambda: [geometry.Equilateral(True, _points(coords)) for _ in range(size)], size
+
+
+@case("Equilateral.__init__ (rechazo)")
+def _equilateral_rejected(size):
+    coords = [(0, 0), (3, 0), (1.5, 2)]
+
+    def build():
+        for _ in range(size):
+            try:
+                geometry.Equilateral(True, _points(coords))
+            except ValueError:
+                pass
+    return build, size
+
+
+@case("Shapes.Rectangle/Square area+perimeter")
+def _side_rectangles(size):
+    shapes = [SideRectangle(index + 1, index + 2) for index in range(size // 2)]
+    shapes += [SideSquare(index + 1) for index in range(size - size // 2)]
+    return lambda: [(shape.area(), shape.perimeter()) for shape in shapes], size
+
+
+@case("Shapes.Triangle area+perimeter")
+def _side_triangles(size):
+    shapes = [SideTriangle(3 + index, 4 + index, 5 + index) for index in range(size // 2)]
+    shapes += [SideEquilateral(index + 1) for index in range(size - size // 2)]
+    return lambda: [(shape.area(), shape.perimeter()) for shape in shapes], size
+
+
+def run(only: str = None, repeat: int = 5, min_time: float = 0.05) -> dict:
+    """Ejecuta los casos y devuelve los resultados por "nombre[tamaño]".
+
+    Cada caso se repite hasta sumar al menos min_time segundos por repetición y se
+    guarda el mejor tiempo por operación de repeat repeticiones.
+    """
+    results = {}
+    for name, (setup, sizes) in CASES.items():
+        if only and only not in name:
+            continue
+        for size in sizes:
+            function, operations = setup(size)
+            timer = timeit.Timer(function)
+            number, _ = timer.autorange()
+            number = max(1, int(number * min_time / 0.2))
+            best = min(timer.repeat(repeat=repeat, number=number)) / number
+            key = f"{name}[{size}]"
+            results[key] = {"seconds": best, "per_op_ns": best / operations * 1e9}
+            print(f"{key:55} {results[key]['per_op_ns']:>14,.1f} ns/op")
+    return results
+
+
+def compare(base: dict, new: dict, threshold: float) -> list:
+    """Compara dos ejecuciones y devuelve los casos más lentos que el umbral."""
+    regressions = []
+    print(f"{'caso':55} {'base ns/op':>14} {'nuevo ns/op':>14} {'cambio':>8}")
+    for key in sorted(set(base) & set(new)):
+        old, current = base[key]["per_op_ns"], new[key]["per_op_ns"]
+        change = current / old - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(key)
+            flag = "  <- más lento"
+        print(f"{key:55} {old:>14,.1f} {current:>14,.1f} {change:>+8.1%}{flag}")
+    for key in sorted(set(base) ^ set(new)):
+        print(f"{key:55} solo está en {'la base' if key in base else 'la nueva'}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="ejecuta el banco de pruebas")
+    run_parser.add_argument("-o", "--output", help="archivo JSON de resultados")
+    run_parser.add_argument("--only", help="ejecuta solo los casos que contengan el texto")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    compare_parser = commands.add_parser("compare", help="compara dos resultados")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="fracción de lentitud tolerada (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run(args.only, args.repeat)
+        if args.output:
+            report = {
+                "meta": {"python": sys.version, "platform": platform.platform(),
+                         "date": datetime.now(timezone.utc).isoformat(),
+                         "timer": time.get_clock_info("perf_counter").implementation},
+                "results": results,
+            }
+            with open(args.output, "w") as output:
+                json.dump(report, output, indent=2)
+    else:
+        with open(args.base) as base, open(args.new) as new:
+            regressions = compare(json.load(base)["results"], json.load(new)["results"],
+                                  args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} caso(s) más lentos que el umbral.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
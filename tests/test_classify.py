@@ -0,0 +1,62 @@
+"""classify_triangles debe aceptar exactamente los triángulos que aceptan los
+constructores de las subclases de Triangle."""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from All_shapes.classify import (EQUILATERAL, ISOSCELES, RIGHT, SCALENE,
+                                 classify_triangles)
+from All_shapes.geometry import Equilateral, Isosceles, Point, Scalene, Trirectangle
+
+CLASSES = ((EQUILATERAL, Equilateral, True), (ISOSCELES, Isosceles, False),
+           (SCALENE, Scalene, False), (RIGHT, Trirectangle, False))
+
+
+def _accepts(cls, is_regular: bool, vertices: list) -> bool:
+    try:
+        cls(is_regular, [Point(x, y) for x, y in vertices])
+    except (ValueError, ZeroDivisionError):
+        return False
+    return True
+
+
+def _right_triangles(rng: "random.Random", count: int) -> list:
+    """Triángulos rectángulos de coordenadas enteras con catetos en cualquier
+    dirección."""
+    triangles = []
+    while len(triangles) < count:
+        x, y = rng.randint(-50, 50), rng.randint(-50, 50)
+        dx, dy = rng.randint(-50, 50), rng.randint(-50, 50)
+        scale = rng.randint(1, 3)
+        if dx or dy:
+            triangles.append([(x, y), (x + dx, y + dy), (x - scale * dy, y + scale * dx)])
+    return triangles
+
+
+def test_regression_right_angle_rejected_by_float_window():
+    codes = classify_triangles([[(-16, 42), (-37, 67), (-41, 21)]])
+    assert codes[0] & RIGHT
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_codes_match_constructors(seed):
+    rng = random.Random(seed)
+    triangles = _right_triangles(rng, 300)
+    triangles += [[(rng.randint(-20, 20), rng.randint(-20, 20)) for _ in range(3)]
+                  for _ in range(300)]
+    # Equiláteros con vértices no enteros, cuyos lados redondeados pueden diferir
+    for _ in range(100):
+        x, y, side = rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(0.1, 10)
+        triangles.append([(x, y), (x + side, y), (x + side / 2, y + side * 3**0.5 / 2)])
+    triangles.append([(0.0, 0.0), (2.0, 0.0), (1.0, 3**0.5)])
+
+    codes = classify_triangles(np.array(triangles, dtype=np.float64)).tolist()
+    for vertices, code in zip(triangles, codes):
+        for flag, cls, is_regular in CLASSES:
+            assert bool(code & flag) == _accepts(cls, is_regular, vertices), \
+                (vertices, code, cls.__name__)
@@ -0,0 +1,61 @@
+"""El barrido debe reportar exactamente las parejas que Line.compute_cross
+considera cruzadas, también cuando un segmento pasa muy cerca de otro sin tocarlo."""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from All_shapes.geometry import Line, Point, Shape
+from All_shapes.predicates import orient2d
+from All_shapes.sweep import intersections, is_self_intersecting
+
+
+def _line(x1, y1, x2, y2) -> "Line":
+    return Line(Point(x1, y1), Point(x2, y2))
+
+
+@pytest.mark.parametrize("first, second", [
+    (_line(0, 0, 10, 0), _line(5, 1e-10, 6, 1)),
+    (_line(0, 0, 1e6, 0), _line(5e5, 5e-4, 6e5, 1)),
+])
+def test_regression_near_miss_not_reported(first, second):
+    assert not first.compute_cross(second)
+    assert intersections([first, second]) == []
+
+
+def test_regression_near_miss_polygon_is_simple():
+    vertices = [(0, 0), (1e6, 0), (1e6, 1e6), (5e5, 1e-4), (0, 1e6)]
+    assert not is_self_intersecting(Shape(False, [Point(x, y) for x, y in vertices]))
+
+
+def test_crossing_and_touching_reported():
+    found = intersections([_line(0, 0, 2, 2), _line(0, 2, 2, 0)])
+    assert [point.point_getter() for _, _, point in found] == [(1.0, 1.0)]
+    found = intersections([_line(0, 0, 2, 0), _line(1, 0, 1, 1)])
+    assert [point.point_getter() for _, _, point in found] == [(1.0, 0.0)]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_pairs_match_compute_cross(seed):
+    rng = random.Random(seed)
+    for _ in range(50):
+        coordinate = rng.choice((rng.random, lambda: float(rng.randint(0, 5)),
+                                 lambda: rng.randint(0, 4) * 0.1))
+        lines = [_line(coordinate(), coordinate(), coordinate(), coordinate())
+                 for _ in range(rng.randint(2, 25))]
+        found = {frozenset((id(first), id(second)))
+                 for first, second, _ in intersections(lines)}
+        for i, first in enumerate(lines):
+            for second in lines[i + 1:]:
+                ends = [point.point_getter()
+                        for point in (first.start, first.end, second.start, second.end)]
+                # Los segmentos degenerados y colineales quedan fuera de compute_cross
+                if (ends[0] == ends[1] or ends[2] == ends[3] or
+                        orient2d(*ends[0], *ends[1], *ends[2]) ==
+                        orient2d(*ends[0], *ends[1], *ends[3]) == 0):
+                    continue
+                assert (frozenset((id(first), id(second))) in found) == \
+                    bool(first.compute_cross(second)), ends